@@ -0,0 +1,65 @@
+"""Startup time of ``pytest --collect-only``: imports, config resolution and collection, no browser.
+
+Run from the repo root::
+
+    python -m dev.benchmarks.collect_only [runs] [pytest args...]
+
+Each run is a fresh process without the config snapshot of a previous run, like a new CI job. The slowest imports
+of the last run are listed, to spot the heavy modules loaded at collection. The plugins installed with the
+dependencies are loaded too (e.g. the one of ``faker``), compare with ``-p no:<plugin>``.
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+from src.constants import CONFIG_SNAPSHOT_ENV_VAR
+
+DEFAULT_RUNS = 5
+SLOWEST_IMPORTS = 10
+IMPORT_TIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def collect_only(env: dict[str, str], pytest_args: list[str]) -> tuple[float, str]:
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"]
+        + pytest_args,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - start, completed.stderr
+
+
+def slowest_top_level_imports(import_times: str) -> list[tuple[str, int]]:
+    imports = []
+    for line in import_times.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+        # Only the modules imported directly, their own imports are included in their cumulative time
+        if match and len(match.group(2)) == 1:
+            imports.append((match.group(3), int(match.group(1))))
+    return sorted(imports, key=lambda module_import: module_import[1], reverse=True)[:SLOWEST_IMPORTS]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS
+    pytest_args = sys.argv[2:]
+    env = {name: value for name, value in os.environ.items() if name != CONFIG_SNAPSHOT_ENV_VAR}
+    durations = []
+    import_times = ""
+    for _ in range(runs):
+        duration, import_times = collect_only(env, pytest_args)
+        durations.append(duration)
+    print(f"pytest --collect-only, {runs} runs: median {statistics.median(durations):.3f} s, "
+          f"min {min(durations):.3f} s, max {max(durations):.3f} s")
+    print(f"{'slowest imports':<50}{'cumulative (ms)':>16}")
+    for module, cumulative_us in slowest_top_level_imports(import_times):
+        print(f"{module:<50}{cumulative_us / 1000:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Payload of the ``execute_script`` requests of the JavaScript helpers, with and without pinning.
+
+Run from the repo root::
+
+    python -m dev.benchmarks.script_payload
+
+The numbers are the sizes of the JSON bodies sent to the driver, so no browser is needed.
+"""
+import json
+
+from src.selenium_facade.script_registry import SCRIPT_REGISTRY
+
+# Element references are serialized by Selenium like this
+ELEMENT = {"element-6066-11e4-a52e-4f735466cecf": "f.5F3B1B1E0A4C0D8E.d.1"}
+
+# Typical arguments of each helper
+HELPER_ARGS: dict[str, list] = {
+    "activity_tracker": [],
+    "wait_for_idle": ["network", 500, 20000],
+    "wait_for_locator": ["present", "xpath", "//button[@id='login_submit']", None, None, 20000],
+    "snapshot": ["css selector", "table tr", None, ["class"], ["value"]],
+    "snapshot_table": ["xpath", "//table", None],
+    "drag_and_drop": [ELEMENT, ELEMENT, 0, 0],
+    "dismiss_all": ["xpath", "//*[contains(@data-testid, 'toast')]", None],
+    "count_matches": [[["class name", "kc-feedback-text"], ["xpath", "//*[@data-testid='toast-error']"]], None],
+    "click": [ELEMENT],
+    "scroll_to": [0, None],
+}
+
+
+def request_size(script: str, args: list) -> int:
+    return len(json.dumps({"script": script, "args": args}))
+
+
+def main():
+    print(f"{'helper':<18}{'full (B)':>10}{'pinned (B)':>12}{'saved':>8}")
+    full_total = pinned_total = 0
+    for name, args in HELPER_ARGS.items():
+        full = request_size(SCRIPT_REGISTRY.source(name), args)
+        # The registry sends the source of tiny helpers, they are cheaper than the stub
+        pinned = min(full, request_size(SCRIPT_REGISTRY.stub(name), args))
+        full_total += full
+        pinned_total += pinned
+        print(f"{name:<18}{full:>10}{pinned:>12}{1 - pinned / full:>8.0%}")
+    print(f"{'total':<18}{full_total:>10}{pinned_total:>12}{1 - pinned_total / full_total:>8.0%}")
+    print(f"One-off pinning payload per session: {len(json.dumps({'source': SCRIPT_REGISTRY.definitions}))} B")
+
+
+if __name__ == "__main__":
+    main()
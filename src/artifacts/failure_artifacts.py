@@ -0,0 +1,148 @@
+"""Artifacts of failed tests: screenshot, DOM, browser console logs and URL.
+
+Collecting them talks to the browser, so it is bounded by a total time budget - a hung browser cannot stall the
+teardown. The collected bytes are kept in memory and handed to :class:`ArtifactWriter`, which compresses and writes
+them to disk in a background thread while the next test runs.
+"""
+import gzip
+import json
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+from selenium.webdriver import Remote
+
+from src.constants import FAILURE_ARTIFACTS_TIMEOUT_S
+from src.logger import logger
+
+# One round trip for both, instead of ``current_url`` and ``page_source``
+URL_AND_DOM_JS = "return [window.location.href, document.documentElement.outerHTML];"
+# ``browserName`` of the browsers which expose the console logs through WebDriver, the Chromium ones
+CONSOLE_LOGS_BROWSERS = {"chrome", "chromium", "msedge", "MicrosoftEdge"}
+
+
+class FailureArtifacts(BaseModel):
+    """What was collected from the browser, ``None`` for the artifacts which could not be collected in time."""
+
+    url: Optional[str] = None
+    screenshot_png: Optional[bytes] = None
+    page_source: Optional[str] = None
+    console_logs: Optional[list[dict[str, Any]]] = None
+    errors: dict[str, str] = {}
+    collection_time_s: float = 0
+
+
+def _collect_url_and_dom(driver: Remote, artifacts: FailureArtifacts):
+    artifacts.url, artifacts.page_source = driver.execute_script(URL_AND_DOM_JS)
+
+
+def _collect_screenshot(driver: Remote, artifacts: FailureArtifacts):
+    artifacts.screenshot_png = driver.get_screenshot_as_png()
+
+
+def _collect_console_logs(driver: Remote, artifacts: FailureArtifacts):
+    # ``get_log`` exists on every driver, but fails on the other browsers
+    if driver.name not in CONSOLE_LOGS_BROWSERS:
+        return
+    artifacts.console_logs = driver.get_log("browser")
+
+
+# In the order of usefulness, the first ones are collected even when the budget is tight
+COLLECTORS: dict[str, Callable[[Remote, FailureArtifacts], None]] = {
+    "screenshot": _collect_screenshot,
+    "url_and_dom": _collect_url_and_dom,
+    "console_logs": _collect_console_logs,
+}
+
+
+def collect_failure_artifacts(driver: Remote, timeout_s: float = FAILURE_ARTIFACTS_TIMEOUT_S) -> FailureArtifacts:
+    """Collect the artifacts of a failed test from the browser, giving up on the rest after ``timeout_s``.
+
+    Args:
+        driver: driver of the failed test.
+        timeout_s: total time budget of the collection.
+    """
+    start = time.perf_counter()
+    artifacts = FailureArtifacts()
+    stop = threading.Event()
+
+    def collect():
+        for name, collector in COLLECTORS.items():
+            if stop.is_set():
+                return
+            try:
+                collector(driver, artifacts)
+            except Exception as e:
+                # Not only ``WebDriverException``: with a dead session the HTTP connection errors of urllib3 come up,
+                # and nothing may escape the teardown of the ``driver`` fixture
+                artifacts.errors[name] = getattr(e, "msg", None) or str(e) or type(e).__name__
+
+    # A thread per collection: a thread stuck on a hung browser is abandoned (it ends with its HTTP timeout), it
+    # does not hold up the collections of the next failed tests
+    collector_thread = threading.Thread(target=collect, name="failure-artifacts-collector", daemon=True)
+    collector_thread.start()
+    collector_thread.join(timeout=timeout_s)
+    if collector_thread.is_alive():
+        stop.set()
+        logger.warning("Failure artifacts were not collected within %s s, keeping the collected ones", timeout_s)
+        # The collection thread may still be in a command, it must not change what is handed to the writer
+        artifacts = artifacts.copy(deep=True)
+        artifacts.errors["timeout"] = f"Collection stopped after {timeout_s} s"
+    artifacts.collection_time_s = time.perf_counter() - start
+    return artifacts
+
+
+class ArtifactWriter:
+    """Writes the failure artifacts to disk in a background thread.
+
+    Every test gets its own directory with ``screenshot.png``, ``page.html.gz``, ``console.json.gz`` and
+    ``meta.json`` (URL, collection time and errors).
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue[tuple[Path, FailureArtifacts]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, directory: Path, artifacts: FailureArtifacts):
+        """Queue the artifacts to be written into ``directory``, returns immediately."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="failure-artifacts-writer", daemon=True)
+                self._thread.start()
+        self._queue.put((directory, artifacts))
+
+    def flush(self):
+        """Wait for all the queued artifacts to be written."""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            directory, artifacts = self._queue.get()
+            try:
+                self._write(directory, artifacts)
+            except OSError:
+                logger.exception("Cannot write the failure artifacts into `%s`", directory)
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _write(directory: Path, artifacts: FailureArtifacts):
+        directory.mkdir(parents=True, exist_ok=True)
+        if artifacts.screenshot_png is not None:
+            # PNG is compressed already
+            directory.joinpath("screenshot.png").write_bytes(artifacts.screenshot_png)
+        if artifacts.page_source is not None:
+            directory.joinpath("page.html.gz").write_bytes(gzip.compress(artifacts.page_source.encode(), 6))
+        if artifacts.console_logs is not None:
+            directory.joinpath("console.json.gz").write_bytes(
+                gzip.compress(json.dumps(artifacts.console_logs).encode(), 6)
+            )
+        meta = artifacts.dict(include={"url", "errors", "collection_time_s"})
+        directory.joinpath("meta.json").write_text(json.dumps(meta, indent=2))
+
+
+ARTIFACT_WRITER = ArtifactWriter()
@@ -0,0 +1,115 @@
+"""Log the user in over HTTP, without the browser login form.
+
+The token is requested from the OAuth2 token endpoint (``AUTH_TOKEN_URL``) with the password grant, through one
+pooled ``httpx.Client`` per process. The token response is stored in the ``webapp_api_token`` cookie the same way the
+app does after a UI login - URL-encoded JSON with the ``access_token`` - and the cookie is set on the driver with
+:func:`~src.auth.storage_state.inject_storage_state`.
+"""
+import json
+import time
+from typing import Any, Optional
+from urllib.parse import quote, urlsplit
+
+import httpx
+from selenium.webdriver import Remote
+
+from src.auth.storage_state import StorageState, inject_storage_state
+from src.constants import AUTH_TOKEN_COOKIE, DEFAULT_TIMEOUT_S, STORAGE_STATE_DEFAULT_TTL_S
+from src.exceptions import AuthenticationError
+from src.logger import logger
+
+
+def build_auth_token_cookie(token_response: dict[str, Any], origin: str, expires_at: float) -> dict[str, Any]:
+    """Cookie in the format read by :meth:`~src.selenium_facade.driver_facade.DriverFacade.get_auth_token`.
+
+    Args:
+        token_response: JSON response of the token endpoint, with the ``access_token``.
+        origin: origin of the app the cookie is for.
+        expires_at: epoch time at which the token expires.
+    """
+    return {
+        "name": AUTH_TOKEN_COOKIE,
+        "value": quote(json.dumps(token_response, separators=(",", ":"))),
+        "path": "/",
+        "secure": urlsplit(origin).scheme == "https",
+        "httpOnly": False,
+        "sameSite": "Lax",
+        "expiry": int(expires_at),
+    }
+
+
+class ApiLogin:
+    """Gets API tokens and turns them into storage states, caching them per user until they expire.
+
+    Args:
+        token_url: OAuth2 token endpoint.
+        client_id: OAuth2 client id.
+        client_secret: OAuth2 client secret, for confidential clients.
+        client: HTTP client to use, e.g. with a mock transport. By default a pooled client is created.
+    """
+
+    def __init__(
+        self,
+        token_url: str,
+        client_id: str,
+        client_secret: Optional[str] = None,
+        client: Optional[httpx.Client] = None,
+    ):
+        self.token_url = token_url
+        self.client_id = client_id
+        self.client_secret = client_secret
+        # Keep-alive connections are reused by all the logins of the process
+        self.client = client or httpx.Client(
+            timeout=DEFAULT_TIMEOUT_S, limits=httpx.Limits(max_keepalive_connections=4)
+        )
+        self._states: dict[tuple[str, str], StorageState] = {}
+
+    def get_token(self, username: str, password: str) -> dict[str, Any]:
+        """Request a token with the password grant.
+
+        Returns:
+            JSON response of the token endpoint.
+        """
+        form = {"grant_type": "password", "client_id": self.client_id, "username": username, "password": password}
+        if self.client_secret:
+            form["client_secret"] = self.client_secret
+        start = time.perf_counter()
+        response = self.client.post(self.token_url, data=form)
+        if response.status_code != httpx.codes.OK:
+            raise AuthenticationError(
+                f"API login of `{username}` failed with status {response.status_code}: {response.text[:200]}"
+            )
+        token_response = response.json()
+        if "access_token" not in token_response:
+            raise AuthenticationError(f"API login of `{username}` failed: no `access_token` in the response")
+        logger.info("Logged `%s` in through the API in %.3f s", username, time.perf_counter() - start)
+        return token_response
+
+    def get_storage_state(self, username: str, password: str, origin: str) -> StorageState:
+        """Storage state with the auth token cookie of the user, a new token is requested when the cached expired."""
+        state = self._states.get((username, origin))
+        if state is not None and state.is_fresh():
+            return state
+
+        token_response = self.get_token(username=username, password=password)
+        expires_at = time.time() + float(token_response.get("expires_in", STORAGE_STATE_DEFAULT_TTL_S))
+        state = StorageState(
+            origin=origin,
+            cookies=[build_auth_token_cookie(token_response, origin=origin, expires_at=expires_at)],
+            local_storage={},
+            expires_at=expires_at,
+        )
+        self._states[(username, origin)] = state
+        return state
+
+    def log_in(self, driver: Remote, username: str, password: str, url: str):
+        """Set the auth token cookie of the user on the driver and open ``url``."""
+        url_parts = urlsplit(url)
+        state = self.get_storage_state(
+            username=username, password=password, origin=f"{url_parts.scheme}://{url_parts.netloc}"
+        )
+        if not inject_storage_state(driver, state, url):
+            raise AuthenticationError(f"The app rejected the API token of `{username}`")
+
+    def close(self):
+        self.client.close()
@@ -0,0 +1,253 @@
+"""Reusable authenticated browser state, so the tests do not fill the UI login form every time.
+
+After a UI login the cookies (``webapp_api_token`` included) and the ``localStorage`` of the app origin are captured
+as a :class:`StorageState`, cached per environment and user. Later sessions get the state injected and land on the
+target page with a single navigation. A state whose token is about to expire, or which the app rejected, is dropped
+and the user logs in through the UI again. See ``AUTH_STORAGE_STATE_SCOPE`` for how the cache is shared.
+"""
+import base64
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Callable, Iterator, Literal, Optional
+from urllib.parse import unquote, urlsplit
+
+from pydantic import BaseModel
+from selenium.webdriver import Remote
+
+from src.constants import (
+    AUTH_TOKEN_COOKIE,
+    STORAGE_STATE_CACHE_FILE,
+    STORAGE_STATE_DEFAULT_TTL_S,
+    STORAGE_STATE_EXPIRY_MARGIN_S,
+)
+from src.exceptions import AuthenticationError
+from src.logger import logger
+from src.utils import file_lock
+
+StorageStateScope = Literal["off", "worker", "run"]
+
+# Cookie attributes accepted by the CDP ``Network.setCookies`` command, by Selenium cookie attribute
+CDP_COOKIE_ATTRIBUTES = {
+    "name": "name",
+    "value": "value",
+    "domain": "domain",
+    "path": "path",
+    "secure": "secure",
+    "httpOnly": "httpOnly",
+    "sameSite": "sameSite",
+    "expiry": "expires",
+}
+
+SET_LOCAL_STORAGE_JS = """
+(function (origin, items) {
+    if (window.location.origin !== origin) {
+        return;
+    }
+    for (const [key, value] of Object.entries(items)) {
+        window.localStorage.setItem(key, value);
+    }
+})(%s, %s);
+"""
+
+
+class StorageState(BaseModel):
+    """Cookies and ``localStorage`` of a logged-in session.
+
+    Args:
+        origin: origin of the app, e.g. ``https://demo.mahara.org``.
+        cookies: cookies as returned by ``WebDriver.get_cookies``.
+        local_storage: ``localStorage`` items of the origin.
+        expires_at: epoch time after which the login is not valid anymore.
+    """
+
+    origin: str
+    cookies: list[dict[str, Any]]
+    local_storage: dict[str, str]
+    expires_at: float
+
+    def is_fresh(self, margin_s: float = STORAGE_STATE_EXPIRY_MARGIN_S) -> bool:
+        return time.time() + margin_s < self.expires_at
+
+
+def storage_state_key(environment: str, username: str) -> str:
+    return f"{environment}:{username}"
+
+
+def _get_origin(url: str) -> str:
+    url_parts = urlsplit(url)
+    return f"{url_parts.scheme}://{url_parts.netloc}"
+
+
+def _decode_jwt_expiry(token: str) -> Optional[float]:
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def get_token_expiry(cookies: list[dict[str, Any]]) -> Optional[float]:
+    """Epoch time at which the auth token of the cookies expires.
+
+    Both the expiry of the ``webapp_api_token`` cookie and the ``exp`` claim of its access token are considered.
+
+    Returns:
+        The earliest of the two, ``None`` if the cookie is missing or carries no expiry.
+    """
+    token_cookie = next((cookie for cookie in cookies if cookie["name"] == AUTH_TOKEN_COOKIE), None)
+    if token_cookie is None:
+        return None
+
+    expiries = []
+    if token_cookie.get("expiry"):
+        expiries.append(float(token_cookie["expiry"]))
+    try:
+        access_token = json.loads(unquote(token_cookie["value"]))["access_token"]
+    except (KeyError, TypeError, ValueError):
+        access_token = None
+    if isinstance(access_token, str) and (token_expiry := _decode_jwt_expiry(access_token)) is not None:
+        expiries.append(token_expiry)
+    return min(expiries, default=None)
+
+
+def capture_storage_state(driver: Remote) -> StorageState:
+    """Capture the cookies and ``localStorage`` of the page currently open in the driver."""
+    cookies = driver.get_cookies()
+    local_storage = driver.execute_script("return Object.assign({}, window.localStorage);")
+    expires_at = get_token_expiry(cookies) or time.time() + STORAGE_STATE_DEFAULT_TTL_S
+    return StorageState(
+        origin=_get_origin(driver.current_url), cookies=cookies, local_storage=local_storage, expires_at=expires_at
+    )
+
+
+def inject_storage_state(driver: Remote, state: StorageState, url: str) -> bool:
+    """Open ``url`` in the driver as the user of the storage state.
+
+    On Chromium browsers the cookies are set through CDP and ``localStorage`` is filled before any page script runs,
+    so only ``url`` is loaded. Elsewhere cookies can only be added to the current page, so the origin is loaded first.
+
+    Returns:
+        ``False`` if the app dropped the auth token cookie - the state is not valid anymore.
+    """
+    local_storage_js = SET_LOCAL_STORAGE_JS % (json.dumps(state.origin), json.dumps(state.local_storage))
+    if hasattr(driver, "execute_cdp_cmd"):
+        cdp_cookies = [
+            {CDP_COOKIE_ATTRIBUTES[key]: value for key, value in cookie.items() if key in CDP_COOKIE_ATTRIBUTES}
+            for cookie in state.cookies
+        ]
+        for cdp_cookie in cdp_cookies:
+            if "domain" not in cdp_cookie:
+                cdp_cookie["url"] = state.origin
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+        script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": local_storage_js})
+        try:
+            driver.get(url)
+        finally:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+    else:
+        if _get_origin(driver.current_url) != state.origin:
+            driver.get(state.origin)
+        for cookie in state.cookies:
+            driver.add_cookie(cookie)
+        driver.execute_script(local_storage_js)
+        driver.get(url)
+
+    return driver.get_cookie(AUTH_TOKEN_COOKIE) is not None
+
+
+class StorageStateCache:
+    """Storage states by key (see :func:`storage_state_key`), one cache per pytest worker.
+
+    With the ``run`` scope the states are shared by the pytest-xdist workers through a file in the temp dir, guarded
+    by a file lock. The lock is held while logging in, so the other workers wait for the state instead of logging in
+    too.
+
+    Args:
+        cache_path: path of the file shared by the workers.
+    """
+
+    def __init__(self, cache_path: Path = Path(tempfile.gettempdir()).joinpath(STORAGE_STATE_CACHE_FILE)):
+        self.cache_path = cache_path
+        self._states: dict[str, StorageState] = {}
+
+    def restore_or_log_in(
+        self, driver: Remote, key: str, url: str, log_in: Callable[[], None], scope: StorageStateScope
+    ):
+        """Log the user in, injecting the cached state or calling ``log_in`` and caching the state after.
+
+        With an injected state the driver lands on ``url``, after ``log_in`` wherever the login redirected to.
+
+        Args:
+            driver: driver to log in.
+            key: key of the state, see :func:`storage_state_key`.
+            url: page to open.
+            log_in: logs the user in through the UI.
+            scope: ``worker`` or ``run``, see ``AUTH_STORAGE_STATE_SCOPE``.
+
+        Raises:
+            AuthenticationError: there is no auth token cookie after ``log_in``, nothing is cached.
+        """
+        state = self._states.get(key)
+        if state is not None and state.is_fresh():
+            if inject_storage_state(driver, state, url):
+                return
+            logger.info("Cached login of `%s` was rejected by the app, logging in again", key)
+        self._states.pop(key, None)
+
+        with self._shared_file_lock(scope):
+            shared_state = self._read_shared(key) if scope == "run" else None
+            if shared_state is not None and shared_state != state and shared_state.is_fresh():
+                if inject_storage_state(driver, shared_state, url):
+                    self._states[key] = shared_state
+                    return
+
+            start = time.perf_counter()
+            log_in()
+            state = capture_storage_state(driver)
+            if not any(cookie["name"] == AUTH_TOKEN_COOKIE for cookie in state.cookies):
+                # Caching it would hand an unauthenticated session to the next tests
+                raise AuthenticationError(f"No `{AUTH_TOKEN_COOKIE}` cookie after logging `{key}` in through the UI")
+            logger.info("Logged `%s` in through the UI in %.3f s", key, time.perf_counter() - start)
+            self._states[key] = state
+            if scope == "run":
+                self._write_shared(key, state)
+
+    def _shared_file_lock(self, scope: StorageStateScope):
+        if scope != "run":
+            return nullcontext()
+        return file_lock(f"{self.cache_path}.lock")
+
+    def _read_shared(self, key: str) -> Optional[StorageState]:
+        cache = self._load_shared()
+        state = cache["states"].get(key)
+        return StorageState.parse_obj(state) if state else None
+
+    def _write_shared(self, key: str, state: StorageState):
+        cache = self._load_shared()
+        cache["states"][key] = state.dict()
+        with _private_file(self.cache_path) as cache_file:
+            cache_file.write(json.dumps(cache))
+
+    def _load_shared(self) -> dict[str, Any]:
+        # Set by pytest-xdist for each worker, the same value for all the workers of one run
+        run_uid = os.getenv("PYTEST_XDIST_TESTRUNUID", str(os.getpid()))
+        cache = json.loads(self.cache_path.read_text()) if self.cache_path.exists() else {}
+        if cache.get("run_uid") != run_uid:
+            cache = {"run_uid": run_uid, "states": {}}
+        return cache
+
+
+@contextmanager
+def _private_file(path: Path) -> Iterator[Any]:
+    # The file holds session cookies, so only the current user can read it
+    file_descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(file_descriptor, "w") as file:
+        yield file
+
+
+STORAGE_STATE_CACHE = StorageStateCache()
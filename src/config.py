@@ -6,11 +6,14 @@ import os
 import sys
 from enum import StrEnum, auto
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseSettings, Field, AnyHttpUrl, HttpUrl
 from pydantic.fields import ModelField
 
+from src.constants import CONFIG_SNAPSHOT_ENV_VAR
+from src.utils import load_dotenv_if_running_locally
+
 
 class Environment(StrEnum):
     local = auto()
@@ -72,17 +75,106 @@ class SeleniumTestsConfig(BaseSettings):
     )
     RETRY_NUMBER: int = Field(
         default=0,
-        description="Number of failures before marking test as failed.\n\n**For local runs there are no retries**"
+        description=(
+            "Number of failures before marking test as failed. Only infrastructure failures (lost session, "
+            "navigation timeouts...) are retried, on a fresh ``WebDriver`` session.\n\n"
+            "**For local runs there are no retries**"
+        ),
     )
     DELAY_BETWEEN_RETRIES_S: int = Field(default=5, description="Delay in seconds between each try of single test")
-    LOCAL_ONLY_WHICH_BROWSERS_TO_USE: list[Literal["chrome", "firefox", "safari"]] = Field(
+    RETRY_TIME_BUDGET_S: float = Field(
+        default=600,
+        description=(
+            "Max time in seconds the whole run (all pytest-xdist workers together) may spend on failed tries and "
+            "delays before retrying. Once spent, failures are not retried anymore"
+        ),
+    )
+    LOCAL_ONLY_WHICH_BROWSERS_TO_USE: list[Literal["chrome", "firefox", "safari", "edge"]] = Field(
         default=["chrome"],
         description=(
             "Which browsers to use in local run.\n\n.. note::\n    "
             "You can specify multiple browsers, but take in account that in this case the tests will take **a lot** "
-            "of time to complete"
+            "of time to complete. Run them with ``-n <workers> --browser-affinity`` to give each browser its own "
+            "pytest-xdist workers"
+        ),
+    )
+    DRIVER_POOL_SIZE: int = Field(
+        default=0,
+        description=(
+            "How many idle ``WebDriver`` sessions per browser each pytest worker keeps alive between tests.\n\n"
+            "``0`` disables pooling - every test gets a brand-new browser"
+        ),
+    )
+    DRIVER_POOL_MAX_TESTS_PER_SESSION: int = Field(
+        default=25,
+        description="After how many tests a pooled ``WebDriver`` session is quit and replaced by a fresh one",
+    )
+    DRIVER_PREFETCH_DEPTH: int = Field(
+        default=0,
+        description=(
+            "How many brand-new ``WebDriver`` sessions to keep booting in background while a test runs.\n\n"
+            "``0`` disables prefetching - sessions are created when the test starts"
+        ),
+    )
+    DRIVER_BINARIES_DIR: Optional[str] = Field(
+        default=None,
+        description=(
+            "Directory with pinned driver binaries (``chromedriver``, ``geckodriver``, ``msedgedriver``).\n\n"
+            "When set, the binaries are taken from there and nothing is downloaded - use it on air-gapped runners"
+        ),
+    )
+    BROWSER_PROFILE: Literal["default", "fast"] = Field(
+        default="default",
+        description=(
+            "Browser settings profile, applied to chrome, firefox and edge.\n\n"
+            "* ``default`` - browser as is, maximized window\n"
+            "* ``fast`` - throughput-oriented for CI: fixed window size, no images, no extensions, no background "
+            "networking, no GPU, profile dir in ``BROWSER_PROFILE_DIR``"
         ),
     )
+    BROWSER_HEADLESS: bool = Field(default=True, description="Whether the ``fast`` profile runs the browser headless")
+    BROWSER_WINDOW_SIZE: str = Field(
+        default="1920,1080", description="Window size as ``width,height`` used by the ``fast`` profile"
+    )
+    BROWSER_PROFILE_DIR: str = Field(
+        default="/dev/shm",
+        description=(
+            "Directory in which the ``fast`` profile keeps the temporary browser profiles. "
+            "Use a tmpfs mount to keep the profiles in memory"
+        ),
+    )
+    AUTH_STORAGE_STATE_SCOPE: Literal["off", "worker", "run"] = Field(
+        default="run",
+        description=(
+            "How the authenticated browser state (cookies and ``localStorage``) captured after a UI login is reused "
+            "by ``log_the_user_in_with_storage_state``.\n\n"
+            "* ``off`` - log in through the UI form in every test\n"
+            "* ``worker`` - log in once per pytest worker, kept in memory\n"
+            "* ``run`` - log in once per run, shared by the pytest-xdist workers through a file in the temp dir"
+        ),
+    )
+    AUTH_TOKEN_URL: Optional[AnyHttpUrl] = Field(
+        default=None,
+        description=(
+            "OAuth2 token endpoint used by ``log_the_user_in_via_api`` to log the user in without the browser form, "
+            "e.g. ``https://sso.company.com/realms/<realm>/protocol/openid-connect/token``"
+        ),
+    )
+    AUTH_CLIENT_ID: str = Field(default="webapp", description="OAuth2 client id used to get the API token")
+    AUTH_CLIENT_SECRET: Optional[str] = Field(
+        default=None, description="OAuth2 client secret, only needed for confidential clients", secret=True
+    )
+    SEEDING_API_URL: Optional[AnyHttpUrl] = Field(
+        default=None,
+        description="Base URL of the app API used by the ``data_seeder`` fixture. By default ``<app URL>/api/``",
+    )
+    SEEDING_MAX_CONCURRENCY: int = Field(
+        default=8, description="How many API requests the ``data_seeder`` fixture sends at the same time"
+    )
+
+    class Config:
+        # The config is a snapshot shared by the whole run, see ``get_selenium_config``
+        allow_mutation = False
 
 
 class PipelineMetaConfig(BaseSettings):
@@ -117,7 +209,6 @@ class UsersCredentialsConfig(BaseSettings):
     MAHARA_DEMO_USER_PASSWORD: str = Field(description="Password which is used for login Mahara")
 
 
-@lru_cache
 def generate_dotenv_file():
     """Generate .env file for local development."""
     current_module = sys.modules[__name__]
@@ -138,9 +229,32 @@ def generate_dotenv_file():
             fp.write(f"{line}\n")
 
 
+@lru_cache
 def get_selenium_config() -> SeleniumTestsConfig:
-    """Memoize fetching the config."""
-    return SeleniumTestsConfig()
+    """Memoize fetching the config.
+
+    The config is resolved once per process into an immutable snapshot. The snapshot is exported to
+    ``CONFIG_SNAPSHOT_ENV_VAR`` for the pytest-xdist workers, so all the workers of one run see the config of the
+    controller instead of resolving it again. Only the workers spawned by the process which exported the snapshot reuse
+    it - not the process itself (e.g. an in-process pytester run) nor any other descendant. The fields declared with
+    ``secret=True`` are not exported, the workers read them from their environment.
+    """
+    snapshot = json.loads(os.getenv(CONFIG_SNAPSHOT_ENV_VAR, "null"))
+    if snapshot and os.getenv("PYTEST_XDIST_WORKER") and snapshot["owner_pid"] == os.getppid():
+        return SeleniumTestsConfig(**snapshot["config"])
+
+    # The config may be needed before ``pytest_sessionstart`` (e.g. fixture params at import of ``conftest.py``)
+    load_dotenv_if_running_locally()
+    selenium_config = SeleniumTestsConfig()
+    secrets = {
+        name
+        for name, model_field in SeleniumTestsConfig.__fields__.items()
+        if model_field.field_info.extra.get("secret")
+    }
+    os.environ[CONFIG_SNAPSHOT_ENV_VAR] = json.dumps(
+        {"owner_pid": os.getpid(), "config": json.loads(selenium_config.json(exclude=secrets))}
+    )
+    return selenium_config
 
 
 if __name__ == "__main__":
@@ -1,7 +1,46 @@
 
 DEFAULT_TIMEOUT_S: float = 15
-DROPDOWN_OPTIONS_TIMEOUT_S: float = 1
+DROPDOWN_OPTIONS_TIMEOUT_S: float = 3
+# Bounded waits for the UI to settle after an interaction (value propagated, panel collapsed, list rendered)
+SETTLE_TIMEOUT_S: float = 2
+AUTOCOMPLETE_OPTIONS_TIMEOUT_S: float = 5
+# How long the page has to stay without requests / DOM mutations to be considered idle
+NETWORK_QUIET_WINDOW_S: float = 0.5
+DOM_QUIET_WINDOW_S: float = 0.3
+# Async scripts are bounded by the driver script timeout (30 s by default), so long waits are split in chunks
+ASYNC_SCRIPT_CHUNK_S: float = 20
 
 SCREENSHOTS_FOLDER = "screenshots/"
 SCREENSHOTS_FAILURES_FOLDER = "failures/"
 
+DRIVER_BINARIES_CACHE_FILE = "selenium-driver-binaries.json"
+# How many times a component re-resolves its element after a ``StaleElementReferenceException``
+STALE_ELEMENT_RETRIES: int = 3
+
+REPORTS_FOLDER = "reports/"
+WEBDRIVER_COMMANDS_REPORT_FOLDER = "webdriver-commands/"
+TIMELINE_REPORT_FOLDER = "timeline/"
+
+STORAGE_STATE_CACHE_FILE = "selenium-storage-state.json"
+# A cached login is not reused when its token expires in less than this
+STORAGE_STATE_EXPIRY_MARGIN_S: float = 60
+# Lifetime assumed for a cached login when the token carries no expiry
+STORAGE_STATE_DEFAULT_TTL_S: float = 15 * 60
+# Cookie in which the app keeps the API token of the logged-in user
+AUTH_TOKEN_COOKIE = "webapp_api_token"
+# Total time the failure artifacts (screenshot, DOM, console logs) may take to collect from the browser
+FAILURE_ARTIFACTS_TIMEOUT_S: float = 10
+
+DURATION_HISTORY_FILE = ".pytest-durations.json"
+# Weight of the latest run in the recorded duration of a test, the rest is the previous value
+DURATION_HISTORY_LATEST_WEIGHT: float = 0.5
+
+RETRY_BUDGET_FILE = "selenium-retry-budget.json"
+
+# Env var with the JSON snapshot of the config, inherited by the pytest-xdist workers
+CONFIG_SNAPSHOT_ENV_VAR = "SELENIUM_TESTS_CONFIG_SNAPSHOT"
+
+RESULT_JOURNAL_FOLDER = "result-journal/"
+# The journal is ``fsync``-ed after this many results, or this many seconds after the last ``fsync``
+RESULT_JOURNAL_FSYNC_EVERY = 20
+RESULT_JOURNAL_FSYNC_INTERVAL_S: float = 5
@@ -0,0 +1,173 @@
+"""Creates the preconditions of the tests through the app API instead of the UI.
+
+The requests are authenticated with the API token of the browser session (see
+:meth:`~src.selenium_facade.driver_facade.DriverFacade.get_auth_token`), so the resources belong to the logged-in
+user. Batches of resources are created concurrently with an ``httpx.AsyncClient``, at most ``max_concurrency``
+requests at a time. Every created resource is tracked, and :meth:`DataSeeder.cleanup` deletes them all at once.
+"""
+import asyncio
+import time
+from typing import Any, Callable, Generator, Optional
+
+import httpx
+from faker import Faker
+from pydantic import BaseModel
+
+from src.constants import DEFAULT_TIMEOUT_S
+from src.exceptions import AuthenticationError
+from src.logger import logger
+
+PayloadFactory = Callable[[Faker], dict[str, Any]]
+
+
+class SeededResource(BaseModel):
+    """Resource created by the seeder.
+
+    Args:
+        endpoint: API endpoint the resource was created with, e.g. ``groups``.
+        id: id of the resource, the resource is deleted with ``DELETE <endpoint>/<id>``.
+        data: JSON response of the creation request.
+    """
+
+    endpoint: str
+    id: str
+    data: dict[str, Any]
+
+
+class BearerTokenAuth(httpx.Auth):
+    """Authenticates every request with the token set by :class:`DataSeeder` before each batch of requests."""
+
+    def __init__(self):
+        self.token: Optional[str] = None
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        request.headers["Authorization"] = f"Bearer {self.token}"
+        yield request
+
+
+class DataSeeder:
+    """Data seeding of one test.
+
+    The methods are synchronous, so they can be called from fixtures and tests. The seeder runs its own event loop.
+
+    Args:
+        base_url: base URL of the app API.
+        token_provider: returns the API token, e.g. ``DriverFacade(driver).get_auth_token``.
+        max_concurrency: max number of requests in flight.
+        id_field: field of the creation response with the id of the resource.
+        transport: HTTP transport, e.g. ``httpx.MockTransport`` to seed against a stub.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token_provider: Callable[[], str],
+        max_concurrency: int = 8,
+        id_field: str = "id",
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.faker = Faker()
+        self.token_provider = token_provider
+        self.id_field = id_field
+        self.resources: list[SeededResource] = []
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._auth = BearerTokenAuth()
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            auth=self._auth,
+            timeout=DEFAULT_TIMEOUT_S,
+            limits=httpx.Limits(max_connections=max_concurrency),
+            transport=transport,
+        )
+
+    def create(self, endpoint: str, payload: dict[str, Any]) -> SeededResource:
+        """Create one resource.
+
+        Args:
+            endpoint: API endpoint, relative to the base URL.
+            payload: JSON body of the creation request.
+        """
+        self._authenticate()
+        return self._loop.run_until_complete(self._create(endpoint, payload))
+
+    def create_many(self, endpoint: str, payload_factory: PayloadFactory, count: int) -> list[SeededResource]:
+        """Create ``count`` resources concurrently, with payloads generated by ``payload_factory``.
+
+        Dummy example of usage:
+
+        .. code-block:: python
+
+           groups = data_seeder.create_many(
+               "groups", lambda fake: {"name": fake.catch_phrase(), "description": fake.text()}, count=10
+           )
+
+        Args:
+            endpoint: API endpoint, relative to the base URL.
+            payload_factory: builds the JSON body of one creation request from a ``Faker`` instance.
+            count: how many resources to create.
+
+        Returns:
+            The created resources, in the order of the payloads.
+
+        Raises:
+            httpx.HTTPError: the first error of the creation requests, once all of them are done. The resources
+                created by the other requests are tracked, so they are deleted by :meth:`cleanup`.
+        """
+        payloads = [payload_factory(self.faker) for _ in range(count)]
+        self._authenticate()
+        start = time.perf_counter()
+        results = self._loop.run_until_complete(
+            self._gather((self._create(endpoint, payload) for payload in payloads), return_exceptions=True)
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0]
+        logger.info("Seeded %d `%s` in %.3f s", count, endpoint, time.perf_counter() - start)
+        return results
+
+    def cleanup(self):
+        """Delete all the resources created by the seeder, concurrently.
+
+        Resources which are already gone are ignored. Failures are logged and do not stop the other deletions.
+        """
+        resources, self.resources = self.resources, []
+        if not resources:
+            return
+        self._authenticate()
+        results = self._loop.run_until_complete(
+            self._gather((self._delete(resource) for resource in resources), return_exceptions=True)
+        )
+        for resource, result in zip(resources, results):
+            if isinstance(result, Exception):
+                logger.warning("Cannot delete seeded `%s/%s`: %s", resource.endpoint, resource.id, result)
+
+    def close(self):
+        self._loop.run_until_complete(self._client.aclose())
+        self._loop.close()
+
+    def _authenticate(self):
+        # The token is read from the browser once per batch: ``token_provider`` is a blocking WebDriver call, which
+        # would stall the event loop if called for each request
+        token = self.token_provider()
+        if not token:
+            raise AuthenticationError("No API token in the browser session, log the user in before seeding data")
+        self._auth.token = token
+
+    async def _gather(self, coroutines, return_exceptions: bool = False) -> list:
+        return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+    async def _create(self, endpoint: str, payload: dict[str, Any]) -> SeededResource:
+        async with self._semaphore:
+            response = await self._client.post(endpoint, json=payload)
+        response.raise_for_status()
+        data = response.json()
+        resource = SeededResource(endpoint=endpoint.rstrip("/"), id=str(data[self.id_field]), data=data)
+        self.resources.append(resource)
+        return resource
+
+    async def _delete(self, resource: SeededResource):
+        async with self._semaphore:
+            response = await self._client.delete(f"{resource.endpoint}/{resource.id}")
+        if response.status_code != httpx.codes.NOT_FOUND:
+            response.raise_for_status()
@@ -1,8 +1,12 @@
-from typing import Literal
+import os
+from typing import Literal, Mapping, Optional
 
 from selenium import webdriver
+from selenium.webdriver.chromium.options import ChromiumOptions
 from selenium.webdriver.safari.options import Options as SafariOptions
 
+from src.config import get_selenium_config
+
 BrowserName = Literal["chrome", "firefox", "safari", "edge"]
 
 FF_SETTINGS: dict[str, bool | str | int] = {
@@ -13,18 +17,92 @@ FF_SETTINGS: dict[str, bool | str | int] = {
     "pdfjs.disabled": True,
 }
 
+# Settings of the ``fast`` profile, see ``BROWSER_PROFILE`` config
+FF_FAST_SETTINGS: dict[str, bool | str | int] = {
+    "permissions.default.image": 2,
+    "extensions.update.enabled": False,
+    "app.update.auto": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "datareporting.healthreport.uploadEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "layers.acceleration.disabled": True,
+    "gfx.webrender.software": True,
+}
+
+CHROMIUM_FAST_ARGUMENTS: list[str] = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--disable-gpu",
+]
+
+
+def _get_window_size() -> tuple[int, int]:
+    width, height = get_selenium_config().BROWSER_WINDOW_SIZE.split(",")
+    return int(width), int(height)
+
+
+def _apply_chromium_fast_profile(options: ChromiumOptions):
+    selenium_config = get_selenium_config()
+    width, height = _get_window_size()
+    if selenium_config.BROWSER_HEADLESS:
+        options.add_argument("--headless=new")
+    options.add_argument(f"--window-size={width},{height}")
+    for argument in CHROMIUM_FAST_ARGUMENTS:
+        options.add_argument(argument)
+
 
 def get_browser_options(browser: BrowserName):
+    fast_profile = get_selenium_config().BROWSER_PROFILE == "fast"
+
     if browser == "firefox":
         options = webdriver.FirefoxOptions()
         for key, value in FF_SETTINGS.items():
             options.set_preference(key, value)
 
+        if fast_profile:
+            width, height = _get_window_size()
+            if get_selenium_config().BROWSER_HEADLESS:
+                options.add_argument("-headless")
+            options.add_argument(f"--width={width}")
+            options.add_argument(f"--height={height}")
+            for key, value in FF_FAST_SETTINGS.items():
+                options.set_preference(key, value)
+
         return options
 
-    switcher = {
-        "chrome": webdriver.ChromeOptions(),
-        "safari": SafariOptions(),
-        "edge": webdriver.EdgeOptions(),
-    }
-    return switcher.get(browser, switcher["chrome"])
+    if browser == "safari":
+        return SafariOptions()
+
+    options = webdriver.EdgeOptions() if browser == "edge" else webdriver.ChromeOptions()
+    if fast_profile:
+        _apply_chromium_fast_profile(options)
+    return options
+
+
+def get_driver_service_env() -> Optional[Mapping[str, str]]:
+    """Environment for the driver service process.
+
+    ``chromedriver``, ``msedgedriver`` and ``geckodriver`` create the temporary browser profile in ``TMPDIR``, so
+    with the ``fast`` profile it is pointed to ``BROWSER_PROFILE_DIR``. They also delete the profile on ``quit``.
+
+    Returns:
+        The environment, or ``None`` to inherit the current one.
+    """
+    selenium_config = get_selenium_config()
+    if selenium_config.BROWSER_PROFILE != "fast" or not os.path.isdir(selenium_config.BROWSER_PROFILE_DIR):
+        return None
+    return {**os.environ, "TMPDIR": selenium_config.BROWSER_PROFILE_DIR}
+
+
+def uses_fixed_window_size(browser: BrowserName) -> bool:
+    """Whether the browser window size is set by the options, instead of maximizing the window."""
+    return get_selenium_config().BROWSER_PROFILE == "fast" and browser != "safari"
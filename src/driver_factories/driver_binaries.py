@@ -0,0 +1,103 @@
+"""Resolves the paths of the driver binaries (``chromedriver``, ``geckodriver``, ``msedgedriver``) once per run.
+
+``webdriver_manager`` checks the latest driver version online on every ``install()`` call. Instead, the first
+pytest-xdist worker resolves the binary and stores its path in an on-disk cache guarded by a file lock, the other
+workers reuse it. With ``DRIVER_BINARIES_DIR`` set, the binaries are taken from a pinned local directory and the
+network is never used.
+"""
+import json
+import os
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+from src.config import get_selenium_config
+from src.constants import DRIVER_BINARIES_CACHE_FILE
+from src.logger import logger
+from src.utils import file_lock
+
+DRIVER_BINARY_NAMES: dict[str, str] = {
+    "chrome": "chromedriver",
+    "firefox": "geckodriver",
+    "edge": "msedgedriver",
+}
+
+
+# ``webdriver_manager`` is imported only when a binary is installed - not at collection, nor with pinned binaries
+def _install_chromedriver() -> str:
+    from webdriver_manager.chrome import ChromeDriverManager  # NOQA
+
+    return ChromeDriverManager().install()
+
+
+def _install_geckodriver() -> str:
+    from webdriver_manager.firefox import GeckoDriverManager  # NOQA
+
+    return GeckoDriverManager().install()
+
+
+def _install_msedgedriver() -> str:
+    from webdriver_manager.microsoft import EdgeChromiumDriverManager  # NOQA
+
+    return EdgeChromiumDriverManager().install()
+
+
+DRIVER_INSTALLERS: dict[str, Callable[[], str]] = {
+    "chrome": _install_chromedriver,
+    "firefox": _install_geckodriver,
+    "edge": _install_msedgedriver,
+}
+
+
+@lru_cache
+def resolve_driver_binary(browser: str) -> str:
+    """Get the path of the driver binary for the browser, resolving it only once per run.
+
+    Args:
+        browser: browser name, e.g. ``chrome``.
+
+    Returns:
+        Absolute path of the driver binary.
+    """
+    start = time.perf_counter()
+    selenium_config = get_selenium_config()
+    if selenium_config.DRIVER_BINARIES_DIR:
+        path = _find_pinned_binary(selenium_config.DRIVER_BINARIES_DIR, browser)
+    else:
+        path = _resolve_shared_between_workers(browser)
+    logger.info("Resolved %s driver binary `%s` in %.3f s", browser, path, time.perf_counter() - start)
+    return path
+
+
+def _find_pinned_binary(binaries_dir: str, browser: str) -> str:
+    binary_name = DRIVER_BINARY_NAMES[browser]
+    for file_name in (binary_name, f"{binary_name}.exe"):
+        path = Path(binaries_dir).joinpath(file_name)
+        if path.is_file():
+            return str(path.absolute())
+    raise FileNotFoundError(f"Driver binary `{binary_name}` not found in DRIVER_BINARIES_DIR=`{binaries_dir}`")
+
+
+def _resolve_shared_between_workers(browser: str) -> str:
+    # Set by pytest-xdist for each worker, the same value for all the workers of one run
+    run_uid = os.getenv("PYTEST_XDIST_TESTRUNUID")
+    if not run_uid:
+        return DRIVER_INSTALLERS[browser]()
+
+    cache_path = Path(tempfile.gettempdir()).joinpath(DRIVER_BINARIES_CACHE_FILE)
+    # The lock is held while installing, so the other workers wait for the result instead of installing too
+    with file_lock(f"{cache_path}.lock"):
+        cache = json.loads(cache_path.read_text()) if cache_path.exists() else {}
+        if cache.get("run_uid") != run_uid:
+            cache = {"run_uid": run_uid, "binaries": {}}
+
+        path = cache["binaries"].get(browser)
+        if path and Path(path).is_file():
+            return path
+
+        path = DRIVER_INSTALLERS[browser]()
+        cache["binaries"][browser] = path
+        cache_path.write_text(json.dumps(cache))
+    return path
@@ -34,3 +34,10 @@ class DriverFactoryBase(ABC):
     @abstractmethod
     def get_driver_meta(driver) -> DriverMeta:
         ...
+
+    @staticmethod
+    def set_test_name(driver, test_name: str) -> None:
+        """Name the session after the test it is handed to, when it was created ahead for no test in particular
+        (prefetched or pooled). Remote providers (e.g. BrowserStack ``setSessionName``) override it, a no-op by
+        default."""
+        return
@@ -0,0 +1,144 @@
+from collections import defaultdict
+from typing import Any, Callable
+
+from pydantic import BaseModel
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import Remote
+
+from src.driver_factories.driver_factory_base import DriverFactoryBase
+from src.logger import logger
+
+
+class DriverPoolStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    recycled: int = 0
+    reset_failures: int = 0
+
+
+def reset_driver_state(driver: Remote) -> None:
+    """Bring a used ``WebDriver`` session back to a clean state.
+
+    * closes every window except the first one and leaves any frame
+    * clears ``localStorage``, ``sessionStorage`` and cookies
+    * navigates to ``about:blank``
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    driver.switch_to.default_content()
+
+    # Storage is bound to the current origin, so it has to be cleared before leaving the page.
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        # Pages like ``about:blank`` or ``data:`` URLs do not expose the storage
+        pass
+
+    if hasattr(driver, "execute_cdp_cmd"):
+        # Chromium can drop the cookies of all domains, not only the ones of the current page
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.delete_all_cookies()
+    driver.get("about:blank")
+
+
+class DriverPool:
+    """Pool of live ``WebDriver`` sessions, one pool per pytest worker.
+
+    Instead of launching a new browser for every test, a session is handed to a test by :meth:`acquire` and put
+    back by :meth:`release`, where its state is reset. A session is recycled (quit and not reused) after
+    ``max_tests_per_session`` tests, after a failed test or when the reset fails.
+
+    Args:
+        driver_factory: factory used to create new sessions on pool misses.
+        quit_driver: callable which closes a session for good.
+        size: max number of idle sessions kept per parametrization factor (browser).
+        max_tests_per_session: after how many tests a session is recycled.
+    """
+
+    def __init__(
+        self,
+        driver_factory: DriverFactoryBase,
+        quit_driver: Callable[[Remote], None],
+        size: int,
+        max_tests_per_session: int,
+    ):
+        self._driver_factory = driver_factory
+        self._quit_driver = quit_driver
+        self._size = size
+        self._max_tests_per_session = max_tests_per_session
+        self._idle: dict[Any, list[Remote]] = defaultdict(list)
+        self._factors: dict[str, Any] = {}
+        self._usages: dict[str, int] = {}
+        self.stats = DriverPoolStats()
+
+    def acquire(self, parametrization_factor: Any, test_name: str, build_name: str) -> Remote:
+        """Give an idle session for the parametrization factor, or create a new one."""
+        idle = self._idle[parametrization_factor]
+        if idle:
+            self.stats.hits += 1
+            driver = idle.pop()
+            # The session was created for another test
+            self._driver_factory.set_test_name(driver, test_name)
+        else:
+            self.stats.misses += 1
+            driver = self._driver_factory.create_driver(
+                parametrization_factor=parametrization_factor, test_name=test_name, build_name=build_name
+            )
+            self._factors[driver.session_id] = parametrization_factor
+            self._usages[driver.session_id] = 0
+
+        self._usages[driver.session_id] += 1
+        return driver
+
+    def release(self, driver: Remote, failed: bool) -> None:
+        """Put the session back to the pool, or recycle it.
+
+        Args:
+            driver: session given by :meth:`acquire`.
+            failed: whether the test which used the session failed. Sessions of failed tests are never reused.
+        """
+        session_id = driver.session_id
+        parametrization_factor = self._factors[session_id]
+        idle = self._idle[parametrization_factor]
+        if failed or self._usages[session_id] >= self._max_tests_per_session or len(idle) >= self._size:
+            self._recycle(driver)
+            return
+
+        try:
+            reset_driver_state(driver)
+        except WebDriverException:
+            logger.exception("Cannot reset the pooled driver, recycling it")
+            self.stats.reset_failures += 1
+            self._recycle(driver)
+            return
+
+        idle.append(driver)
+
+    def shutdown(self) -> None:
+        """Quit all idle sessions and log the pool statistics."""
+        for idle in self._idle.values():
+            while idle:
+                self._forget(idle.pop())
+        logger.info(
+            "Driver pool: %s hits, %s misses, %s recycled, %s failed resets",
+            self.stats.hits,
+            self.stats.misses,
+            self.stats.recycled,
+            self.stats.reset_failures,
+        )
+
+    def _recycle(self, driver: Remote) -> None:
+        self.stats.recycled += 1
+        self._forget(driver)
+
+    def _forget(self, driver: Remote) -> None:
+        session_id = driver.session_id
+        self._factors.pop(session_id, None)
+        self._usages.pop(session_id, None)
+        try:
+            self._quit_driver(driver)
+        except WebDriverException:
+            logger.exception("Cannot quit the pooled driver")
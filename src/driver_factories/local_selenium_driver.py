@@ -1,11 +1,11 @@
-from selenium.webdriver import Chrome, Firefox, Remote, Safari
+from selenium.webdriver import Chrome, Edge, Firefox, Remote, Safari
 from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 
 from src.config import get_selenium_config
-from src.driver_factories.browser import get_browser_options
+from src.driver_factories.browser import get_browser_options, get_driver_service_env
+from src.driver_factories.driver_binaries import resolve_driver_binary
 from src.driver_factories.driver_factory_base import DriverFactoryBase, DriverMeta
 
 
@@ -18,10 +18,17 @@ class LocalSeleniumDriverFactory(DriverFactoryBase):
     @classmethod
     def create_driver(cls, parametrization_factor: dict, test_name: str, build_name: str) -> Remote:
         if parametrization_factor == "chrome":
-            return Chrome(service=ChromeService(ChromeDriverManager().install()))
+            options = get_browser_options("chrome")
+            service = ChromeService(resolve_driver_binary("chrome"), env=get_driver_service_env())
+            return Chrome(service=service, options=options)
         elif parametrization_factor == "firefox":
             options = get_browser_options("firefox")
-            return Firefox(service=FirefoxService(GeckoDriverManager().install()), options=options)
+            service = FirefoxService(resolve_driver_binary("firefox"), env=get_driver_service_env())
+            return Firefox(service=service, options=options)
+        elif parametrization_factor == "edge":
+            options = get_browser_options("edge")
+            service = EdgeService(resolve_driver_binary("edge"), env=get_driver_service_env())
+            return Edge(service=service, options=options)
         elif parametrization_factor == "safari":
             # webdriver_manager doesn't support Safari.
             return Safari()
@@ -0,0 +1,93 @@
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import Remote
+
+from src.driver_factories.driver_factory_base import DriverFactoryBase, DriverMeta
+from src.logger import logger
+
+# Name of the prefetched sessions until they are handed to a test
+PREFETCHED_SESSION_NAME = "prefetched"
+
+
+class PrefetchingDriverFactory(DriverFactoryBase):
+    """Wraps a driver factory and keeps the next sessions booting in background threads.
+
+    Every session is still brand-new, but while a test runs the next ``depth`` sessions for the same
+    parametrization factor are already being created, so :meth:`create_driver` usually returns immediately.
+    Prefetched sessions are created without a test name and named after the test they are handed to.
+
+    Args:
+        driver_factory: factory which actually creates the sessions.
+        quit_driver: callable which closes a session for good, used for prefetched sessions nobody took.
+        depth: how many sessions per parametrization factor to keep booting ahead.
+    """
+
+    def __init__(self, driver_factory: DriverFactoryBase, quit_driver: Callable[[Remote], None], depth: int):
+        self._driver_factory = driver_factory
+        self._quit_driver = quit_driver
+        self._depth = depth
+        self.parametrization_factors = driver_factory.parametrization_factors
+        # ``depth`` threads per factor, so the sessions of a browser never wait behind the ones of another browser.
+        # The threads are only started when needed, e.g. a worker pinned to one browser starts ``depth`` of them
+        self._executor = ThreadPoolExecutor(
+            max_workers=depth * max(len(self.parametrization_factors), 1), thread_name_prefix="driver-prefetch"
+        )
+        self._prefetched: dict[Any, deque[Future]] = defaultdict(deque)
+
+    def create_driver(self, parametrization_factor: Any, test_name: str, build_name: str) -> Remote:
+        prefetched = self._prefetched[parametrization_factor]
+        future = prefetched.popleft() if prefetched else None
+        # Start booting the next sessions before waiting for this one
+        while len(prefetched) < self._depth:
+            prefetched.append(
+                self._executor.submit(
+                    self._driver_factory.create_driver,
+                    parametrization_factor=parametrization_factor,
+                    test_name=PREFETCHED_SESSION_NAME,
+                    build_name=build_name,
+                )
+            )
+
+        if future is not None:
+            try:
+                driver = future.result()
+            except WebDriverException:
+                logger.exception("Prefetched driver failed to start, creating a new one")
+            else:
+                self._driver_factory.set_test_name(driver, test_name)
+                return driver
+
+        return self._driver_factory.create_driver(
+            parametrization_factor=parametrization_factor, test_name=test_name, build_name=build_name
+        )
+
+    def shutdown(self) -> None:
+        """Cancel the sessions which did not start booting yet and quit the ones nobody took."""
+        futures = [future for prefetched in self._prefetched.values() for future in prefetched]
+        self._prefetched.clear()
+        for future in futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+
+        for future in futures:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            try:
+                self._quit_driver(future.result())
+            except WebDriverException:
+                logger.exception("Cannot quit the prefetched driver")
+
+    def on_test_success(self, driver: Remote, reason: str = "Test passed") -> None:
+        return self._driver_factory.on_test_success(driver)
+
+    def on_test_failure(self, driver: Remote, reason: str) -> None:
+        return self._driver_factory.on_test_failure(driver, reason)
+
+    def get_driver_meta(self, driver: Remote) -> DriverMeta:
+        return self._driver_factory.get_driver_meta(driver)
+
+    def set_test_name(self, driver: Remote, test_name: str) -> None:
+        return self._driver_factory.set_test_name(driver, test_name)
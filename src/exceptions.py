@@ -1,2 +1,19 @@
 class NoResults(Exception):
     pass
+
+
+class AuthenticationError(Exception):
+    pass
+
+
+class FailureSentinelFired(Exception):
+    """A failure sentinel (error toast, error page...) was met while waiting for a success condition.
+
+    Args:
+        sentinel: name of the sentinel which fired.
+        message: error message.
+    """
+
+    def __init__(self, sentinel: str, message: str):
+        super().__init__(message)
+        self.sentinel = sentinel
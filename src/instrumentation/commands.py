@@ -0,0 +1,154 @@
+"""Records every WebDriver command: name, latency, payload size and the call site which triggered it."""
+import functools
+import math
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Any, Iterable, NamedTuple, Optional
+
+from pydantic import BaseModel
+from selenium.webdriver.remote.webdriver import WebDriver
+
+SRC_DIR_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INSTRUMENTATION_DIR_PATH = os.path.dirname(os.path.abspath(__file__))
+
+SLOWEST_CALL_SITES_IN_SUMMARY = 10
+
+
+class CommandRecord(NamedTuple):
+    command: str
+    latency_ms: float
+    payload_bytes: int
+    call_site: str
+
+
+class CallSiteSummary(BaseModel):
+    call_site: str
+    commands: int
+    total_latency_ms: float
+
+
+class CommandsSummary(BaseModel):
+    commands: int
+    total_latency_ms: float
+    p50_latency_ms: float
+    p95_latency_ms: float
+    payload_bytes: int
+    per_command: dict[str, int]
+    slowest_call_sites: list[CallSiteSummary]
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(records: Iterable[CommandRecord]) -> CommandsSummary:
+    records = list(records)
+    latencies = sorted(record.latency_ms for record in records)
+    call_sites: dict[str, list[float]] = defaultdict(list)
+    for record in records:
+        call_sites[record.call_site].append(record.latency_ms)
+    slowest_call_sites = sorted(
+        (
+            CallSiteSummary(call_site=call_site, commands=len(site_latencies), total_latency_ms=sum(site_latencies))
+            for call_site, site_latencies in call_sites.items()
+        ),
+        key=lambda site: site.total_latency_ms,
+        reverse=True,
+    )
+    return CommandsSummary(
+        commands=len(records),
+        total_latency_ms=sum(latencies),
+        p50_latency_ms=_percentile(latencies, 50),
+        p95_latency_ms=_percentile(latencies, 95),
+        payload_bytes=sum(record.payload_bytes for record in records),
+        per_command=dict(Counter(record.command for record in records).most_common()),
+        slowest_call_sites=slowest_call_sites[:SLOWEST_CALL_SITES_IN_SUMMARY],
+    )
+
+
+def _find_call_site() -> str:
+    """Outermost method of the framework (view, component, ``DriverFacade``) in the current call stack."""
+    call_site = "<test>"
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        in_framework = code.co_filename.startswith(SRC_DIR_PATH) and not code.co_filename.startswith(
+            INSTRUMENTATION_DIR_PATH
+        )
+        # Decorator wrappers are not interesting, the method they wrap is
+        if in_framework and "<locals>" not in code.co_qualname:
+            call_site = code.co_qualname
+        frame = frame.f_back  # type: ignore[assignment]
+    return call_site
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate JSON size of a payload: the strings are counted, the structure roughly.
+
+    Much cheaper than serializing the screenshots and page sources of several MB.
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        return sum(len(str(key)) + 4 + _estimate_size(item) for key, item in value.items()) + 2
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_size(item) + 1 for item in value) + 2
+    return 4 if value is None else len(str(value))
+
+
+def _payload_size(payload: Optional[dict]) -> int:
+    if not payload:
+        return 0
+    return _estimate_size(payload)
+
+
+class CommandRecorder:
+    """Collects the commands of all the instrumented drivers of the process, grouped by test."""
+
+    def __init__(self):
+        self.current_test: Optional[str] = None
+        self.records: dict[str, list[CommandRecord]] = defaultdict(list)
+
+    def record(self, record: CommandRecord):
+        self.records[self.current_test or "session"].append(record)
+
+    def count(self, test: str) -> int:
+        return len(self.records.get(test, []))
+
+
+COMMAND_RECORDER = CommandRecorder()
+
+
+def instrument_driver(driver: WebDriver, recorder: CommandRecorder = COMMAND_RECORDER, detailed: bool = True):
+    """Wrap ``driver.execute`` to record all the commands of the driver, ``WebElement`` ones included.
+
+    Args:
+        driver: driver to instrument.
+        recorder: where the commands are recorded.
+        detailed: also record the payload size and the call site of the commands. Without it only the command names
+            and latencies are recorded, e.g. to enforce a command budget.
+    """
+    if vars(driver).get("_instrumented"):
+        return
+    original_execute = driver.execute
+
+    @functools.wraps(original_execute)
+    def execute(driver_command: str, params: Optional[dict] = None) -> dict:
+        start = time.perf_counter()
+        response = original_execute(driver_command, params)
+        latency_ms = (time.perf_counter() - start) * 1000
+        if detailed:
+            payload_bytes = _payload_size(params) + _payload_size(response)
+            recorder.record(CommandRecord(driver_command, latency_ms, payload_bytes, _find_call_site()))
+        else:
+            recorder.record(CommandRecord(driver_command, latency_ms, 0, ""))
+        return response
+
+    setattr(driver, "execute", execute)
+    setattr(driver, "_instrumented", True)
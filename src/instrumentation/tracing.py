@@ -0,0 +1,62 @@
+"""Timeline spans in `Chrome trace-event format
+<https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_, viewable in Perfetto."""
+import functools
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Tracer:
+    """Collects the spans of the process. Spans are no-op until :attr:`enabled` is set."""
+
+    def __init__(self):
+        self.enabled = False
+        # Each pytest-xdist worker is shown as a separate thread of one process
+        self.tid = 0
+        self.events: list[dict[str, Any]] = []
+
+    @contextmanager
+    def span(self, name: str, category: str = "test", args: Optional[dict[str, Any]] = None) -> Iterator[None]:
+        """Record the time spent in the ``with`` block as a complete (``X``) event."""
+        if not self.enabled:
+            yield
+            return
+
+        start_us = time.time_ns() // 1000
+        try:
+            yield
+        finally:
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": start_us,
+                    "dur": time.time_ns() // 1000 - start_us,
+                    "pid": 0,
+                    "tid": self.tid,
+                    "args": args or {},
+                }
+            )
+
+    def thread_name_event(self, name: str) -> dict[str, Any]:
+        return {"name": "thread_name", "ph": "M", "pid": 0, "tid": self.tid, "args": {"name": name}}
+
+
+TRACER = Tracer()
+
+
+def traced(category: str = "view") -> Callable[[F], F]:
+    """Decorator: record each call of the function as a span named by its qualified name."""
+
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with TRACER.span(function.__qualname__, category=category):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,97 @@
+"""History of the test durations, used to plan the distribution of the tests between workers and shards."""
+import json
+import re
+import statistics
+from pathlib import Path
+from typing import Iterable
+
+from src.constants import DURATION_HISTORY_LATEST_WEIGHT
+from src.utils import file_lock
+
+# ``test_login.py::test_login_mahara[chrome]`` -> ``test_login.py::test_login_mahara``
+PARAMETRIZATION_RE = re.compile(r"\[.*\]$")
+
+
+class DurationHistory:
+    """Durations in seconds of the tests, by node id. A node id includes the browser parameter, e.g. ``[chrome]``.
+
+    Args:
+        path: path of the JSON history file.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.durations: dict[str, float] = self._read()
+
+    def _read(self) -> dict[str, float]:
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text())["durations"]
+        except (ValueError, KeyError):
+            return {}
+
+    def record(self, durations: dict[str, float]):
+        """Merge the durations of a run into the history file, smoothing them with the recorded ones.
+
+        The file is re-read under a lock, so concurrent runs do not lose each other's durations.
+        """
+        with file_lock(f"{self.path}.lock"):
+            self.durations = self._read()
+            for nodeid, duration in durations.items():
+                previous = self.durations.get(nodeid)
+                self.durations[nodeid] = (
+                    duration
+                    if previous is None
+                    else DURATION_HISTORY_LATEST_WEIGHT * duration + (1 - DURATION_HISTORY_LATEST_WEIGHT) * previous
+                )
+            temp_path = self.path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps({"durations": dict(sorted(self.durations.items()))}, indent=2))
+            temp_path.replace(self.path)
+
+    def estimate(self, nodeids: Iterable[str]) -> list[float]:
+        """Expected duration of each test.
+
+        Tests without history get the mean duration of the other parametrizations of the same test (e.g. the same
+        test on another browser) or, for brand-new tests, the median duration of all the known tests.
+        """
+        per_test: dict[str, list[float]] = {}
+        for nodeid, duration in self.durations.items():
+            per_test.setdefault(PARAMETRIZATION_RE.sub("", nodeid), []).append(duration)
+        median = statistics.median(self.durations.values()) if self.durations else 0.0
+
+        estimates = []
+        for nodeid in nodeids:
+            if nodeid in self.durations:
+                estimates.append(self.durations[nodeid])
+            elif other_parametrizations := per_test.get(PARAMETRIZATION_RE.sub("", nodeid)):
+                estimates.append(statistics.mean(other_parametrizations))
+            else:
+                estimates.append(median)
+        return estimates
+
+
+def plan_shards(estimates: list[float], shard_count: int) -> list[int]:
+    """Assign the tests to shards with about the same expected total duration.
+
+    Longest-processing-time first: the tests are taken slowest first and each goes to the shard with the least
+    expected time. Ties go to the shard with fewer tests, then to the first one, so the plan is the same on every CI
+    node.
+
+    Args:
+        estimates: expected duration of each test, see :meth:`DurationHistory.estimate`.
+        shard_count: number of shards.
+
+    Returns:
+        The index of the shard of each test.
+    """
+    shard_totals = [0.0] * shard_count
+    # Without any history all the estimates are 0, then the tests are spread by count
+    shard_sizes = [0] * shard_count
+    shards = [0] * len(estimates)
+    for index in sorted(range(len(estimates)), key=lambda index: (-estimates[index], index)):
+        shard = min(range(shard_count), key=lambda shard_index: (shard_totals[shard_index], shard_sizes[shard_index]))
+        shards[index] = shard
+        shard_totals[shard] += estimates[index]
+        shard_sizes[shard] += 1
+    return shards
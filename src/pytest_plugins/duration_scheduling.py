@@ -0,0 +1,142 @@
+"""*pytest plugin* - records the test durations and distributes the tests between CI nodes and pytest-xdist
+workers by them.
+
+After each run which shards or schedules the tests by duration, the duration of every test (setup, call and
+teardown) is merged into the history file (``--duration-history``). Options:
+
+* ``--shard i/N`` - run only the i-th (1-based) of N shards with about the same expected total duration. The shards
+  are planned from the tests left after the ``-m``/``-k`` filtering (e.g. ``PYTEST_ENVIRONMENT_SPECIFIC_COMMAND_ARGS``),
+  each browser parametrization being a separate test. The plan is deterministic, so every CI node has to run with the
+  same history file and filters.
+* with ``--dist load`` (the default of ``-n``) the tests are scheduled longest-processing-time first: the slowest
+  tests start first and each worker takes the next slowest test as soon as it is free, so the workers finish at about
+  the same time. Disable it with ``--no-duration-scheduling``.
+* ``--browser-affinity`` - with ``--dist load``, pin each worker to one of ``LOCAL_ONLY_WHICH_BROWSERS_TO_USE``, so the
+  browsers run at the same time on their own workers, see
+  :class:`~src.pytest_plugins.schedulers.BrowserAffinityScheduling`.
+"""
+import re
+from collections import defaultdict
+
+import pytest
+
+from src.config import get_selenium_config
+from src.constants import DURATION_HISTORY_FILE
+from src.pytest_plugins.duration_history import DurationHistory, plan_shards
+from src.pytest_plugins.schedulers import BrowserAffinityScheduling, LongestFirstScheduling
+from src.pytest_plugins.xdist_utils import is_xdist_worker
+
+SHARD_RE = re.compile(r"^(\d+)/(\d+)$")
+
+shard_summary_key = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup("duration-scheduling")
+    group.addoption(
+        "--duration-history",
+        default=DURATION_HISTORY_FILE,
+        help=f"File with the durations of the tests, updated after each run. Defaults to {DURATION_HISTORY_FILE}",
+    )
+    group.addoption(
+        "--shard",
+        default=None,
+        help="Run only the i-th of N shards balanced by the duration history, as `i/N`, e.g. `--shard 2/4`",
+    )
+    group.addoption(
+        "--browser-affinity",
+        action="store_true",
+        default=False,
+        help="Pin each pytest-xdist worker to one of LOCAL_ONLY_WHICH_BROWSERS_TO_USE, the tests of each browser run "
+        "on its own workers",
+    )
+    group.addoption(
+        "--no-duration-scheduling",
+        action="store_true",
+        default=False,
+        help="Do not schedule the tests between pytest-xdist workers by their duration history",
+    )
+
+
+def _parse_shard(shard: str) -> tuple[int, int]:
+    match = SHARD_RE.match(shard)
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise pytest.UsageError(f"--shard must be `i/N` with 1 <= i <= N, got `{shard}`")
+    return int(match.group(1)), int(match.group(2))
+
+
+def pytest_configure(config: pytest.Config):
+    if config.getoption("shard"):
+        _parse_shard(config.getoption("shard"))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    # ``trylast``, so the plan is made from the tests left by the ``-m``/``-k`` filtering
+    if not config.getoption("shard") or not items:
+        return
+
+    shard, shard_count = _parse_shard(config.getoption("shard"))
+    estimates = DurationHistory(config.getoption("duration_history")).estimate(item.nodeid for item in items)
+    shards = plan_shards(estimates, shard_count)
+    selected = [item for item, item_shard in zip(items, shards) if item_shard == shard - 1]
+    deselected = [item for item, item_shard in zip(items, shards) if item_shard != shard - 1]
+    shard_estimate = sum(estimate for estimate, item_shard in zip(estimates, shards) if item_shard == shard - 1)
+    config.stash[shard_summary_key] = (
+        f"shard {shard}/{shard_count}: {len(selected)} of {len(items)} tests, "
+        f"expected {shard_estimate:.0f} s of {sum(estimates):.0f} s"
+    )
+    config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+def pytest_report_collectionfinish(config: pytest.Config) -> list[str]:
+    if shard_summary_key not in config.stash:
+        return []
+    return [config.stash[shard_summary_key]]
+
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_make_scheduler(config: pytest.Config, log):
+    if config.getvalue("dist") != "load":
+        return None
+    history = DurationHistory(config.getoption("duration_history"))
+    if config.getoption("browser_affinity"):
+        if config.getoption("no_duration_scheduling"):
+            # Without any history the tests keep the collection order
+            history.durations = {}
+        browsers = get_selenium_config().LOCAL_ONLY_WHICH_BROWSERS_TO_USE
+        return BrowserAffinityScheduling(config, log, history=history, browsers=browsers)
+    if config.getoption("no_duration_scheduling"):
+        return None
+    return LongestFirstScheduling(config, log, history=history)
+
+
+# Durations of the tests of this run, the controller gets the reports of all the workers
+_durations: dict[str, float] = defaultdict(float)
+_skipped: set[str] = set()
+
+
+def pytest_runtest_logreport(report: pytest.TestReport):
+    if report.skipped:
+        # The duration of a skipped test says nothing about how long it runs
+        _skipped.add(report.nodeid)
+    _durations[report.nodeid] += report.duration
+
+
+def _uses_duration_history(config: pytest.Config) -> bool:
+    if config.getoption("shard"):
+        return True
+    # ``dist`` is only known when pytest-xdist is enabled
+    if config.getoption("dist", "no") != "load":
+        return False
+    return config.getoption("browser_affinity") or not config.getoption("no_duration_scheduling")
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    # Plain runs (e.g. of a single test while developing) do not write the history
+    if is_xdist_worker(session.config) or not _uses_duration_history(session.config):
+        return
+    durations = {nodeid: duration for nodeid, duration in _durations.items() if nodeid not in _skipped}
+    if durations:
+        DurationHistory(session.config.getoption("duration_history")).record(durations)
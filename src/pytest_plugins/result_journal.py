@@ -0,0 +1,107 @@
+"""*pytest plugin* - journal of the results of the tests linked to TestRail cases.
+
+Link a test to its case with the ``testrail_case(case_id)`` marker. With ``--result-journal`` every finished linked
+test is appended as a :class:`~src.report.models.CaseModel` line to ``reports/result-journal/<worker>.jsonl``, see
+:class:`~src.report.journal.ResultJournal`. At the end of the run the controller merges the journals of the workers
+into ``reports/result-journal/report.json`` (the :data:`~src.report.models.IndexedReport` as JSON). The results
+journaled by a worker before it crashed are kept.
+"""
+import json
+import shutil
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from src.constants import REPORTS_FOLDER, RESULT_JOURNAL_FOLDER
+from src.pytest_plugins.xdist_utils import get_worker_id, is_xdist_worker
+from src.report.journal import ResultJournal, merge_journals
+from src.report.models import CaseModel, TestRailStatus, TestRailTestResultModel
+
+REPORT_PATH = Path(REPORTS_FOLDER).joinpath(RESULT_JOURNAL_FOLDER)
+MERGED_REPORT_FILE = "report.json"
+
+phase_reports_key = pytest.StashKey[list[pytest.TestReport]]()
+
+_journal: Optional[ResultJournal] = None
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.getgroup("result-journal").addoption(
+        "--result-journal",
+        action="store_true",
+        default=False,
+        help=f"Journal the results of the tests marked with `testrail_case` into {REPORT_PATH}",
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line("markers", "testrail_case(case_id): id of the TestRail case the test checks")
+
+
+def pytest_sessionstart(session: pytest.Session):
+    if session.config.getoption("result_journal") and not is_xdist_worker(session.config):
+        shutil.rmtree(REPORT_PATH, ignore_errors=True)
+
+
+def _format_elapsed(duration_s: float) -> str:
+    # TestRail rejects an elapsed time of 0
+    minutes, seconds = divmod(max(round(duration_s), 1), 60)
+    return f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
+
+
+def _build_case(item: pytest.Item, case_id: int, reports: list[pytest.TestReport]) -> CaseModel:
+    failed = [report for report in reports if report.failed]
+    if failed:
+        status, comment = TestRailStatus.failed, "\n\n".join(report.longreprtext for report in failed)
+    elif any(report.skipped for report in reports):
+        # TestRail has no "skipped" status, the test could not run
+        skipped = next(report for report in reports if report.skipped)
+        reason = skipped.longrepr[2] if isinstance(skipped.longrepr, tuple) else skipped.longreprtext
+        status, comment = TestRailStatus.blocked, reason
+    else:
+        status, comment = TestRailStatus.passed, ""
+    callspec = getattr(item, "callspec", None)
+    return CaseModel(
+        case_id=case_id,
+        title=getattr(item, "originalname", item.name),
+        parameter_title=callspec.id if callspec else None,
+        test_result=TestRailTestResultModel(
+            status_id=status,
+            test_id=None,
+            elapsed=_format_elapsed(sum(report.duration for report in reports)),
+            comment=comment,
+            custom_step_results=[],
+        ),
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    global _journal
+    outcome = yield
+    marker = item.get_closest_marker("testrail_case")
+    if not item.config.getoption("result_journal") or marker is None:
+        return
+
+    reports = item.stash.setdefault(phase_reports_key, [])
+    reports.append(outcome.get_result())
+    if call.when != "teardown":
+        return
+    if _journal is None:
+        _journal = ResultJournal(REPORT_PATH.joinpath(f"{get_worker_id()}.jsonl"))
+    _journal.append(_build_case(item, marker.args[0], reports))
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    if _journal is not None:
+        _journal.close()
+    if not session.config.getoption("result_journal") or is_xdist_worker(session.config):
+        return
+
+    # The controller finishes after all the workers, so it merges their journals
+    report = merge_journals(sorted(REPORT_PATH.glob("*.jsonl")))
+    REPORT_PATH.mkdir(parents=True, exist_ok=True)
+    REPORT_PATH.joinpath(MERGED_REPORT_FILE).write_text(
+        json.dumps({case_id: [json.loads(case.json()) for case in cases] for case_id, cases in report.items()})
+    )
@@ -0,0 +1,203 @@
+"""*pytest plugin* - retries the tests which failed because of the infrastructure, on a fresh ``WebDriver`` session.
+
+Failures are classified by :func:`classify_failure`. Assertion and product failures (element not found, wrong text...)
+are never retried - they would fail again. Infrastructure failures (the browser session is lost, the driver is not
+reachable, a navigation timed out) are retried up to ``RETRY_NUMBER`` tries, after the ``driver`` fixture replaced the
+broken session (see ``request.node.replace_driver``). The time spent on the failed tries and the delays of the whole
+run is bounded by ``RETRY_TIME_BUDGET_S``. The fixtures built on the driver must get it from
+``request.node.driver`` when they use it (like ``data_seeder``), so they follow the replaced session.
+
+The retries of each test are added to its ``user_properties`` (so they end up in the JUnit XML as well), and summed up
+at the end of the run.
+"""
+import functools
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Callable, Literal, Optional
+
+import pytest
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    SessionNotCreatedException,
+    TimeoutException,
+    WebDriverException,
+)
+from urllib3.exceptions import HTTPError as DriverConnectionError
+
+from src.config import get_selenium_config
+from src.constants import RETRY_BUDGET_FILE
+from src.logger import logger
+from src.utils import file_lock
+
+FailureKind = Literal["infrastructure", "product"]
+
+# Messages of ``WebDriverException`` raised when the browser or its session is gone
+INFRASTRUCTURE_ERROR_MESSAGES = (
+    "session deleted",
+    "not reachable",
+    "disconnected",
+    "tab crashed",
+    "page crash",
+    "browsing context has been discarded",
+    "failed to decode response from marionette",
+    "invalid session id",
+)
+# ``WebDriver`` methods which navigate, a ``TimeoutException`` raised in them is a page load timeout
+NAVIGATION_METHODS = {"get", "refresh", "back", "forward"}
+
+RETRIES_PROPERTY = "infrastructure_retries"
+WASTED_TIME_PROPERTY = "retry_wasted_s"
+
+
+def _is_navigation_timeout(traceback: Optional[TracebackType]) -> bool:
+    while traceback is not None:
+        code = traceback.tb_frame.f_code
+        if code.co_name in NAVIGATION_METHODS and code.co_filename.endswith(os.path.join("remote", "webdriver.py")):
+            return True
+        traceback = traceback.tb_next
+    return False
+
+
+def classify_failure(exception: BaseException) -> FailureKind:
+    """Tell whether the test failed because of the infrastructure or of the product (the test assertions).
+
+    The whole chain of the exception (``raise ... from ...``) is considered.
+    """
+    current: Optional[BaseException] = exception
+    while current is not None:
+        if isinstance(current, (InvalidSessionIdException, SessionNotCreatedException, DriverConnectionError)):
+            return "infrastructure"
+        if isinstance(current, TimeoutException) and _is_navigation_timeout(current.__traceback__):
+            return "infrastructure"
+        if (
+            isinstance(current, WebDriverException)
+            and not isinstance(current, TimeoutException)
+            and any(message in (current.msg or "").lower() for message in INFRASTRUCTURE_ERROR_MESSAGES)
+        ):
+            return "infrastructure"
+        current = current.__cause__ or current.__context__
+    return "product"
+
+
+class RetryBudget:
+    """Time the run may spend on retries, shared by the pytest-xdist workers through a file guarded by a lock.
+
+    Args:
+        budget_s: total time in seconds.
+    """
+
+    def __init__(self, budget_s: float):
+        self.budget_s = budget_s
+        self._spent_s = 0.0
+        # Set by pytest-xdist for each worker, the same value for all the workers of one run
+        self._run_uid = os.getenv("PYTEST_XDIST_TESTRUNUID")
+        self._path = Path(tempfile.gettempdir()).joinpath(RETRY_BUDGET_FILE)
+
+    def try_spend(self, seconds: float) -> bool:
+        """Account ``seconds`` to the budget, if they fit.
+
+        Returns:
+            Whether the budget allowed it.
+        """
+        if not self._run_uid:
+            if self._spent_s + seconds > self.budget_s:
+                return False
+            self._spent_s += seconds
+            return True
+
+        with file_lock(f"{self._path}.lock"):
+            state = json.loads(self._path.read_text()) if self._path.exists() else {}
+            if state.get("run_uid") != self._run_uid:
+                state = {"run_uid": self._run_uid, "spent_s": 0.0}
+            if state["spent_s"] + seconds > self.budget_s:
+                return False
+            state["spent_s"] += seconds
+            self._path.write_text(json.dumps(state))
+        return True
+
+
+_budget: Optional[RetryBudget] = None
+
+
+def _get_budget() -> RetryBudget:
+    global _budget
+    if _budget is None:
+        _budget = RetryBudget(get_selenium_config().RETRY_TIME_BUDGET_S)
+    return _budget
+
+
+def _with_infrastructure_retries(
+    item: pytest.Function, test_function: Callable, tries: int, delay_s: float
+) -> Callable:
+    @functools.wraps(test_function)
+    def wrapper(**kwargs):
+        retries = 0
+        wasted_s = 0.0
+        try:
+            while True:
+                start = time.monotonic()
+                try:
+                    return test_function(**kwargs)
+                except Exception as e:
+                    failed_try_s = time.monotonic() - start
+                    if retries + 1 >= tries or classify_failure(e) != "infrastructure" or "driver" not in kwargs:
+                        raise
+                    if not _get_budget().try_spend(failed_try_s + delay_s):
+                        logger.warning("Retry time budget is spent, not retrying %s", item.nodeid)
+                        raise
+                    retries += 1
+                    wasted_s += failed_try_s + delay_s
+                    logger.warning(
+                        "Infrastructure failure in %s, retry %d on a fresh driver: %r", item.nodeid, retries, e
+                    )
+                    time.sleep(delay_s)
+                    kwargs["driver"] = item.replace_driver(kwargs["driver"])  # type: ignore[attr-defined]
+        finally:
+            if retries:
+                item.user_properties.append((RETRIES_PROPERTY, retries))
+                item.user_properties.append((WASTED_TIME_PROPERTY, round(wasted_s, 3)))
+
+    return wrapper
+
+
+def pytest_runtest_call(item: pytest.Item):
+    """Wraps the test function, to retry it after the infrastructure failures.
+
+    Does **not** retry if pytest is running on **local machine**.
+    """
+    selenium_config = get_selenium_config()
+    if (
+        selenium_config.RETRY_NUMBER
+        and selenium_config.SELENIUM_PROVIDER != "local"
+        and isinstance(item, pytest.Function)
+        and hasattr(item, "replace_driver")
+    ):
+        item.obj = _with_infrastructure_retries(
+            item, item.obj, tries=selenium_config.RETRY_NUMBER, delay_s=selenium_config.DELAY_BETWEEN_RETRIES_S
+        )
+
+
+# Retries of the run by node id, the controller gets the reports of all the workers
+_retries: dict[str, tuple[int, float]] = {}
+
+
+def pytest_runtest_logreport(report: pytest.TestReport):
+    properties = dict(report.user_properties)
+    if report.when == "call" and RETRIES_PROPERTY in properties:
+        _retries[report.nodeid] = (properties[RETRIES_PROPERTY], properties[WASTED_TIME_PROPERTY])
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _retries:
+        return
+    terminalreporter.section("infrastructure retries")
+    for nodeid, (retries, wasted_s) in sorted(_retries.items()):
+        terminalreporter.write_line(f"{nodeid}: {retries} retries, {wasted_s:.1f} s wasted")
+    terminalreporter.write_line(
+        f"{sum(retries for retries, _ in _retries.values())} retries in {len(_retries)} tests, "
+        f"{sum(wasted_s for _, wasted_s in _retries.values()):.1f} s wasted"
+    )
@@ -0,0 +1,148 @@
+"""pytest-xdist schedulers of :mod:`src.pytest_plugins.duration_scheduling`."""
+import re
+from typing import Optional
+
+import pytest
+from xdist.scheduler import LoadScheduling
+
+from src.logger import logger
+from src.pytest_plugins.duration_history import DurationHistory
+
+# A worker needs the next test queued to run the current one
+TESTS_QUEUED_PER_WORKER = 2
+
+# Parameter ids of a node id, e.g. ``chrome`` and ``admin`` of ``test_login.py::test_login[chrome-admin]``
+PARAMETER_IDS_RE = re.compile(r"\[(.*)\]$")
+
+
+class LongestFirstScheduling(LoadScheduling):
+    """``LoadScheduling`` with the pending tests sorted by expected duration, longest first.
+
+    Each worker only holds the tests it runs next, the rest stays in the global queue, so whichever worker frees up
+    first takes the next slowest test.
+    """
+
+    def __init__(self, config: pytest.Config, log, history: DurationHistory):
+        super().__init__(config, log)
+        self.history = history
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(self.node2collection.values())[0]
+        estimates = self.history.estimate(self.collection)
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda index: estimates[index], reverse=True)
+        logger.info(
+            "Scheduling %d tests longest first, %d of them without duration history",
+            len(self.collection),
+            sum(nodeid not in self.history.durations for nodeid in self.collection),
+        )
+
+        # Round-robin, so the slowest tests start on different workers
+        for _ in range(TESTS_QUEUED_PER_WORKER):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration: float = 0):
+        if node.shutting_down:
+            return
+
+        if self.pending:
+            self._send_tests(node, TESTS_QUEUED_PER_WORKER - len(self.node2pending[node]))
+        else:
+            node.shutdown()
+
+
+class BrowserAffinityScheduling(LongestFirstScheduling):
+    """Each worker runs the tests of one browser only, the workers are split evenly between the browsers.
+
+    Every worker then only starts its own browser type, with warm driver pool and binary caches. With fewer workers
+    than browsers, a worker gets several browsers. Tests without a browser run on any worker. If all the workers of a
+    browser are gone (e.g. crashed), the other workers take its tests.
+
+    Args:
+        browsers: browser names, as used in the ``driver`` fixture parameters.
+    """
+
+    def __init__(self, config: pytest.Config, log, history: DurationHistory, browsers: list[str]):
+        super().__init__(config, log, history)
+        self.browsers = browsers
+        self.node2browsers: dict = {}
+        self._test_browsers: Optional[list[Optional[str]]] = None
+
+    def _get_browser(self, nodeid: str) -> Optional[str]:
+        match = PARAMETER_IDS_RE.search(nodeid)
+        if not match:
+            return None
+        return next((browser for browser in self.browsers if browser in match.group(1).split("-")), None)
+
+    def _assign_browsers(self):
+        self._test_browsers = [self._get_browser(nodeid) for nodeid in self.collection]
+        browsers = [browser for browser in self.browsers if browser in self._test_browsers]
+        nodes = sorted(self.nodes, key=lambda node: node.gateway.id)
+        if not browsers:
+            return
+        if len(nodes) >= len(browsers):
+            for index, node in enumerate(nodes):
+                self.node2browsers[node] = {browsers[index % len(browsers)]}
+        else:
+            for index, browser in enumerate(browsers):
+                self.node2browsers.setdefault(nodes[index % len(nodes)], set()).add(browser)
+        assignments = (
+            f"{node.gateway.id}={'/'.join(sorted(node_browsers))}" for node, node_browsers in self.node2browsers.items()
+        )
+        logger.info("Browser affinity: %s", ", ".join(assignments))
+
+    def _is_allowed(self, node, index: int) -> bool:
+        browser = self._test_browsers[index]  # type: ignore[index]
+        if browser is None or browser in self.node2browsers.get(node, ()):
+            return True
+        # Nobody else can run it anymore
+        return not any(
+            browser in browsers and other_node in self.node2pending and not other_node.shutting_down
+            for other_node, browsers in self.node2browsers.items()
+        )
+
+    def schedule(self):
+        super().schedule()
+        if self._test_browsers is not None:
+            # Workers which got no test, because their browser has none, are shut down once nothing is pending
+            for node in self.nodes:
+                self.check_schedule(node)
+
+    def _send_tests(self, node, num: int):
+        if self._test_browsers is None:
+            self._assign_browsers()
+        tests_per_node = [index for index in self.pending if self._is_allowed(node, index)][: max(num, 0)]
+        if tests_per_node:
+            for index in tests_per_node:
+                self.pending.remove(index)
+            self.node2pending[node].extend(tests_per_node)
+            node.send_runtest_some(tests_per_node)
+
+    def check_schedule(self, node, duration: float = 0):
+        if node.shutting_down:
+            return
+
+        if self._test_browsers is None:
+            self._assign_browsers()
+        if any(self._is_allowed(node, index) for index in self.pending):
+            self._send_tests(node, TESTS_QUEUED_PER_WORKER - len(self.node2pending[node]))
+        elif not self.pending:
+            # The idle workers are kept until then, to take over the tests of a browser whose workers all crashed
+            # (``remove_node`` re-checks the schedule of every worker)
+            for other_node, node_pending in self.node2pending.items():
+                if not node_pending and not other_node.shutting_down:
+                    other_node.shutdown()
@@ -0,0 +1,82 @@
+"""*pytest plugin* - timeline of the test phases in Chrome trace-event format.
+
+With ``--trace-timeline`` every test is split into spans: setup (driver creation, login...), the test body and
+teardown (failure screenshot, driver ``close``/``quit``), plus the spans of the functions decorated with
+:func:`~src.instrumentation.tracing.traced`. Each pytest-xdist worker is a separate track. The files of the workers
+are merged into ``reports/timeline/trace.json``, open it in `Perfetto <https://ui.perfetto.dev>`_.
+"""
+import json
+import re
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.constants import REPORTS_FOLDER, TIMELINE_REPORT_FOLDER
+from src.instrumentation.tracing import TRACER
+from src.pytest_plugins.xdist_utils import get_worker_id, is_xdist_worker
+
+REPORT_PATH = Path(REPORTS_FOLDER).joinpath(TIMELINE_REPORT_FOLDER)
+TRACE_FILE = "trace.json"
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.getgroup("timeline").addoption(
+        "--trace-timeline",
+        action="store_true",
+        default=False,
+        help=f"Write the timeline of the test phases into {REPORT_PATH.joinpath(TRACE_FILE)}",
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    if not config.getoption("trace_timeline"):
+        return
+    TRACER.enabled = True
+    worker_number = re.search(r"\d+$", get_worker_id())
+    TRACER.tid = int(worker_number.group()) + 1 if worker_number else 0
+
+
+def pytest_sessionstart(session: pytest.Session):
+    if session.config.getoption("trace_timeline") and not is_xdist_worker(session.config):
+        shutil.rmtree(REPORT_PATH, ignore_errors=True)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item):
+    with TRACER.span(item.nodeid, category="test"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item: pytest.Item):
+    with TRACER.span("setup", category="phase"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    with TRACER.span("test body", category="phase"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: pytest.Item):
+    with TRACER.span("teardown", category="phase"):
+        yield
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    if not session.config.getoption("trace_timeline"):
+        return
+
+    REPORT_PATH.mkdir(parents=True, exist_ok=True)
+    events = [TRACER.thread_name_event(get_worker_id()), *TRACER.events]
+    REPORT_PATH.joinpath(f"{get_worker_id()}.json").write_text(json.dumps(events))
+    if not is_xdist_worker(session.config):
+        # The controller finishes after all the workers, so it merges their files
+        trace_events = []
+        for worker_file in sorted(REPORT_PATH.glob("*.json")):
+            if worker_file.name != TRACE_FILE:
+                trace_events.extend(json.loads(worker_file.read_text()))
+        REPORT_PATH.joinpath(TRACE_FILE).write_text(json.dumps({"traceEvents": trace_events}))
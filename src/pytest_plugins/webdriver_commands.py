@@ -0,0 +1,135 @@
+"""*pytest plugin* - per-test and per-run report of the WebDriver commands.
+
+Every ``driver`` given to the tests is instrumented, see :mod:`src.instrumentation.commands`. Options:
+
+* ``--webdriver-commands-report`` - write the JSON summary of the commands (count, p50/p95 latency, slowest call
+  sites) per test and per run into ``reports/webdriver-commands/run.json``
+* ``--webdriver-command-budget=N`` - fail the tests which sent more than ``N`` commands. Can be set per test with
+  the ``webdriver_command_budget(N)`` marker
+"""
+import json
+import shutil
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from _pytest.fixtures import FixtureDef
+from selenium.webdriver import Remote
+
+from src.constants import REPORTS_FOLDER, WEBDRIVER_COMMANDS_REPORT_FOLDER
+from src.instrumentation.commands import COMMAND_RECORDER, CommandRecord, instrument_driver, summarize
+from src.pytest_plugins.xdist_utils import get_worker_id, is_xdist_worker
+
+REPORT_PATH = Path(REPORTS_FOLDER).joinpath(WEBDRIVER_COMMANDS_REPORT_FOLDER)
+RUN_REPORT_FILE = "run.json"
+
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup("webdriver-commands")
+    group.addoption(
+        "--webdriver-commands-report",
+        action="store_true",
+        default=False,
+        help="Write per-test and per-run summary of the WebDriver commands into "
+        f"{REPORT_PATH.joinpath(RUN_REPORT_FILE)}",
+    )
+    group.addoption(
+        "--webdriver-command-budget",
+        type=int,
+        default=None,
+        help="Fail the tests which sent more WebDriver commands than this",
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line(
+        "markers", "webdriver_command_budget(n): fail the test if it sent more than n WebDriver commands"
+    )
+
+
+def _is_enabled(config: pytest.Config) -> bool:
+    return config.getoption("webdriver_commands_report") or config.getoption("webdriver_command_budget") is not None
+
+
+def _get_budget(item: pytest.Item) -> Optional[int]:
+    marker = item.get_closest_marker("webdriver_command_budget")
+    if marker:
+        return marker.args[0]
+    return item.config.getoption("webdriver_command_budget")
+
+
+def pytest_sessionstart(session: pytest.Session):
+    if session.config.getoption("webdriver_commands_report") and not is_xdist_worker(session.config):
+        shutil.rmtree(REPORT_PATH, ignore_errors=True)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item):
+    COMMAND_RECORDER.current_test = item.nodeid
+    yield
+    COMMAND_RECORDER.current_test = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef: FixtureDef, request: pytest.FixtureRequest):
+    outcome = yield
+    if fixturedef.argname != "driver" or not _is_enabled(request.config) or outcome.excinfo is not None:
+        return
+
+    # Payload sizes and call sites are only needed by the report, a budget only counts the commands
+    detailed = request.config.getoption("webdriver_commands_report")
+    instrument_driver(outcome.get_result(), detailed=detailed)
+    replace_driver = getattr(request.node, "replace_driver", None)
+    if replace_driver is None:
+        return
+
+    def replace_instrumented(broken_driver: Remote) -> Remote:
+        # The session swapped in by an infrastructure retry is instrumented too, see :mod:`src.pytest_plugins.retries`
+        new_driver = replace_driver(broken_driver)
+        instrument_driver(new_driver, detailed=detailed)
+        return new_driver
+
+    request.node.replace_driver = replace_instrumented
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    report: pytest.TestReport = outcome.get_result()
+    budget = _get_budget(item)
+    if report.when != "call" or not report.passed or budget is None:
+        return
+
+    # Commands sent by the fixtures during setup count as well
+    commands = COMMAND_RECORDER.count(item.nodeid)
+    if commands > budget:
+        report.outcome = "failed"
+        report.longrepr = f"Test sent {commands} WebDriver commands, the budget is {budget}"
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    if not session.config.getoption("webdriver_commands_report"):
+        return
+
+    REPORT_PATH.mkdir(parents=True, exist_ok=True)
+    REPORT_PATH.joinpath(f"{get_worker_id()}.json").write_text(
+        json.dumps({test: [list(record) for record in records] for test, records in COMMAND_RECORDER.records.items()})
+    )
+    if not is_xdist_worker(session.config):
+        # The controller finishes after all the workers, so it merges their files
+        _write_run_report()
+
+
+def _write_run_report():
+    tests: dict[str, list[CommandRecord]] = {}
+    for worker_file in REPORT_PATH.glob("*.json"):
+        if worker_file.name == RUN_REPORT_FILE:
+            continue
+        for test, records in json.loads(worker_file.read_text()).items():
+            tests.setdefault(test, []).extend(CommandRecord(*record) for record in records)
+
+    run_report = {
+        "run": summarize(record for records in tests.values() for record in records).dict(),
+        "tests": {test: summarize(records).dict() for test, records in sorted(tests.items())},
+    }
+    REPORT_PATH.joinpath(RUN_REPORT_FILE).write_text(json.dumps(run_report, indent=2))
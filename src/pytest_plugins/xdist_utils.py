@@ -0,0 +1,17 @@
+"""Helpers for plugins which behave differently on pytest-xdist workers and on the controller."""
+import os
+
+import pytest
+
+
+def is_xdist_worker(config: pytest.Config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def is_xdist_controller(config: pytest.Config) -> bool:
+    return not is_xdist_worker(config) and getattr(config.option, "dist", "no") != "no"
+
+
+def get_worker_id() -> str:
+    """Id of the current pytest-xdist worker (``gw0``, ``gw1``...), ``main`` when running without xdist."""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
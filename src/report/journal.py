@@ -0,0 +1,88 @@
+"""Journal of the test results: one :class:`~src.report.models.CaseModel` JSON line per finished test.
+
+Each pytest-xdist worker appends to its own file, so no locking is needed. Every line is flushed to the OS right away
+(it survives a crash of the worker process) and the file is ``fsync``-ed in batches (to survive a crash of the
+machine without paying an ``fsync`` per test). The journals are merged into an
+:data:`~src.report.models.IndexedReport` line by line, a line cut by a crash is skipped.
+"""
+import os
+import time
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional
+
+from pydantic import ValidationError
+
+from src.constants import RESULT_JOURNAL_FSYNC_EVERY, RESULT_JOURNAL_FSYNC_INTERVAL_S
+from src.logger import logger
+from src.report.models import CaseModel, IndexedReport
+
+
+class ResultJournal:
+    """Append-only journal of the results of one process.
+
+    Args:
+        path: path of the journal file, appended to if it exists (e.g. a restarted worker).
+        fsync_every: ``fsync`` after this many results.
+        fsync_interval_s: ``fsync`` when a result comes this many seconds after the last ``fsync``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        fsync_every: int = RESULT_JOURNAL_FSYNC_EVERY,
+        fsync_interval_s: float = RESULT_JOURNAL_FSYNC_INTERVAL_S,
+    ):
+        self.path = Path(path)
+        self.fsync_every = fsync_every
+        self.fsync_interval_s = fsync_interval_s
+        self._file: Optional[IO[str]] = None
+        self._not_synced = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, case: CaseModel):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(f"{case.json()}\n")
+        self._file.flush()
+        self._not_synced += 1
+        if self._not_synced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval_s:
+            self.sync()
+
+    def sync(self):
+        if self._file is None or not self._not_synced:
+            return
+        os.fsync(self._file.fileno())
+        self._not_synced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        if self._file is None:
+            return
+        self.sync()
+        self._file.close()
+        self._file = None
+
+
+def read_journal(path: str | Path) -> Iterator[CaseModel]:
+    """Stream the results of a journal, skipping the lines which are cut or corrupted."""
+    with open(path, encoding="utf-8") as journal_file:
+        for line_number, line in enumerate(journal_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield CaseModel.parse_raw(line)
+            except ValidationError:
+                logger.warning("Skipping corrupted line %d of the result journal %s", line_number, path)
+
+
+def merge_journals(paths: Iterable[str | Path]) -> IndexedReport:
+    """Merge the journals of the workers into the results grouped by ``case_id``.
+
+    The journals are read one line at a time, only the merged report is kept in memory.
+    """
+    report = IndexedReport(list)
+    for path in paths:
+        for case in read_journal(path):
+            report[case.case_id].append(case)
+    return report
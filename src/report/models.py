@@ -1,4 +1,5 @@
 from collections import defaultdict
+from enum import IntEnum
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -11,6 +12,16 @@ class RunModel(BaseModel):
     )
 
 
+class TestRailStatus(IntEnum):
+    """Ids of the TestRail system statuses of a test result."""
+
+    passed = 1
+    blocked = 2
+    untested = 3
+    retest = 4
+    failed = 5
+
+
 class CustomStepResult(BaseModel):
     content: str
     expected: str
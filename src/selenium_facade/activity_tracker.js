@@ -0,0 +1,60 @@
+(function () {
+  if (window.__seleniumActivity) {
+    return;
+  }
+
+  var activity = {
+    inflight: 0,
+    lastNetwork: Date.now(),
+    lastMutation: Date.now(),
+    resources: window.performance && performance.getEntriesByType ? performance.getEntriesByType("resource").length : 0,
+  };
+  window.__seleniumActivity = activity;
+
+  function requestStarted() {
+    activity.inflight += 1;
+    activity.lastNetwork = Date.now();
+  }
+
+  function requestFinished() {
+    activity.inflight = Math.max(0, activity.inflight - 1);
+    activity.lastNetwork = Date.now();
+  }
+
+  if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function () {
+      requestStarted();
+      return originalFetch.apply(this, arguments).then(
+        function (response) {
+          requestFinished();
+          return response;
+        },
+        function (error) {
+          requestFinished();
+          throw error;
+        }
+      );
+    };
+  }
+
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    requestStarted();
+    this.addEventListener("loadend", requestFinished);
+    return originalSend.apply(this, arguments);
+  };
+
+  function observeMutations() {
+    new MutationObserver(function () {
+      activity.lastMutation = Date.now();
+    }).observe(document.documentElement, { childList: true, subtree: true, attributes: true, characterData: true });
+  }
+
+  // When injected before the document is parsed there is no root element to observe yet
+  if (document.documentElement) {
+    observeMutations();
+  } else {
+    document.addEventListener("DOMContentLoaded", observeMutations);
+  }
+})();
@@ -0,0 +1,75 @@
+"""Counts the WebDriver commands (HTTP round trips to the driver) made by each ``DriverFacade`` call."""
+import functools
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class CallCommandStats(BaseModel):
+    calls: int = 0
+    commands: int = 0
+
+
+class CommandCounter:
+    """Counter of the commands sent by one driver.
+
+    ``WebElement`` commands are sent through the driver as well, so they are counted too.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.per_call: dict[str, CallCommandStats] = {}
+        self.last_call: Optional[tuple[str, int]] = None
+        self._active_call: Optional[str] = None
+
+
+def get_command_counter(driver: WebDriver) -> CommandCounter:
+    """Get the command counter of the driver, installing it on the first call."""
+    counter: Optional[CommandCounter] = vars(driver).get("_command_counter")
+    if counter is not None:
+        return counter
+
+    counter = CommandCounter()
+    original_execute = driver.execute
+
+    @functools.wraps(original_execute)
+    def execute(driver_command: str, params: Optional[dict] = None) -> dict:
+        counter.total += 1
+        return original_execute(driver_command, params)
+
+    setattr(driver, "execute", execute)
+    setattr(driver, "_command_counter", counter)
+    return counter
+
+
+def _count_commands(name: str, method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs) -> Any:
+        counter = get_command_counter(self.driver)
+        if counter._active_call is not None:
+            # Nested facade call, the commands are accounted to the outermost one
+            return method(self, *args, **kwargs)
+
+        counter._active_call = name
+        total_before = counter.total
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            counter._active_call = None
+            commands = counter.total - total_before
+            stats = counter.per_call.setdefault(name, CallCommandStats())
+            stats.calls += 1
+            stats.commands += commands
+            counter.last_call = (name, commands)
+
+    return wrapper
+
+
+def count_commands_per_call(cls: type) -> type:
+    """Class decorator: count the commands made by every public method of a class with a ``driver`` attribute."""
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not callable(member):
+            continue
+        setattr(cls, name, _count_commands(name, member))
+    return cls
@@ -0,0 +1,8 @@
+// Requires locate.js to be prepended.
+// Counts the matches of each ``[by, query]`` locator in one round trip.
+var locators = arguments[0];
+var root = arguments[1];
+
+return locators.map(function (locator) {
+  return locateAll(locator[0], locator[1], root).length;
+});
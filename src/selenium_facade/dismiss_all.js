@@ -0,0 +1,14 @@
+// Requires locate.js to be prepended.
+// Clicks every displayed match in one round trip, returns how many were clicked.
+var by = arguments[0];
+var query = arguments[1];
+var root = arguments[2];
+
+var dismissed = 0;
+locateAll(by, query, root).forEach(function (element) {
+  if (isDisplayed(element)) {
+    element.click();
+    dismissed += 1;
+  }
+});
+return dismissed;
@@ -1,41 +1,85 @@
 import json
-import os
 import re
 import time
 from pathlib import Path
 from re import Pattern
-from typing import Any, Optional, Type, Union
+from typing import Any, Callable, Optional, Sequence, Type, Union
 from urllib.parse import unquote, urlencode, urljoin, urlsplit
 
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import ElementClickInterceptedException, JavascriptException, TimeoutException
 from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
-from selenium.webdriver.support.wait import WebDriverWait
-
-from src.constants import DEFAULT_TIMEOUT_S, SCREENSHOTS_FOLDER
-
 
+from src.constants import (
+    ASYNC_SCRIPT_CHUNK_S,
+    AUTH_TOKEN_COOKIE,
+    DEFAULT_TIMEOUT_S,
+    DOM_QUIET_WINDOW_S,
+    NETWORK_QUIET_WINDOW_S,
+    SCREENSHOTS_FOLDER,
+    SETTLE_TIMEOUT_S,
+)
+from src.logger import logger
+from src.selenium_facade.command_counter import CallCommandStats, count_commands_per_call, get_command_counter
+from src.selenium_facade.element_cache import ElementCache, ElementCacheKey
+from src.selenium_facade.element_waits import DEFAULT_WAIT_SETTINGS, ElementWaiter, WaitCondition, WaitSettings
+from src.selenium_facade.models import ElementSnapshot
+from src.selenium_facade.script_registry import SCRIPT_REGISTRY
+
+
+@count_commands_per_call
 class DriverFacade:
     """Facade to ease the usage of the driver.
 
     Preferably
     `use naming from Selenium IDE <https://www.selenium.dev/selenium-ide/docs/en/api/commands>`_
     when creating new methods. All the low-level Selenium stuff should be implemented here
+
+    Every public method counts the WebDriver commands it made, see :attr:`command_stats`.
     """
 
     # Selenium IDE commands reference: https://www.selenium.dev/selenium-ide/docs/en/api/commands
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: WebDriver, wait_settings: WaitSettings = DEFAULT_WAIT_SETTINGS):
+        """
+        Args:
+            driver: Selenium ``WebDriver``.
+            wait_settings: how the ``wait_for_*`` methods wait, can be overridden per call.
+        """
         self.driver = driver
-
-    def wait_for_element_present(self, element_query: str, find_by: str = By.XPATH, timeout_s: Optional[float] = None):
+        self._waiter = ElementWaiter(driver, wait_settings)
+        self._command_counter = get_command_counter(driver)
+        self.element_cache = ElementCache()
+        # Frames entered with `switch_to_iframe`, part of the element cache key
+        self._frame_path: list[tuple[str, str]] = []
+
+    @property
+    def command_stats(self) -> dict[str, CallCommandStats]:
+        """Number of calls and WebDriver commands made by each facade method, for all facades of the driver."""
+        return self._command_counter.per_call
+
+    @property
+    def last_call_commands(self) -> Optional[tuple[str, int]]:
+        """Name of the last facade method called and the number of WebDriver commands it made."""
+        return self._command_counter.last_call
+
+    def wait_for_element_present(
+        self,
+        element_query: str,
+        find_by: str = By.XPATH,
+        timeout_s: Optional[float] = None,
+        wait_settings: Optional[WaitSettings] = None,
+    ):
         """Wait for a target element to be present on the page."""
         timeout = timeout_s or DEFAULT_TIMEOUT_S
-        WebDriverWait(self.driver, timeout=timeout).until(
-            ec.presence_of_element_located((find_by, element_query)),
-            f'could not detect element with: "[{find_by}] `{element_query}`"',
+        self._waiter.until_present(
+            element_query,
+            find_by,
+            timeout_s=timeout,
+            message=f'could not detect element with: "[{find_by}] `{element_query}`"',
+            settings=wait_settings,
         )
 
     def wait_for_cookie_present(self, cookie_name: str, timeout_s: float = DEFAULT_TIMEOUT_S) -> bool:
@@ -50,23 +94,213 @@ class DriverFacade:
                 continue
             return True
 
-    def wait_for_element_not_present(self, element_query: str, find_by: str = By.XPATH, timeout_s: float = DEFAULT_TIMEOUT_S):
+    def install_activity_tracker(self):
+        """Inject the script which counts in-flight fetch/XHR requests and watches DOM mutations.
+
+        On Chromium browsers the script is registered to run before any page script on every new document, so
+        requests started while the page loads are counted too. Elsewhere it is injected on the first wait.
+        """
+        if getattr(self.driver, "_activity_tracker_installed", False):
+            return
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": SCRIPT_REGISTRY.source("activity_tracker")})
+        setattr(self.driver, "_activity_tracker_installed", True)
+
+    def wait_for_network_idle(
+        self, quiet_window_s: float = NETWORK_QUIET_WINDOW_S, timeout_s: float = DEFAULT_TIMEOUT_S
+    ):
+        """Wait until the page has no fetch/XHR request in flight for ``quiet_window_s`` seconds."""
+        self._wait_for_idle("network", quiet_window_s=quiet_window_s, timeout_s=timeout_s)
+
+    def wait_for_dom_quiescent(self, quiet_window_s: float = DOM_QUIET_WINDOW_S, timeout_s: float = DEFAULT_TIMEOUT_S):
+        """Wait until the DOM of the page is not mutated for ``quiet_window_s`` seconds."""
+        self._wait_for_idle("dom", quiet_window_s=quiet_window_s, timeout_s=timeout_s)
+
+    def _wait_for_idle(self, kind: str, quiet_window_s: float, timeout_s: float):
+        self.install_activity_tracker()
+        settings = self._waiter.settings
+        deadline = time.time() + timeout_s
+        inflight = 0
+        retry_delay_s = settings.initial_poll_s
+        while time.time() < deadline:
+            chunk_s = min(deadline - time.time(), ASYNC_SCRIPT_CHUNK_S)
+            try:
+                result = SCRIPT_REGISTRY.execute_async(
+                    self.driver, "wait_for_idle", kind, int(quiet_window_s * 1000), int(chunk_s * 1000)
+                )
+            except JavascriptException:
+                # The page navigated while waiting, the tracker is injected again into the new document. Back off,
+                # so a page which keeps navigating (or breaks the script) is not flooded with commands
+                time.sleep(max(min(retry_delay_s, deadline - time.time()), 0))
+                retry_delay_s = min(retry_delay_s * settings.poll_backoff, settings.max_poll_s)
+                continue
+            if result["idle"]:
+                return
+            inflight = result["inflight"]
+
+        raise TimeoutException(f"page did not become {kind} idle in {timeout_s} s, {inflight} requests in flight")
+
+    def wait_for_element_not_present(
+        self,
+        element_query: str,
+        find_by: str = By.XPATH,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        wait_settings: Optional[WaitSettings] = None,
+    ):
         """Wait for a target element to not be present on the page."""
-        WebDriverWait(self.driver, timeout_s).until(
-            ec.invisibility_of_element_located((find_by, element_query)), f"element {element_query} is still present."
+        self._waiter.until_absent(
+            element_query,
+            find_by,
+            timeout_s=timeout_s,
+            message=f"element {element_query} is still present.",
+            settings=wait_settings,
+        )
+
+    def wait_for_any(
+        self,
+        conditions: Sequence[WaitCondition],
+        failures: Sequence[WaitCondition] = (),
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        error_msg: Optional[str] = None,
+        wait_settings: Optional[WaitSettings] = None,
+    ) -> list[WaitCondition]:
+        """Wait for any of the conditions, failing fast when any of the failure sentinels fires.
+
+        Dummy example of usage:
+
+        .. code-block:: python
+
+           driver_facade.wait_for_any(
+               [WaitCondition.element("//div[@id='groups']")],
+               failures=[WaitCondition.element('//*[@data-testid="toast-error"]', name="error toast")],
+           )
+
+        Args:
+            conditions: success conditions, see :class:`~src.selenium_facade.element_waits.WaitCondition`.
+            failures: failure sentinels, e.g. error toasts or error pages.
+            timeout_s: timeout in seconds to wait for the success conditions.
+            error_msg: custom error message to be shown.
+
+        Returns:
+            The conditions which are met.
+
+        Raises:
+            FailureSentinelFired: naming the sentinel which fired.
+        """
+        names = ", ".join(condition.name for condition in conditions)
+        return self._waiter.until_conditions(
+            conditions,
+            failures,
+            mode="any",
+            timeout_s=timeout_s,
+            message=error_msg or f"none of {names} happened in {timeout_s} s",
+            settings=wait_settings,
+        )
+
+    def wait_for_all(
+        self,
+        conditions: Sequence[WaitCondition],
+        failures: Sequence[WaitCondition] = (),
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        error_msg: Optional[str] = None,
+        wait_settings: Optional[WaitSettings] = None,
+    ):
+        """Wait for all of the conditions, failing fast when any of the failure sentinels fires.
+
+        Args:
+            conditions: success conditions, see :class:`~src.selenium_facade.element_waits.WaitCondition`.
+            failures: failure sentinels, e.g. error toasts or error pages.
+            timeout_s: timeout in seconds to wait for the success conditions.
+            error_msg: custom error message to be shown.
+
+        Raises:
+            FailureSentinelFired: naming the sentinel which fired.
+        """
+        names = ", ".join(condition.name for condition in conditions)
+        self._waiter.until_conditions(
+            conditions,
+            failures,
+            mode="all",
+            timeout_s=timeout_s,
+            message=error_msg or f"not all of {names} happened in {timeout_s} s",
+            settings=wait_settings,
         )
 
-    def wait_for_element_enabled(self, element: WebElement, timeout_s: float = DEFAULT_TIMEOUT_S):
-        WebDriverWait(self.driver, timeout_s).until(
-            lambda _: not element.get_property("disabled"),
-            "element is not enabled",
+    def wait_for_element_enabled(
+        self, element: WebElement, timeout_s: float = DEFAULT_TIMEOUT_S, wait_settings: Optional[WaitSettings] = None
+    ):
+        self._waiter.until_enabled(element, timeout_s=timeout_s, message="element is not enabled", settings=wait_settings)
+
+    def click_when_unobstructed(
+        self, element: WebElement, timeout_s: float = DEFAULT_TIMEOUT_S, wait_settings: Optional[WaitSettings] = None
+    ):
+        """Click the element, waiting for the overlays or animations covering it to go away.
+
+        The click itself is the check - ``ElementClickInterceptedException`` means another element would receive it -
+        so it is retried with the adaptive polling of the waits until ``timeout_s``.
+        """
+
+        def click() -> bool:
+            try:
+                element.click()
+            except ElementClickInterceptedException:
+                return False
+            return True
+
+        self._waiter.until(
+            click,
+            timeout_s=timeout_s,
+            message=f"element click is still intercepted after {timeout_s} s",
+            settings=wait_settings,
         )
 
-    def fill_input_box(self, element_query: str, find_by: str, value: str) -> WebElement:
+    def wait_for_input_value(self, element: WebElement, value: str, timeout_s: float = SETTLE_TIMEOUT_S) -> bool:
+        """Wait for the UI to propagate the typed value to the input.
+
+        Settling is best-effort: if the value does not match in time (e.g. the input formats it), a warning is logged
+        and the test goes on.
+
+        Returns: whether the value settled in time
+        """
+        return self._wait_until_settled(
+            lambda _: element.get_attribute("value") == value, timeout_s, f"input value did not become `{value}`"
+        )
+
+    def wait_for_element_stale(self, element: WebElement, timeout_s: float = SETTLE_TIMEOUT_S) -> bool:
+        """Wait for the element to be removed from the DOM, e.g. an option of a dropdown panel which collapsed.
+
+        Settling is best-effort, see :meth:`wait_for_input_value`.
+
+        Returns: whether the element was removed in time
+        """
+        return self._wait_until_settled(ec.staleness_of(element), timeout_s, "element is still attached to the DOM")
+
+    def _wait_until_settled(self, condition: Callable[[WebDriver], Any], timeout_s: float, description: str) -> bool:
+        try:
+            self._waiter.until(lambda: condition(self.driver), timeout_s=timeout_s, message=description)
+        except TimeoutException:
+            logger.warning("UI did not settle in %s s: %s", timeout_s, description)
+            return False
+        return True
+
+    def fill_input_box(
+        self, element_query: str, find_by: str, value: str, sleep_time_after: Optional[float] = None
+    ) -> WebElement:
+        """Clear the input and type the value in it.
+
+        Args:
+            element_query: query for finding the element.
+            find_by: type of query.
+            value: value to type.
+            sleep_time_after: fallback - fixed sleep after typing instead of waiting for the value to propagate.
+        """
         element: WebElement = self.find_element(element_query=element_query, find_by=find_by)
         element.send_keys(Keys.BACKSPACE * len(element.get_attribute("value") or ""))
         element.send_keys(value)
-        time.sleep(0.3)  # Need to wait a bit after typing so the UI propagates the value
+        if sleep_time_after is not None:
+            time.sleep(sleep_time_after)
+        else:
+            self.wait_for_input_value(element, value)
 
         return element
 
@@ -134,6 +368,25 @@ class DriverFacade:
             error_msg=error_msg,
         )
 
+    def element_cache_key(self, element_query: str, find_by: str = By.XPATH) -> ElementCacheKey:
+        """Key of the element in :attr:`element_cache`, in the current frame."""
+        return tuple(self._frame_path), find_by, element_query
+
+    def find_element_cached(
+        self, element_query: str, find_by: str = By.XPATH, timeout_s: float = DEFAULT_TIMEOUT_S
+    ) -> WebElement:
+        """Like :meth:`find_element`, but reuses the handle resolved before for the same query and frame.
+
+        The handle may be stale: on ``StaleElementReferenceException`` invalidate it in :attr:`element_cache` and
+        call this again.
+        """
+        key = self.element_cache_key(element_query, find_by)
+        element = self.element_cache.get(key)
+        if element is None:
+            element = self.find_element(element_query=element_query, find_by=find_by, timeout_s=timeout_s)
+            self.element_cache.put(key, element)
+        return element
+
     def _find(
         self,
         element_query: str,
@@ -158,18 +411,88 @@ class DriverFacade:
         Returns:
             The element corresponding to that path.
         """
-        self.wait_for_element_present(element_query=element_query, find_by=find_by, timeout_s=timeout_s)
+        # The wait itself locates the elements, under the parent if given, so no extra find command is needed
+        elements = self._waiter.until_present(
+            element_query,
+            find_by,
+            timeout_s=timeout_s,
+            message=error_msg or f'could not detect element with: "[{find_by}] `{element_query}`"',
+            parent=parent,
+        )
+        assert elements, error_msg or f'element "[{find_by}] {element_query}" not found'
 
-        initiator: WebDriver | WebElement = self.driver if parent is None else parent
+        return elements if multiple else elements[0]
 
-        if not multiple:
-            result: WebElement = initiator.find_element(find_by, element_query)
-        else:
-            result: list[WebElement] = initiator.find_elements(find_by, element_query)  # type: ignore[no-redef]
+    def snapshot(
+        self,
+        element_query: str,
+        find_by: str = By.XPATH,
+        parent: Optional[WebElement] = None,
+        attributes: Sequence[str] = (),
+        properties: Sequence[str] = (),
+        timeout_s: Optional[float] = DEFAULT_TIMEOUT_S,
+    ) -> list[ElementSnapshot]:
+        """Read the state of all the elements matching the query in a single script call.
 
-        assert result, error_msg or f'element "[{find_by}] {element_query}" not found'
+        Reading text or attributes from the ``WebElement`` list of :meth:`find_multiple` costs one round trip per
+        element per property, use this for lists and tables instead.
+
+        Args:
+            element_query: query for finding the elements.
+            find_by: type of query. Defaults to By.XPATH.
+            parent: If set, it starts searching from given element.
+            attributes: names of the HTML attributes to read, e.g. ``href``.
+            properties: names of the DOM properties to read, e.g. ``checked``.
+            timeout_s: timeout in seconds to wait for the first element. If ``None``, does not wait.
 
-        return result
+        Returns:
+            Text, attributes, properties, bounding box and visibility of each element, in document order.
+        """
+        if timeout_s is not None:
+            self._waiter.until_present(
+                element_query,
+                find_by,
+                timeout_s=timeout_s,
+                message=f'could not detect element with: "[{find_by}] `{element_query}`"',
+                parent=parent,
+            )
+        snapshots = SCRIPT_REGISTRY.execute(
+            self.driver, "snapshot", find_by, element_query, parent, list(attributes), list(properties)
+        )
+        return [ElementSnapshot.parse_obj(snapshot) for snapshot in snapshots]
+
+    def snapshot_table(
+        self,
+        element_query: str,
+        find_by: str = By.XPATH,
+        parent: Optional[WebElement] = None,
+        timeout_s: Optional[float] = DEFAULT_TIMEOUT_S,
+    ) -> list[dict[str, str]]:
+        """Read all the rows of a ``<table>`` in a single script call.
+
+        The header is taken from ``<thead>``, or from the first row if the table has none.
+
+        Args:
+            element_query: query for finding the table.
+            find_by: type of query. Defaults to By.XPATH.
+            parent: If set, it starts searching from given element.
+            timeout_s: timeout in seconds to wait for the table. If ``None``, does not wait.
+
+        Returns:
+            The text of the cells of each row, keyed by the header text.
+        """
+        if timeout_s is not None:
+            self._waiter.until_present(
+                element_query,
+                find_by,
+                timeout_s=timeout_s,
+                message=f'could not detect table with: "[{find_by}] `{element_query}`"',
+                parent=parent,
+            )
+        table = SCRIPT_REGISTRY.execute(self.driver, "snapshot_table", find_by, element_query, parent)
+        assert table is not None, f'table "[{find_by}] {element_query}" not found'
+
+        return [dict(zip(table["headers"], row)) for row in table["rows"]]
 
     def count_elements_no_assert(self, element_query: str, find_by: str = By.XPATH, parent: Optional[WebElement] = None) -> int:
         """Counts number of elements by a given query. . warning:: This does not wait for any condition nor fails,
@@ -191,10 +514,9 @@ class DriverFacade:
         self, element_to_be_dragged: WebElement, element_to_drag_to: WebElement, offset_x: int = 0, offset_y: int = 0
     ):
         """Drags an element and drops it on another element."""
-        this_dir_path = os.path.dirname(os.path.abspath(__file__))
-        with open(f"{this_dir_path}/drag_n_drop.js", "r") as f:
-            javascript = f.read()
-        self.driver.execute_script(javascript, element_to_be_dragged, element_to_drag_to, offset_x, offset_y)
+        SCRIPT_REGISTRY.execute(
+            self.driver, "drag_and_drop", element_to_be_dragged, element_to_drag_to, offset_x, offset_y
+        )
 
     def raise_if_found(
         self,
@@ -212,11 +534,61 @@ class DriverFacade:
             error_msg: custom error message to be shown.
             exc: Exception to be raised
         """
+        self.raise_if_any_found([(find_by, element_query)], error_msg=error_msg, exc=exc)
+
+    def raise_if_any_found(
+        self,
+        locators: Sequence[tuple[str, str]],
+        error_msg: Optional[str] = None,
+        exc: Type[BaseException] = Exception,
+        parent: Optional[WebElement] = None,
+    ):
+        """Raises an exception if any of the elements is found, checking all of them in a single script call
+        without waiting. For example, to assert that neither an error toast nor a form error was showed.
+
+        Args:
+            locators: ``(find_by, element_query)`` of the elements which must not be present.
+            error_msg: custom error message to be shown. By default, lists the found locators.
+            exc: Exception to be raised
+            parent: If set, it searches inside the given element.
+        """
         try:
-            self.driver.find_element(find_by, element_query)
-            raise exc(error_msg)
-        except NoSuchElementException:
-            pass
+            counts = SCRIPT_REGISTRY.execute(
+                self.driver, "count_matches", [list(locator) for locator in locators], parent
+            )
+        except JavascriptException:
+            # E.g. the locator is not supported by the script
+            initiator: WebDriver | WebElement = self.driver if parent is None else parent
+            counts = [len(initiator.find_elements(find_by, query)) for find_by, query in locators]
+
+        found = [f"[{find_by}] `{query}`" for (find_by, query), count in zip(locators, counts) if count]
+        if found:
+            raise exc(error_msg or f"Found elements which must not be present: {', '.join(found)}")
+
+    def dismiss_all(
+        self,
+        element_query: str,
+        find_by: str = By.XPATH,
+        timeout_s: float = SETTLE_TIMEOUT_S,
+        wait_settings: Optional[WaitSettings] = None,
+    ) -> int:
+        """Click all the displayed elements matching the query in a single script call, e.g. to dismiss all the
+        toasts. Then waits for them to disappear.
+
+        Args:
+            element_query: query for finding the elements.
+            find_by: type of query. Defaults to By.XPATH.
+            timeout_s: timeout in seconds to wait for the elements to disappear.
+
+        Returns:
+            How many elements were clicked.
+        """
+        dismissed = SCRIPT_REGISTRY.execute(self.driver, "dismiss_all", find_by, element_query, None)
+        if dismissed:
+            self.wait_for_element_not_present(
+                element_query, find_by=find_by, timeout_s=timeout_s, wait_settings=wait_settings
+            )
+        return dismissed
 
     def screenshot(self, filename: str = "screenshot", extra_path: str = ""):
         path = Path(SCREENSHOTS_FOLDER).joinpath(extra_path, f"{filename}.png")
@@ -225,7 +597,7 @@ class DriverFacade:
     def generic_click(self, element: WebElement):
         """This can be used with any clickable element."""
         try:
-            self.driver.execute_script("arguments[0].click();", element)
+            SCRIPT_REGISTRY.execute(self.driver, "click", element)
         except Exception:
             element.click()
 
@@ -262,7 +634,7 @@ class DriverFacade:
         Get the current Auth token
         Returns: the Auth token string
         """
-        cookie: dict[str, Any] | None = self.driver.get_cookie("webapp_api_token")
+        cookie: dict[str, Any] | None = self.driver.get_cookie(AUTH_TOKEN_COOKIE)
         if not cookie:
             return ""
 
@@ -285,24 +657,49 @@ class DriverFacade:
         query_str: str = f"?{urlencode(query)}" if query else ""
         return urljoin(hostname.strip("/"), path + query_str)
 
-    def scroll(self, x: int = 0, y: int | str = "document.body.scrollHeight"):
-        """Scroll page to a point in the page."""
-        self.driver.execute_script(f"window.scrollTo({x}, {y})")
+    def scroll(self, x: int = 0, y: Optional[int] = None):
+        """Scroll page to a point in the page. Without ``y``, scrolls to the bottom of the page."""
+        SCRIPT_REGISTRY.execute(self.driver, "scroll_to", x, y)
 
-    def focus_on_new_tab(self, close_previous: bool, tab_index: int = 0):
+    def focus_on_new_tab(self, close_previous: bool, tab_index: int = 0, wait_settings: Optional[WaitSettings] = None):
         """Switch the focus to a new tab, closing the previous tab if specified."""
-        wait = WebDriverWait(self.driver, DEFAULT_TIMEOUT_S)
-        wait.until(ec.number_of_windows_to_be(tab_index + 1))
+        self._waiter.until(
+            lambda: ec.number_of_windows_to_be(tab_index + 1)(self.driver),
+            timeout_s=DEFAULT_TIMEOUT_S,
+            message=f"number of windows did not become {tab_index + 1}",
+            settings=wait_settings,
+        )
         if close_previous:
             self.driver.close()
         self.driver.switch_to.window(self.driver.window_handles[tab_index])
+        self.element_cache.clear()
+        self._frame_path.clear()
 
     def switch_to_iframe(self, element_query: str, find_by: str = By.XPATH, timeout_s: float = DEFAULT_TIMEOUT_S):
         """Switch to the iFrame with the specified query and timeout."""
         iframe: WebElement = self.find_element(element_query=element_query, find_by=find_by, timeout_s=timeout_s)
         self.driver.switch_to.frame(iframe)
+        self._frame_path.append((find_by, element_query))
 
-    def navigate_to_endpoint(self, endpoint: str):
-        """Navigate directly to a specific endpoint."""
+    def switch_to_default_content(self):
+        """Leave all the iFrames entered with :meth:`switch_to_iframe`."""
+        self.driver.switch_to.default_content()
+        self._frame_path.clear()
+
+    def navigate_to_endpoint(self, endpoint: str, wait_for_idle: bool = False):
+        """Navigate directly to a specific endpoint.
+
+        Args:
+            endpoint: endpoint relative to the current URL.
+            wait_for_idle: whether to wait for the page network to be idle and its DOM to be quiescent.
+        """
         url = urljoin(self.driver.current_url, endpoint)
+        if wait_for_idle:
+            self.install_activity_tracker()
         self.driver.get(url)
+        # Handles of the previous page are all stale now
+        self.element_cache.clear()
+        self._frame_path.clear()
+        if wait_for_idle:
+            self.wait_for_network_idle()
+            self.wait_for_dom_quiescent()
@@ -0,0 +1,29 @@
+from typing import Optional
+
+from selenium.webdriver.remote.webelement import WebElement
+
+# (frame path, find_by, element_query)
+ElementCacheKey = tuple[tuple[tuple[str, str], ...], str, str]
+
+
+class ElementCache:
+    """Resolved ``WebElement`` handles keyed by locator and frame.
+
+    Handles may go stale at any time; the users re-resolve them on ``StaleElementReferenceException`` after
+    calling :meth:`invalidate`.
+    """
+
+    def __init__(self):
+        self._elements: dict[ElementCacheKey, WebElement] = {}
+
+    def get(self, key: ElementCacheKey) -> Optional[WebElement]:
+        return self._elements.get(key)
+
+    def put(self, key: ElementCacheKey, element: WebElement):
+        self._elements[key] = element
+
+    def invalidate(self, key: ElementCacheKey):
+        self._elements.pop(key, None)
+
+    def clear(self):
+        self._elements.clear()
@@ -0,0 +1,291 @@
+"""Wait engine used by :class:`~src.selenium_facade.driver_facade.DriverFacade`.
+
+``WebDriverWait`` polls every 500 ms, so on average each wait ends ~250 ms after its condition was met. Here the
+element conditions are evaluated inside the browser by an async script which re-checks on every DOM mutation and
+resolves immediately. When scripts cannot be used, the conditions are polled adaptively: first after ~20 ms, then
+backing off.
+"""
+import time
+from typing import Callable, Literal, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel
+from selenium.common.exceptions import JavascriptException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from src.constants import ASYNC_SCRIPT_CHUNK_S
+from src.exceptions import FailureSentinelFired
+from src.logger import logger
+from src.selenium_facade.script_registry import SCRIPT_REGISTRY
+
+T = TypeVar("T")
+
+ElementState = Literal["present", "absent", "enabled"]
+ConditionsMode = Literal["any", "all"]
+
+# Consecutive failures of the event-driven script after which a composite wait only polls
+SCRIPT_FAILURES_BEFORE_POLLING = 3
+
+
+class WaitSettings(BaseModel):
+    """How waits are performed. Set on ``DriverFacade`` creation, can be overridden per call."""
+
+    event_driven: bool = True
+    initial_poll_s: float = 0.02
+    max_poll_s: float = 0.5
+    poll_backoff: float = 1.5
+
+
+DEFAULT_WAIT_SETTINGS = WaitSettings()
+
+
+class WaitCondition(BaseModel):
+    """Condition of a composite wait: an element is present, the page title contains a text or a cookie is set.
+
+    Create it with :meth:`element`, :meth:`title` or :meth:`cookie`. ``name`` identifies it in the errors.
+    """
+
+    name: str
+    find_by: Optional[str] = None
+    element_query: Optional[str] = None
+    title_contains: Optional[str] = None
+    cookie_name: Optional[str] = None
+
+    @classmethod
+    def element(cls, element_query: str, find_by: str = By.XPATH, name: Optional[str] = None) -> "WaitCondition":
+        return cls(name=name or f"[{find_by}] `{element_query}`", find_by=find_by, element_query=element_query)
+
+    @classmethod
+    def title(cls, text: str, name: Optional[str] = None) -> "WaitCondition":
+        return cls(name=name or f"title contains `{text}`", title_contains=text)
+
+    @classmethod
+    def cookie(cls, cookie_name: str, name: Optional[str] = None) -> "WaitCondition":
+        return cls(name=name or f"cookie `{cookie_name}`", cookie_name=cookie_name)
+
+    def script_locator(self) -> Optional[list[str]]:
+        """How ``wait_for_conditions.js`` evaluates the condition, ``None`` if it cannot be evaluated by scripts."""
+        if self.cookie_name is not None:
+            return None
+        if self.title_contains is not None:
+            return ["title", self.title_contains]
+        return [self.find_by, self.element_query]  # type: ignore[list-item]
+
+
+class ElementWaiter:
+    def __init__(self, driver: WebDriver, settings: WaitSettings = DEFAULT_WAIT_SETTINGS):
+        self.driver = driver
+        self.settings = settings
+
+    def until_present(
+        self,
+        element_query: str,
+        find_by: str,
+        timeout_s: float,
+        message: str,
+        parent: Optional[WebElement] = None,
+        settings: Optional[WaitSettings] = None,
+    ) -> list[WebElement]:
+        """Wait for at least one element to match the query.
+
+        Returns:
+            All the matching elements.
+        """
+        return self._until_state("present", element_query, find_by, parent, None, timeout_s, message, settings)
+
+    def until_absent(
+        self,
+        element_query: str,
+        find_by: str,
+        timeout_s: float,
+        message: str,
+        parent: Optional[WebElement] = None,
+        settings: Optional[WaitSettings] = None,
+    ):
+        """Wait for the first element matching the query to be removed or hidden."""
+        self._until_state("absent", element_query, find_by, parent, None, timeout_s, message, settings)
+
+    def until_enabled(
+        self, element: WebElement, timeout_s: float, message: str, settings: Optional[WaitSettings] = None
+    ):
+        """Wait for the element to not be ``disabled``."""
+        self._until_state("enabled", None, None, None, element, timeout_s, message, settings)
+
+    def until(
+        self,
+        condition: Callable[[], Optional[T]],
+        timeout_s: float,
+        message: str,
+        settings: Optional[WaitSettings] = None,
+    ) -> T:
+        """Poll the condition adaptively until it returns a truthy value.
+
+        Returns:
+            The value returned by the condition.
+        """
+        settings = settings or self.settings
+        deadline = time.time() + timeout_s
+        poll_s = settings.initial_poll_s
+        while True:
+            result = condition()
+            if result:
+                return result
+            remaining_s = deadline - time.time()
+            if remaining_s <= 0:
+                raise TimeoutException(message)
+            time.sleep(min(poll_s, remaining_s))
+            poll_s = min(poll_s * settings.poll_backoff, settings.max_poll_s)
+
+    def until_conditions(
+        self,
+        successes: Sequence[WaitCondition],
+        failures: Sequence[WaitCondition],
+        mode: ConditionsMode,
+        timeout_s: float,
+        message: str,
+        settings: Optional[WaitSettings] = None,
+    ) -> list[WaitCondition]:
+        """Wait for any or all of the success conditions, aborting as soon as any of the failure sentinels is met.
+
+        Element and title conditions are watched by one async script. Cookies cannot be read by scripts (they can be
+        ``HttpOnly``), so with cookie conditions the script waits one polling interval at a time and the cookies are
+        checked in between. When the script fails because the page navigated, that round is polled and the script
+        is re-armed in the new document.
+
+        Returns:
+            The success conditions which are met.
+
+        Raises:
+            FailureSentinelFired: naming the first failure sentinel which was met.
+            TimeoutException: if the success conditions are not met in time.
+        """
+        settings = settings or self.settings
+        conditions = [*successes, *failures]
+        deadline = time.time() + timeout_s
+        has_cookies = any(condition.cookie_name is not None for condition in conditions)
+        # The script cannot decide that all the success conditions are met if some of them are cookies
+        script_mode = None if mode == "all" and any(condition.cookie_name for condition in successes) else mode
+        event_driven = settings.event_driven
+        script_failures = 0
+        poll_s = settings.initial_poll_s
+        while True:
+            script_met: Optional[list[bool]] = None
+            if event_driven:
+                chunk_s = min(max(deadline - time.time(), 0), poll_s if has_cookies else ASYNC_SCRIPT_CHUNK_S)
+                try:
+                    script_met = SCRIPT_REGISTRY.execute_async(
+                        self.driver,
+                        "wait_for_conditions",
+                        [condition.script_locator() for condition in conditions],
+                        len(successes),
+                        script_mode,
+                        int(chunk_s * 1000),
+                    )["met"]
+                    script_failures = 0
+                except JavascriptException:
+                    # Usually the page navigated (e.g. after a login click), the script is re-armed in the new
+                    # document on the next round. A script which keeps failing is given up
+                    script_failures += 1
+                    event_driven = script_failures < SCRIPT_FAILURES_BEFORE_POLLING
+                    logger.debug("Event-driven wait failed, polling this round", exc_info=True)
+            met = self._check_conditions(conditions, script_met)
+
+            for failure, failure_met in zip(failures, met[len(successes):]):
+                if failure_met:
+                    raise FailureSentinelFired(failure.name, f"{message}: failure sentinel `{failure.name}` fired")
+            met_successes = [success for success, success_met in zip(successes, met) if success_met]
+            if met_successes if mode == "any" else len(met_successes) == len(successes):
+                return met_successes
+
+            remaining_s = deadline - time.time()
+            if remaining_s <= 0:
+                raise TimeoutException(message)
+            if script_met is None:
+                time.sleep(min(poll_s, remaining_s))
+            poll_s = min(poll_s * settings.poll_backoff, settings.max_poll_s)
+
+    def _check_conditions(self, conditions: Sequence[WaitCondition], script_met: Optional[list[bool]]) -> list[bool]:
+        """Whether each condition is met, taking the result of the script for the non-cookie conditions if it ran."""
+        title: Optional[str] = None
+        met = []
+        for index, condition in enumerate(conditions):
+            if condition.cookie_name is not None:
+                met.append(self.driver.get_cookie(condition.cookie_name) is not None)
+            elif script_met is not None:
+                met.append(script_met[index])
+            elif condition.title_contains is not None:
+                # The title is read once per round, whatever the number of title conditions
+                if title is None:
+                    title = self.driver.title
+                met.append(condition.title_contains in title)
+            else:
+                elements = self.driver.find_elements(condition.find_by, condition.element_query)  # type: ignore[arg-type]
+                met.append(bool(elements))
+        return met
+
+    def _until_state(
+        self,
+        state: ElementState,
+        element_query: Optional[str],
+        find_by: Optional[str],
+        parent: Optional[WebElement],
+        element: Optional[WebElement],
+        timeout_s: float,
+        message: str,
+        settings: Optional[WaitSettings],
+    ) -> list[WebElement]:
+        settings = settings or self.settings
+        deadline = time.time() + timeout_s
+        if settings.event_driven:
+            try:
+                while True:
+                    chunk_s = min(max(deadline - time.time(), 0), ASYNC_SCRIPT_CHUNK_S)
+                    result = SCRIPT_REGISTRY.execute_async(
+                        self.driver,
+                        "wait_for_locator",
+                        state,
+                        find_by,
+                        element_query,
+                        parent,
+                        element,
+                        int(chunk_s * 1000),
+                    )
+                    if result["met"]:
+                        return result["elements"]
+                    if result.get("error"):
+                        raise JavascriptException(result["error"])
+                    if time.time() >= deadline:
+                        raise TimeoutException(message)
+            except JavascriptException:
+                # E.g. the page navigated while waiting, or the locator is not supported by the script
+                logger.debug("Event-driven wait failed, falling back to polling", exc_info=True)
+
+        def condition() -> Optional[tuple[list[WebElement]]]:
+            elements = self._check_state(state, element_query, find_by, parent, element)
+            # Wrapped, because an empty list also means the condition is met for ``absent``
+            return None if elements is None else (elements,)
+
+        return self.until(condition, timeout_s=max(deadline - time.time(), 0), message=message, settings=settings)[0]
+
+    def _check_state(
+        self,
+        state: ElementState,
+        element_query: Optional[str],
+        find_by: Optional[str],
+        parent: Optional[WebElement],
+        element: Optional[WebElement],
+    ) -> Optional[list[WebElement]]:
+        if state == "enabled":
+            return [element] if not element.get_property("disabled") else None  # type: ignore[union-attr]
+
+        initiator: WebDriver | WebElement = self.driver if parent is None else parent
+        elements = initiator.find_elements(find_by, element_query)
+        if state == "present":
+            return elements or None
+
+        # Like ``invisibility_of_element_located``: the first match is gone or hidden
+        try:
+            return [] if not elements or not elements[0].is_displayed() else None
+        except StaleElementReferenceException:
+            return []
@@ -0,0 +1,62 @@
+// Finds elements the same way as Selenium ``find_elements`` does, for each ``By`` strategy.
+function locateAll(by, query, root) {
+  root = root || document;
+
+  function byCss(selector) {
+    return Array.prototype.slice.call(root.querySelectorAll(selector));
+  }
+
+  function quote(value) {
+    return '"' + String(value).replace(/\\/g, "\\\\").replace(/"/g, '\\"') + '"';
+  }
+
+  function byLinkText(matches) {
+    return byCss("a").filter(function (link) {
+      return matches((link.innerText || link.textContent || "").trim());
+    });
+  }
+
+  switch (by) {
+    case "xpath":
+      var ownerDocument = root.ownerDocument || root;
+      var snapshot = ownerDocument.evaluate(query, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      var nodes = [];
+      for (var i = 0; i < snapshot.snapshotLength; i++) {
+        if (snapshot.snapshotItem(i).nodeType === Node.ELEMENT_NODE) {
+          nodes.push(snapshot.snapshotItem(i));
+        }
+      }
+      return nodes;
+    case "css selector":
+    case "tag name":
+      return byCss(query);
+    case "id":
+      return byCss("[id=" + quote(query) + "]");
+    case "name":
+      return byCss("[name=" + quote(query) + "]");
+    case "class name":
+      return byCss("." + CSS.escape(query));
+    case "link text":
+      return byLinkText(function (text) {
+        return text === query;
+      });
+    case "partial link text":
+      return byLinkText(function (text) {
+        return text.indexOf(query) !== -1;
+      });
+    default:
+      throw new Error("Unsupported locator strategy: " + by);
+  }
+}
+
+function isDisplayed(element) {
+  if (!element.isConnected) {
+    return false;
+  }
+  var style = window.getComputedStyle(element);
+  return (
+    style.visibility !== "hidden" &&
+    style.display !== "none" &&
+    !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length)
+  );
+}
@@ -0,0 +1,20 @@
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+
+class ElementRect(BaseModel):
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+class ElementSnapshot(BaseModel):
+    """State of an element read in bulk by :meth:`~src.selenium_facade.driver_facade.DriverFacade.snapshot`."""
+
+    text: str
+    attributes: dict[str, Optional[str]]
+    properties: dict[str, Any]
+    rect: ElementRect
+    displayed: bool
@@ -0,0 +1,114 @@
+"""Registry of the JavaScript helpers executed in the browser by
+:class:`~src.selenium_facade.driver_facade.DriverFacade`.
+
+Every helper is a function body which reads its arguments from ``arguments``, like the scripts given to
+``execute_script``. The sources are loaded once, at import. On Chromium browsers the helpers are pinned once per
+session: they are defined in every new document with CDP ``Page.addScriptToEvaluateOnNewDocument``, and each call only
+sends a short stub with the name of the helper. When the helper is missing in the document (e.g. the page was loaded
+before pinning), the stub reports it and the full source is sent instead. Other browsers always get the full source.
+
+Selenium ``pin_script`` is not used: it keeps the script on the client side only, the full source still goes over the
+wire on every call.
+"""
+import json
+import os
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+THIS_DIR_PATH = os.path.dirname(os.path.abspath(__file__))
+
+# Helper name -> files concatenated into its source. ``locate.js`` and ``activity_tracker.js`` are shared preludes.
+HELPER_FILES: dict[str, tuple[str, ...]] = {
+    "activity_tracker": ("activity_tracker.js",),
+    "wait_for_idle": ("activity_tracker.js", "wait_for_idle.js"),
+    "wait_for_locator": ("locate.js", "wait_for_locator.js"),
+    "wait_for_conditions": ("locate.js", "wait_for_conditions.js"),
+    "snapshot": ("locate.js", "snapshot.js"),
+    "snapshot_table": ("locate.js", "snapshot_table.js"),
+    "drag_and_drop": ("drag_n_drop.js",),
+    "dismiss_all": ("locate.js", "dismiss_all.js"),
+    "count_matches": ("locate.js", "count_matches.js"),
+}
+INLINE_HELPERS: dict[str, str] = {
+    "click": "arguments[0].click();",
+    "scroll_to": "window.scrollTo(arguments[0], arguments[1] === null ? document.body.scrollHeight : arguments[1]);",
+}
+
+HELPERS_GLOBAL = "window.__seleniumHelpers"
+# Returned by the stub when the helper is not defined in the current document
+HELPER_MISSING_KEY = "__seleniumHelperMissing"
+
+
+def read_script(file_name: str) -> str:
+    with open(f"{THIS_DIR_PATH}/{file_name}", "r") as f:
+        return f.read()
+
+
+class ScriptRegistry:
+    """Helpers by name, executed with the pinned stub when possible.
+
+    Args:
+        sources: source of each helper, by name.
+    """
+
+    def __init__(self, sources: dict[str, str]):
+        self.sources = sources
+        # Script defining all the helpers, evaluated in every new document once pinned
+        self.definitions = f"{HELPERS_GLOBAL} = {HELPERS_GLOBAL} || {{}};\n" + "".join(
+            f"{HELPERS_GLOBAL}[{json.dumps(name)}] = function () {{\n{source}\n}};\n"
+            for name, source in sources.items()
+        )
+
+    def source(self, name: str) -> str:
+        return self.sources[name]
+
+    def stub(self, name: str, is_async: bool = False) -> str:
+        """Short script calling the pinned helper, forwarding all the arguments."""
+        missing = json.dumps({HELPER_MISSING_KEY: True})
+        on_missing = f"arguments[arguments.length - 1]({missing}); return;" if is_async else f"return {missing};"
+        return (
+            f"var helper = {HELPERS_GLOBAL} && {HELPERS_GLOBAL}[{json.dumps(name)}];"
+            f"if (!helper) {{ {on_missing} }}"
+            "return helper.apply(this, arguments);"
+        )
+
+    def pin(self, driver: WebDriver) -> bool:
+        """Define all the helpers in every new document of the session, once per session.
+
+        Returns:
+            Whether the driver supports pinning.
+        """
+        if vars(driver).get("_helpers_pinned"):
+            return True
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": self.definitions})
+        setattr(driver, "_helpers_pinned", True)
+        return True
+
+    def execute(self, driver: WebDriver, name: str, *args) -> Any:
+        """``execute_script`` the helper with the arguments."""
+        return self._execute(driver, name, False, args)
+
+    def execute_async(self, driver: WebDriver, name: str, *args) -> Any:
+        """``execute_async_script`` the helper with the arguments."""
+        return self._execute(driver, name, True, args)
+
+    def _execute(self, driver: WebDriver, name: str, is_async: bool, args: tuple) -> Any:
+        execute = driver.execute_async_script if is_async else driver.execute_script
+        stub = self.stub(name, is_async)
+        # Tiny helpers are cheaper to send than the stub
+        if len(stub) < len(self.sources[name]) and self.pin(driver):
+            result = execute(stub, *args)
+            if not (isinstance(result, dict) and result.get(HELPER_MISSING_KEY)):
+                return result
+        return execute(self.sources[name], *args)
+
+
+SCRIPT_REGISTRY = ScriptRegistry(
+    {
+        **{name: "".join(read_script(file_name) for file_name in files) for name, files in HELPER_FILES.items()},
+        **INLINE_HELPERS,
+    }
+)
@@ -0,0 +1,36 @@
+// Requires locate.js to be prepended.
+// Reads text, attributes, properties, bounding box and visibility of every match in one round trip.
+var by = arguments[0];
+var query = arguments[1];
+var root = arguments[2];
+var attributeNames = arguments[3];
+var propertyNames = arguments[4];
+
+function serializable(value) {
+  if (value === null || value === undefined) {
+    return null;
+  }
+  var type = typeof value;
+  return type === "string" || type === "number" || type === "boolean" ? value : String(value);
+}
+
+return locateAll(by, query, root).map(function (element) {
+  var attributes = {};
+  attributeNames.forEach(function (name) {
+    attributes[name] = element.getAttribute(name);
+  });
+
+  var properties = {};
+  propertyNames.forEach(function (name) {
+    properties[name] = serializable(element[name]);
+  });
+
+  var rect = element.getBoundingClientRect();
+  return {
+    text: (element.innerText || "").trim(),
+    attributes: attributes,
+    properties: properties,
+    rect: { x: rect.x, y: rect.y, width: rect.width, height: rect.height },
+    displayed: isDisplayed(element),
+  };
+});
@@ -0,0 +1,27 @@
+// Requires locate.js to be prepended.
+// Reads the header and the cells of the first matching table in one round trip.
+var by = arguments[0];
+var query = arguments[1];
+var root = arguments[2];
+
+var table = locateAll(by, query, root)[0];
+if (!table) {
+  return null;
+}
+
+function cellsText(row) {
+  return Array.prototype.map.call(row.cells, function (cell) {
+    return (cell.innerText || "").trim();
+  });
+}
+
+var rows = Array.prototype.slice.call(table.rows);
+var headerRow = table.tHead && table.tHead.rows.length ? table.tHead.rows[0] : rows[0];
+return {
+  headers: headerRow ? cellsText(headerRow) : [],
+  rows: rows
+    .filter(function (row) {
+      return row !== headerRow && !(table.tHead && table.tHead.contains(row));
+    })
+    .map(cellsText),
+};
@@ -0,0 +1,61 @@
+// Requires locate.js to be prepended.
+// Watches the success conditions and the failure sentinels together, re-checking on every DOM mutation.
+// Resolves with the state of every condition as soon as a sentinel fires or the success conditions are met.
+var conditions = arguments[0];
+var successCount = arguments[1];
+var successMode = arguments[2];
+var timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+
+function isMet(condition) {
+  if (condition === null) {
+    // Evaluated outside the browser, e.g. cookies
+    return false;
+  }
+  if (condition[0] === "title") {
+    return document.title.indexOf(condition[1]) !== -1;
+  }
+  return locateAll(condition[0], condition[1], null).length > 0;
+}
+
+function isDecisive(met) {
+  var successes = met.slice(0, successCount);
+  if (met.slice(successCount).some(Boolean)) {
+    return true;
+  }
+  if (successMode === "any") {
+    return successes.some(Boolean);
+  }
+  return successMode === "all" && successes.every(Boolean);
+}
+
+var observer;
+var interval;
+var timer;
+
+function finish(met) {
+  observer.disconnect();
+  clearInterval(interval);
+  clearTimeout(timer);
+  done({ met: met });
+}
+
+function check() {
+  var met = conditions.map(isMet);
+  if (isDecisive(met)) {
+    finish(met);
+  }
+}
+
+var met = conditions.map(isMet);
+if (isDecisive(met)) {
+  done({ met: met });
+} else {
+  observer = new MutationObserver(check);
+  observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true, characterData: true });
+  // Style and title changes do not always trigger mutations of the observed tree
+  interval = setInterval(check, 100);
+  timer = setTimeout(function () {
+    finish(conditions.map(isMet));
+  }, timeoutMs);
+}
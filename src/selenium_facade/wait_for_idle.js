@@ -0,0 +1,38 @@
+// Requires activity_tracker.js to be prepended.
+var kind = arguments[0];
+var quietMs = arguments[1];
+var timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+
+var activity = window.__seleniumActivity;
+var deadline = Date.now() + timeoutMs;
+
+function countResources() {
+  return window.performance && performance.getEntriesByType ? performance.getEntriesByType("resource").length : 0;
+}
+
+function check() {
+  var now = Date.now();
+  // Requests started before the tracker was installed are only visible once they finish, as resource entries
+  var resources = countResources();
+  if (resources !== activity.resources) {
+    activity.resources = resources;
+    activity.lastNetwork = now;
+  }
+
+  var idle;
+  if (kind === "network") {
+    idle = activity.inflight === 0 && now - activity.lastNetwork >= quietMs;
+  } else {
+    idle = now - activity.lastMutation >= quietMs;
+  }
+  idle = idle && document.readyState === "complete";
+
+  if (idle || now >= deadline) {
+    done({ idle: idle, inflight: activity.inflight });
+    return;
+  }
+  setTimeout(check, 25);
+}
+
+check();
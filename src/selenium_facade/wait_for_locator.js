@@ -0,0 +1,62 @@
+// Requires locate.js to be prepended.
+// Resolves as soon as the condition is met, re-checking on every DOM mutation instead of polling.
+var state = arguments[0];
+var by = arguments[1];
+var query = arguments[2];
+var root = arguments[3];
+var target = arguments[4];
+var timeoutMs = arguments[5];
+var done = arguments[arguments.length - 1];
+
+function evaluate() {
+  if (state === "enabled") {
+    if (!target.isConnected) {
+      // Let the polling fallback raise ``StaleElementReferenceException``
+      throw new Error("Element is not attached to the DOM");
+    }
+    return !target.disabled ? [target] : null;
+  }
+
+  var elements = locateAll(by, query, root);
+  if (state === "present") {
+    return elements.length ? elements : null;
+  }
+  // "absent": like Selenium ``invisibility_of_element_located``, the first match is gone or hidden
+  return !elements.length || !isDisplayed(elements[0]) ? [] : null;
+}
+
+var observer;
+var interval;
+var timer;
+
+function finish(result) {
+  observer.disconnect();
+  clearInterval(interval);
+  clearTimeout(timer);
+  done(result);
+}
+
+function check() {
+  try {
+    var elements = evaluate();
+  } catch (error) {
+    finish({ met: false, elements: [], error: String(error) });
+    return;
+  }
+  if (elements) {
+    finish({ met: true, elements: elements });
+  }
+}
+
+var elements = evaluate();
+if (elements) {
+  done({ met: true, elements: elements });
+} else {
+  observer = new MutationObserver(check);
+  observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true, characterData: true });
+  // Style changes coming from stylesheets do not trigger mutations
+  interval = setInterval(check, 100);
+  timer = setTimeout(function () {
+    finish({ met: false, elements: [] });
+  }, timeoutMs);
+}
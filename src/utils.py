@@ -1,4 +1,7 @@
 import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
 
 
 def load_dotenv_if_running_locally():
@@ -8,3 +11,32 @@ def load_dotenv_if_running_locally():
         from dotenv import load_dotenv  # NOQA
 
         load_dotenv()
+
+
+@contextmanager
+def file_lock(path: str | Path) -> Iterator[None]:
+    """Exclusive lock shared between processes (e.g. pytest-xdist workers), held while in the ``with`` block.
+
+    Args:
+        path: path of the lock file, created if missing.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+") as lock_file:
+        if os.name == "nt":
+            import msvcrt  # NOQA
+
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl  # NOQA
+
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
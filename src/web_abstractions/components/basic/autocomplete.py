@@ -1,17 +1,39 @@
 from time import sleep
 from typing import Optional
 
+from selenium.common import TimeoutException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 
+from src.constants import AUTOCOMPLETE_OPTIONS_TIMEOUT_S
+from src.logger import logger
 from src.web_abstractions.components.basic.base import BaseBasicComponent
 
 
 class AutocompleteComponent(BaseBasicComponent):
-    def __init__(self, sleep_time_before_click: Optional[float] = None, sleep_time_before_opening: Optional[float] = None, *args, **kwargs):
+    def __init__(
+        self,
+        sleep_time_before_click: Optional[float] = None,
+        sleep_time_before_opening: Optional[float] = None,
+        options_query: Optional[str] = None,
+        options_find_by: str = By.XPATH,
+        *args,
+        **kwargs,
+    ):
+        """
+        Args:
+            sleep_time_before_click: fallback - fixed sleep before confirming the value, when ``options_query`` is
+                not known.
+            sleep_time_before_opening: fallback - fixed sleep before typing.
+            options_query: query of the rendered suggestions list. If set, waits for it before confirming the value.
+            options_find_by: type of ``options_query``.
+        """
         super().__init__(*args, **kwargs)
         self.sleep_time_before_click = sleep_time_before_click
         self.sleep_time_before_opening = sleep_time_before_opening
+        self.options_query = options_query
+        self.options_find_by = options_find_by
 
     def set_value(self, value: str):
         if self.sleep_time_before_opening:
@@ -20,8 +42,15 @@ class AutocompleteComponent(BaseBasicComponent):
 
         element: WebElement = self._driver_facade.fill_input_box(element_query=self._element_query, find_by=self._find_by, value=value)
 
-        if self.sleep_time_before_click:
+        if self.options_query:
             # NOTE: for some cases when the data is too big on the backend, we have to wait until it is loaded
+            try:
+                self._driver_facade.wait_for_element_present(
+                    self.options_query, find_by=self.options_find_by, timeout_s=AUTOCOMPLETE_OPTIONS_TIMEOUT_S
+                )
+            except TimeoutException:
+                logger.warning("Autocomplete options `%s` were not rendered", self.options_query)
+        elif self.sleep_time_before_click:
             sleep(self.sleep_time_before_click)
 
         element.send_keys(Keys.ENTER)
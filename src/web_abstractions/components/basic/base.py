@@ -1,7 +1,14 @@
+from typing import Callable, Optional, TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 
+from src.constants import DEFAULT_TIMEOUT_S, STALE_ELEMENT_RETRIES
 from src.selenium_facade.driver_facade import DriverFacade
 
+T = TypeVar("T")
+
 
 class BaseBasicComponent:
     """Base Basic Component.
@@ -17,3 +24,32 @@ class BaseBasicComponent:
     @property
     def element_query(self):
         return self._element_query
+
+    def _resolve(self, timeout_s: Optional[float] = None) -> WebElement:
+        """Get the element, reusing the handle cached by the view's ``DriverFacade``."""
+        return self._driver_facade.find_element_cached(
+            element_query=self._element_query, find_by=self._find_by, timeout_s=timeout_s or DEFAULT_TIMEOUT_S
+        )
+
+    def _with_element(
+        self,
+        action: Callable[[WebElement], T],
+        timeout_s: Optional[float] = None,
+    ) -> T:
+        """Run the action on the element, re-resolving it when the cached handle went stale, at most
+        ``STALE_ELEMENT_RETRIES`` times.
+
+        Args:
+            action: what to do with the element.
+            timeout_s: timeout in seconds to wait an element load.
+        """
+        cache_key = self._driver_facade.element_cache_key(self._element_query, self._find_by)
+        for attempt in range(STALE_ELEMENT_RETRIES + 1):
+            element = self._resolve(timeout_s=timeout_s)
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                self._driver_facade.element_cache.invalidate(cache_key)
+                if attempt == STALE_ELEMENT_RETRIES:
+                    raise
+        raise AssertionError("unreachable")
@@ -1,7 +1,3 @@
-from selenium.common.exceptions import (
-    ElementClickInterceptedException,
-    StaleElementReferenceException,
-)
 from selenium.webdriver.remote.webelement import WebElement
 
 from src.web_abstractions.components.basic.base import BaseBasicComponent
@@ -15,16 +11,18 @@ class ButtonComponent(BaseBasicComponent):
 
     def get(self) -> WebElement:
         """Find an element by a query."""
-        return self._driver_facade.find_element(element_query=self._element_query, find_by=self._find_by)
+        return self._resolve()
 
     def click(self):
         """Waits for the button to be enabled and clicks on it.
 
-        In case of ``StaleElementReferenceException`` recursively retries
+        While the click is intercepted (overlay, animation) waits for the button to be unobstructed. In case of
+        ``StaleElementReferenceException`` retries with the re-resolved element, at most ``STALE_ELEMENT_RETRIES``
+        times
         """
-        element = self.get()
-        try:
+
+        def wait_enabled_and_click(element: WebElement):
             self._driver_facade.wait_for_element_enabled(element)
-            element.click()
-        except (StaleElementReferenceException, ElementClickInterceptedException):
-            return self.click()
+            self._driver_facade.click_when_unobstructed(element)
+
+        self._with_element(wait_enabled_and_click)
@@ -1,9 +1,7 @@
 from typing import Optional
 
-from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.remote.webelement import WebElement
 
-from src.constants import DEFAULT_TIMEOUT_S
 from src.web_abstractions.components.basic.base import BaseBasicComponent
 
 
@@ -17,17 +15,15 @@ class ClickableComponent(BaseBasicComponent):
         Returns:
             Matching element
         """
-        return self._driver_facade.find_element(
-            element_query=self._element_query, find_by=self._find_by, timeout_s=timeout_s or DEFAULT_TIMEOUT_S
-        )
+        return self._resolve(timeout_s=timeout_s)
+
+    def _is_selected(self) -> bool:
+        return self._with_element(lambda element: element.is_selected())
 
     def click(self, timeout_s: Optional[float] = None):
         """Click on the element.
 
-        In case of ``StaleElementReferenceException`` recursively retries
+        In case of ``StaleElementReferenceException`` retries with the re-resolved element, at most
+        ``STALE_ELEMENT_RETRIES`` times
         """
-        element = self._get(timeout_s=timeout_s)
-        try:
-            self._driver_facade.generic_click(element)
-        except StaleElementReferenceException:
-            self.click()
+        self._with_element(self._driver_facade.generic_click, timeout_s=timeout_s)
@@ -1,4 +1,5 @@
 from time import sleep
+from typing import Optional
 
 from selenium.common import TimeoutException
 
@@ -8,21 +9,48 @@ from src.web_abstractions.components.basic.base import BaseBasicComponent
 
 
 class DropdownComponent(BaseBasicComponent):
+    def __init__(
+        self,
+        sleep_time_after_open: Optional[float] = None,
+        sleep_time_after_select: Optional[float] = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        Args:
+            sleep_time_after_open: fallback - fixed sleep after opening the dropdown.
+            sleep_time_after_select: fallback - fixed sleep after selecting the option.
+        """
+        super().__init__(*args, **kwargs)
+        self.sleep_time_after_open = sleep_time_after_open
+        self.sleep_time_after_select = sleep_time_after_select
+
     def get(self) -> ButtonComponent:
         return ButtonComponent(driver_facade=self._driver_facade, element_query=self._element_query, find_by=self._find_by)
 
     def select_option(self, option: str):
+        """Open the dropdown and select the option by its ``data-value`` or, as a fallback, by its ``title``.
+
+        Instead of fixed sleeps, waits for the panel to open (the option is present) and to collapse
+        (the option is gone) after selecting.
+        """
         element = self.get()
         element.click()
-        sleep(2)  # Trying to not have the dropdown vanishing value
+        if self.sleep_time_after_open:
+            sleep(self.sleep_time_after_open)
 
         element_query_with_data_value = f'//*[@data-value="{option}"]'
         element_query_with_title = f'//*[@title="{option}"]'
         try:
             self._driver_facade.find_element(element_query_with_data_value, timeout_s=DROPDOWN_OPTIONS_TIMEOUT_S).click()
-            sleep(3)  # Trying to not have the dropdown vanishing value
+            if self.sleep_time_after_select:
+                sleep(self.sleep_time_after_select)
             # Allow the component to collapse after selecting
             self._driver_facade.wait_for_element_not_present(element_query_with_data_value)
         except TimeoutException:
-            self._driver_facade.find_element(element_query_with_title).click()
-            sleep(3)
+            option_element = self._driver_facade.find_element(element_query_with_title)
+            option_element.click()
+            if self.sleep_time_after_select:
+                sleep(self.sleep_time_after_select)
+            # The selected value may keep the same title, so wait for the clicked option itself to go away
+            self._driver_facade.wait_for_element_stale(option_element)
@@ -1,4 +1,5 @@
 from time import sleep
+from typing import Optional
 
 from selenium.webdriver import Keys
 from selenium.webdriver.remote.webelement import WebElement
@@ -7,24 +8,36 @@ from src.web_abstractions.components.basic.base import BaseBasicComponent
 
 
 class InputComponent(BaseBasicComponent):
-    def __init__(self, sleep_time_after: float = 0.3, *args, **kwargs):
+    def __init__(self, sleep_time_after: Optional[float] = None, *args, **kwargs):
+        """
+        Args:
+            sleep_time_after: fallback - fixed sleep after typing instead of waiting for the value to propagate.
+        """
         super().__init__(*args, **kwargs)
         self.sleep_time_after = sleep_time_after
 
     def get(self) -> WebElement:
-        return self._driver_facade.find_element(element_query=self._element_query, find_by=self._find_by)
+        return self._resolve()
 
     def fill(self, value: str):
-        element = self.get()
-        self.clear_input_field()
-        element.send_keys(value)
+        def clear_and_type(element: WebElement) -> WebElement:
+            self._clear(element)
+            element.send_keys(value)
+            return element
 
-        sleep(self.sleep_time_after)  # Need to wait a bit after typing so the UI propagates the value
+        element = self._with_element(clear_and_type)
+
+        if self.sleep_time_after is not None:
+            sleep(self.sleep_time_after)
+        else:
+            self._driver_facade.wait_for_input_value(element, value)
 
     def clear_input_field(self):
         """Use this method to clear the input field"""
+        self._with_element(self._clear)
 
-        input_field = self.get()
+    @staticmethod
+    def _clear(input_field: WebElement):
         value = input_field.get_attribute("value")
         if value:
             input_field.send_keys(Keys.BACKSPACE * len(value))
@@ -25,18 +25,9 @@ class ToastComponent(BaseBasicComponent):
     @staticmethod
     def dismiss_all(driver_facade: DriverFacade):
         """Clear all toast messages in the screen (e.g. to avoid blocking clicking on an
-        element)"""
-        logging.info("Dismissing all toast messages")
-
-        while True:
-            try:
-                ToastComponent(
-                    driver_facade,
-                    element_query="//*[contains(@data-testid, 'toast')]",
-                ).dismiss(timeout_s=0.3)
-            except Exception:
-                logging.info("Dismissed all toast messages")
-                break
+        element) with a single script call."""
+        dismissed = driver_facade.dismiss_all(element_query="//*[contains(@data-testid, 'toast')]")
+        logging.info("Dismissed %d toast messages", dismissed)
 
     @staticmethod
     def has_error(driver_facade: DriverFacade, error_msg: Optional[str] = None):
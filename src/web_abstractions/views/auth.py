@@ -1,7 +1,10 @@
 from selenium.webdriver.common.by import By
 
+from src.constants import AUTH_TOKEN_COOKIE
+from src.instrumentation.tracing import traced
+from src.selenium_facade.element_waits import WaitCondition
 from src.web_abstractions.components import ButtonComponent, InputComponent
-from src.web_abstractions.views.base import BaseView
+from src.web_abstractions.views.base import ERROR_SENTINELS, BaseView
 
 
 class SignInView(BaseView):
@@ -24,23 +27,20 @@ class SignInView(BaseView):
         return InputComponent(driver_facade=self.driver_facade, element_query="#login_login_password",
                               find_by=By.CSS_SELECTOR)
 
+    @traced()
     def login_button_click(self):
         """Click on the submit bottom of the login form.
 
-        After the click it checks:
-
-        * if login was successful
-        * if ``webapp_api_token`` cookie was assigned
+        After the click it waits for the ``webapp_api_token`` cookie to be assigned, failing as soon as the login
+        error message, an error toast or an error page shows up.
         """
         self._login_button.click()
-        # Check if showed any login error message
-        self.driver_facade.raise_if_found(
-            "kc-feedback-text",
-            find_by=By.CLASS_NAME,
-            error_msg="Login failed",
+        login_error = WaitCondition.element("kc-feedback-text", find_by=By.CLASS_NAME, name="login error message")
+        self.driver_facade.wait_for_any(
+            [WaitCondition.cookie(AUTH_TOKEN_COOKIE)], failures=[login_error, *ERROR_SENTINELS], error_msg="Login failed"
         )
-        self.driver_facade.wait_for_cookie_present("webapp_api_token")
 
+    @traced()
     def fill_username_and_password(self, username: str, password: str):
         """Helper to fill the login form."""
         self._username_input.fill(value=username)
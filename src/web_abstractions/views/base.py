@@ -1,6 +1,16 @@
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from src.selenium_facade.driver_facade import DriverFacade
+from src.selenium_facade.element_waits import WaitCondition
+
+# States of the app in which waiting for a success is pointless, used as failure sentinels of the composite waits
+ERROR_SENTINELS: list[WaitCondition] = [
+    WaitCondition.element('//*[@data-testid="toast-error"]', name="error toast"),
+    WaitCondition.title("Internal Server Error", name="HTTP 500 error page"),
+    WaitCondition.title("Bad Gateway", name="HTTP 502 error page"),
+    WaitCondition.title("Service Unavailable", name="HTTP 503 error page"),
+    WaitCondition.title("Gateway Time", name="HTTP 504 error page"),
+]
 
 
 class BaseView:
@@ -1,3 +1,4 @@
+from src.instrumentation.tracing import traced
 from src.web_abstractions.components import ButtonComponent
 from src.web_abstractions.views.base import BaseView
 
@@ -25,6 +26,7 @@ class MaharaHomeView(BaseView):
         """`Sign In Again` button after logged out the platform."""
         return ButtonComponent(driver_facade=self.driver_facade, element_query="//*[@data-testid='sign-in']")
 
+    @traced()
     def sign_out(self):
         self.show_account_menu.click()
         self.logout_link.click()
@@ -1,22 +1,37 @@
+import contextlib
 import os
 import shutil
 import uuid
 from pathlib import Path
-from typing import Callable, Generator
+from typing import Callable, Generator, Optional
 
 import pytest
 from _pytest.fixtures import SubRequest
-from retry import retry
-from selenium.common.exceptions import InvalidSessionIdException
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver import Remote
 
+from src.artifacts.failure_artifacts import ARTIFACT_WRITER, collect_failure_artifacts
 from src.config import get_selenium_config, PipelineMetaConfig
 from src.constants import SCREENSHOTS_FAILURES_FOLDER, SCREENSHOTS_FOLDER
+from src.data_seeding.seeder import DataSeeder
+from src.driver_factories.browser import uses_fixed_window_size
 from src.driver_factories.driver_factory_base import DriverFactoryBase
+from src.driver_factories.driver_pool import DriverPool
 from src.driver_factories.factories_map import DRIVER_FACTORY_MAP
-from src.logger import logger
+from src.driver_factories.prefetching_factory import PrefetchingDriverFactory
+from src.instrumentation.tracing import TRACER
+from src.pytest_plugins.xdist_utils import get_worker_id, is_xdist_worker
 from src.selenium_facade.driver_facade import DriverFacade
 from src.utils import load_dotenv_if_running_locally
+from tests.predefined_steps.auth import close_api_login
+
+pytest_plugins = [
+    "src.pytest_plugins.webdriver_commands",
+    "src.pytest_plugins.timeline",
+    "src.pytest_plugins.duration_scheduling",
+    "src.pytest_plugins.retries",
+    "src.pytest_plugins.result_journal",
+]
 
 
 def _create_folder(path: str):
@@ -30,15 +45,26 @@ def _create_screenshot_folder():
     _create_folder(str(path))
 
 
-def pytest_sessionstart():
+def pytest_sessionstart(session: pytest.Session):
     """*Not a fixture, but extension of pytest's hook*
 
     * If pytest is running on **local machine**: Loads data from ``.env``
     * Deletes all report filed from ``testrail-report-output`` dir
-    * Creates ``screenshots`` dir
+    * Creates ``screenshots`` dir. Only done by the pytest-xdist controller, so a worker cannot delete the
+      artifacts another worker has already written - each worker writes into its own sub-dir
     """
     load_dotenv_if_running_locally()
-    _create_screenshot_folder()
+    if not is_xdist_worker(session.config):
+        _create_screenshot_folder()
+
+
+def pytest_sessionfinish():
+    """*Not a fixture, but extension of pytest's hook*
+
+    Waits for the failure artifacts to be written to disk and closes the connections of the API login.
+    """
+    ARTIFACT_WRITER.flush()
+    close_api_login()
 
 
 @pytest.fixture
@@ -48,21 +74,6 @@ def _build_name() -> str:
     return f"{ci_cd_config.CI_COMMIT_BRANCH}_sha={ci_cd_config.CI_COMMIT_SHA[:8]}_pipeline={ci_cd_config.CI_PIPELINE_ID}"
 
 
-def pytest_runtest_call(item):
-    """*Not a fixture, but extension of pytest's hook*
-
-    Adds ``retry`` decorator to each testcase.
-
-    Does **not** add ``retry`` decorator if pytest is running on **local machine**.
-    """
-    selenium_config = get_selenium_config()
-    if selenium_config.RETRY_NUMBER and selenium_config.SELENIUM_PROVIDER != "local":
-        testfunction = item.obj
-        # Add retry decorator for each test:
-        item.obj = retry(tries=selenium_config.RETRY_NUMBER, delay=selenium_config.DELAY_BETWEEN_RETRIES_S)(
-            testfunction)
-
-
 @pytest.fixture
 def gen_unique_name(_build_name) -> Callable[[str], str]:
     """Generates a unique resource name according with the test run config.
@@ -140,59 +151,160 @@ def pytest_runtest_makereport(item, call):  # NOQA
     setattr(item, "rep_" + rep.when, rep)
 
 
-@pytest.fixture
-def _driver_factory() -> DriverFactoryBase:
+def _quit_driver(driver_to_quit: Remote):
+    driver_to_quit.close()
+    # Safari when running locally doesn't need `quit` call:
+    selenium_config = get_selenium_config()
+    if selenium_config.SELENIUM_PROVIDER == "local" and driver_to_quit.name == "Safari":
+        return
+    driver_to_quit.quit()
+
+
+@pytest.fixture(scope="session")
+def _driver_factory() -> Generator[DriverFactoryBase, None, None]:
     """Depending on ``SELENIUM_PROVIDER`` env var decides which driver factory to use
 
+    When ``DRIVER_PREFETCH_DEPTH`` is set, the factory is wrapped to boot the next sessions in background. The
+    prefetched sessions nobody took are quit at the end of the session.
+
     Returns: DriverFactoryBase
     """
     selenium_config = get_selenium_config()
-    return DRIVER_FACTORY_MAP[selenium_config.SELENIUM_PROVIDER]()
+    driver_factory = DRIVER_FACTORY_MAP[selenium_config.SELENIUM_PROVIDER]()
+    if not selenium_config.DRIVER_PREFETCH_DEPTH:
+        yield driver_factory
+        return
+
+    prefetching_factory = PrefetchingDriverFactory(
+        driver_factory=driver_factory, quit_driver=_quit_driver, depth=selenium_config.DRIVER_PREFETCH_DEPTH
+    )
+    yield prefetching_factory
+    prefetching_factory.shutdown()
+
+
+@pytest.fixture(scope="session")
+def _driver_pool(_driver_factory: DriverFactoryBase) -> Generator[Optional[DriverPool], None, None]:
+    """Pool of live ``WebDriver`` sessions shared by the tests of one pytest worker.
+
+    Yields ``None`` when ``DRIVER_POOL_SIZE`` is ``0`` - pooling is disabled.
+    """
+    selenium_config = get_selenium_config()
+    if not selenium_config.DRIVER_POOL_SIZE:
+        yield None
+        return
+
+    pool = DriverPool(
+        driver_factory=_driver_factory,
+        quit_driver=_quit_driver,
+        size=selenium_config.DRIVER_POOL_SIZE,
+        max_tests_per_session=selenium_config.DRIVER_POOL_MAX_TESTS_PER_SESSION,
+    )
+    yield pool
+    pool.shutdown()
 
 
 # Params because can't use fixture here
 @pytest.fixture(params=DRIVER_FACTORY_MAP[get_selenium_config().SELENIUM_PROVIDER].parametrization_factors)
-def driver(request: SubRequest, _build_name, _driver_factory: DriverFactoryBase) -> Generator[Remote, None, None]:
+def driver(
+    request: SubRequest, _build_name, _driver_factory: DriverFactoryBase, _driver_pool: Optional[DriverPool]
+) -> Generator[Remote, None, None]:
     """
     Gives you instance of Selenium ``WebDriver`` to use in the tests.
 
     Handles ``WebDriver``-related things:
 
     * Parametrizes tests for different browsers - see ``params`` parameter in ``pytest.fixture`` decorator above
-    * Initializes ``WebDriver``
+    * Initializes ``WebDriver`` - or takes a live one from the pool, see ``DRIVER_POOL_SIZE``
     * Yields ``WebDriver`` to be used further
     * Does TearDown for ``WebDriver`` - sends results to Remote Driver provider (success/failure), closes connection to
     ``WebDriver``
+    * Sets ``request.node.replace_driver`` - swaps a broken session for a fresh one, see
+      :mod:`src.pytest_plugins.retries`
     """
+
+    def _create() -> Remote:
+        with TRACER.span("create driver", category="driver"):
+            if _driver_pool is not None:
+                created_driver: Remote = _driver_pool.acquire(
+                    parametrization_factor=request.param, test_name=request.node.name, build_name=_build_name
+                )
+            else:
+                created_driver = _driver_factory.create_driver(
+                    parametrization_factor=request.param, test_name=request.node.name, build_name=_build_name
+                )
+        # Set the driver meta to make it available in other fixtures:
+        setattr(request.node, "driver_meta", _driver_factory.get_driver_meta(created_driver))
+        if not uses_fixed_window_size(request.param):
+            created_driver.maximize_window()
+        return created_driver
+
+    def _replace(broken_driver: Remote) -> Remote:
+        """Swaps the broken session for a fresh one, used by the infrastructure retries."""
+        with TRACER.span("release driver", category="driver"):
+            if _driver_pool is not None:
+                _driver_pool.release(broken_driver, failed=True)
+            else:
+                with contextlib.suppress(WebDriverException):
+                    _quit_driver(broken_driver)
+        request.node.driver = _create()
+        return request.node.driver
+
     # This is done before each test case:
-    driver_to_yield: Remote = _driver_factory.create_driver(
-        parametrization_factor=request.param, test_name=request.node.name, build_name=_build_name
-    )
-    # Set the driver meta to make it available in other fixtures:
-    setattr(request.node, "driver_meta", _driver_factory.get_driver_meta(driver_to_yield))
-    driver_to_yield.maximize_window()
+    request.node.driver = _create()
+    request.node.replace_driver = _replace
 
     # Here the driver is passed to the test case:
-    yield driver_to_yield
+    yield request.node.driver
 
     # After each test case (no matter failure or success), this code is executed:
-    if request.node.rep_setup.failed or request.node.rep_call.failed:
-        driver_facade = DriverFacade(driver_to_yield)
-        try:
-            driver_facade.screenshot(filename=request.node.name, extra_path=SCREENSHOTS_FAILURES_FOLDER)
-        except InvalidSessionIdException:
-            logger.exception("Cannot take a screenshot")
-
-        _driver_factory.on_test_failure(driver_to_yield, "Test setup failed, see pytest logs in gitlab")
+    driver_to_release: Remote = request.node.driver
+    test_failed = request.node.rep_setup.failed or request.node.rep_call.failed
+    if test_failed:
+        # Screenshot, DOM and console logs are collected within a time budget and written to disk in background
+        with TRACER.span("failure artifacts", category="driver"):
+            artifacts = collect_failure_artifacts(driver_to_release)
+        ARTIFACT_WRITER.submit(
+            Path(SCREENSHOTS_FOLDER, SCREENSHOTS_FAILURES_FOLDER, get_worker_id(), request.node.name.replace("/", "-")),
+            artifacts,
+        )
+
+        _driver_factory.on_test_failure(driver_to_release, "Test setup failed, see pytest logs in gitlab")
     elif request.node.rep_setup.passed:
-        _driver_factory.on_test_success(driver_to_yield)
+        _driver_factory.on_test_success(driver_to_release)
 
-    driver_to_yield.close()
-    # Safari when running locally doesn't need `quit` call:
+    with TRACER.span("release driver", category="driver"):
+        if _driver_pool is not None:
+            # The pool resets the session state, or recycles the session if the test failed
+            _driver_pool.release(driver_to_release, failed=test_failed)
+            return
+        _quit_driver(driver_to_release)
+
+
+@pytest.fixture
+def data_seeder(request: SubRequest, driver: Remote) -> Generator[DataSeeder, None, None]:
+    """Creates the preconditions of the test through the app API, as the user logged in the ``driver``.
+
+    Everything the seeder created is deleted at once after the test. The token is read from
+    ``request.node.driver``, so the seeder follows the driver when an infrastructure retry replaced it. Dummy example
+    of usage:
+
+    .. code-block:: python
+
+       def test_example_of_data_seeder_fixture(driver, data_seeder):
+           log_the_user_in_with_storage_state(driver=driver, username=..., password=...)
+           groups = data_seeder.create_many("groups", lambda fake: {"name": fake.catch_phrase()}, count=5)
+    """
     selenium_config = get_selenium_config()
-    if selenium_config.SELENIUM_PROVIDER == "local" and driver_to_yield.name == "Safari":
-        return
-    driver_to_yield.quit()
+    app_url = selenium_config.APP_URL if selenium_config.APP_URL else selenium_config.LOCAL_URL
+    seeder = DataSeeder(
+        base_url=selenium_config.SEEDING_API_URL or f"{app_url.rstrip('/')}/api/",
+        token_provider=lambda: DriverFacade(request.node.driver).get_auth_token(),
+        max_concurrency=selenium_config.SEEDING_MAX_CONCURRENCY,
+    )
+    yield seeder
+    with TRACER.span("data cleanup", category="data"):
+        seeder.cleanup()
+    seeder.close()
 
 
 @pytest.fixture()
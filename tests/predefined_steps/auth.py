@@ -1,34 +1,107 @@
+from functools import lru_cache
 from typing import Optional
 
-from retry import retry
-from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver import Remote
 
+from src.auth.api_login import ApiLogin
+from src.auth.storage_state import STORAGE_STATE_CACHE, storage_state_key
 from src.config import get_selenium_config
+from src.instrumentation.tracing import traced
 from src.web_abstractions.views.auth import SignInView
 
 
-@retry(exceptions=(TimeoutException, WebDriverException), tries=4, delay=1, backoff=2)
+@traced(category="login")
 def log_the_user_in_steps(
         driver: Remote,
         username: str,
         password: str,
         url: Optional[str] = None,
+        wait_for_idle: bool = False,
 ):
+    """Log the user in by filling the login form.
+
+    Args:
+        wait_for_idle: whether to also wait for the network of the page after the login to be idle. Pages which poll
+            or keep a request open never are, so the wait would time out.
+    """
     config = get_selenium_config()
     mahara_demo_url = config.APP_URL if config.APP_URL else config.LOCAL_URL
     target_url = url or mahara_demo_url
+    sign_in_form = SignInView(driver)
 
     # NOTE: TestRail test steps can be added before every test steps if TestRail is configured properly.
-    def _():
-        driver.get(target_url)
-
-    sign_in_form = SignInView(driver)
+    sign_in_form.driver_facade.install_activity_tracker()
+    driver.get(target_url)
+    # The login form is ready to be filled once the page stops rendering
+    sign_in_form.driver_facade.wait_for_dom_quiescent()
 
     # NOTE: TestRail test steps can be added before every test steps if TestRail is configured properly.
-    def _():
-        sign_in_form.fill_username_and_password(username=username, password=password)
+    sign_in_form.fill_username_and_password(username=username, password=password)
 
     # NOTE: TestRail test steps can be added before every test steps if TestRail is configured properly.
-    def _():
-        sign_in_form.login_button_click()
+    sign_in_form.login_button_click()
+    if wait_for_idle:
+        sign_in_form.driver_facade.wait_for_network_idle()
+
+
+def log_the_user_in_with_storage_state(
+        driver: Remote,
+        username: str,
+        password: str,
+        url: Optional[str] = None,
+):
+    """Log the user in reusing the cookies and ``localStorage`` of a previous login of the same user.
+
+    Only the first test of the worker (or of the run, see ``AUTH_STORAGE_STATE_SCOPE``) fills the login form with
+    :func:`log_the_user_in_steps`, and so does any test running after the cached token expired.
+    Use :func:`log_the_user_in_steps` in the tests of the login form itself.
+    """
+    config = get_selenium_config()
+    if config.AUTH_STORAGE_STATE_SCOPE == "off":
+        log_the_user_in_steps(driver=driver, username=username, password=password, url=url)
+        return
+
+    STORAGE_STATE_CACHE.restore_or_log_in(
+        driver=driver,
+        key=storage_state_key(config.ENVIRONMENT, username),
+        url=url or (config.APP_URL if config.APP_URL else config.LOCAL_URL),
+        log_in=lambda: log_the_user_in_steps(driver=driver, username=username, password=password, url=url),
+        scope=config.AUTH_STORAGE_STATE_SCOPE,
+    )
+
+
+@lru_cache
+def _get_api_login() -> ApiLogin:
+    config = get_selenium_config()
+    if not config.AUTH_TOKEN_URL:
+        raise ValueError("AUTH_TOKEN_URL must be set to log the user in through the API")
+    return ApiLogin(
+        token_url=config.AUTH_TOKEN_URL, client_id=config.AUTH_CLIENT_ID, client_secret=config.AUTH_CLIENT_SECRET
+    )
+
+
+def close_api_login():
+    """Close the pooled HTTP connections of the API login, if it was used."""
+    if _get_api_login.cache_info().currsize:
+        _get_api_login().close()
+        _get_api_login.cache_clear()
+
+
+@traced(category="login")
+def log_the_user_in_via_api(
+        driver: Remote,
+        username: str,
+        password: str,
+        url: Optional[str] = None,
+):
+    """Log the user in without the browser form: the token is requested over HTTP and set as a cookie.
+
+    Needs ``AUTH_TOKEN_URL``. Use it in the tests which are not about the login.
+    """
+    config = get_selenium_config()
+    _get_api_login().log_in(
+        driver=driver,
+        username=username,
+        password=password,
+        url=url or (config.APP_URL if config.APP_URL else config.LOCAL_URL),
+    )
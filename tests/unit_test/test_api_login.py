@@ -0,0 +1,106 @@
+import json
+from urllib.parse import parse_qs, unquote
+
+import httpx
+import pytest
+
+from src.auth.api_login import ApiLogin
+from src.constants import AUTH_TOKEN_COOKIE
+from src.exceptions import AuthenticationError
+
+TOKEN_URL = "https://sso.test/realms/app/protocol/openid-connect/token"
+ORIGIN = "https://app.test"
+
+
+class StubTokenEndpoint:
+    """In-process stub of the OAuth2 token endpoint."""
+
+    def __init__(self, status_code: int = 200, body: dict = None):
+        self.status_code = status_code
+        self.body = {"access_token": "access", "expires_in": 300} if body is None else body
+        self.forms: list[dict[str, list[str]]] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.forms.append(parse_qs(request.content.decode()))
+        return httpx.Response(self.status_code, json=self.body)
+
+
+class FakeDriver:
+    """Driver without CDP, cookies are added to the current page."""
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.cookies: dict[str, dict] = {}
+
+    def get(self, url: str):
+        self.current_url = url
+
+    def add_cookie(self, cookie: dict):
+        self.cookies[cookie["name"]] = cookie
+
+    def get_cookie(self, name: str):
+        return self.cookies.get(name)
+
+    def execute_script(self, script: str, *args):
+        return None
+
+
+def _api_login(endpoint: StubTokenEndpoint, client_secret: str = None) -> ApiLogin:
+    return ApiLogin(
+        token_url=TOKEN_URL,
+        client_id="webapp",
+        client_secret=client_secret,
+        client=httpx.Client(transport=httpx.MockTransport(endpoint.handle)),
+    )
+
+
+def test_get_token_uses_the_password_grant():
+    endpoint = StubTokenEndpoint()
+    api_login = _api_login(endpoint, client_secret="secret")
+
+    assert api_login.get_token(username="user", password="pass")["access_token"] == "access"
+    assert endpoint.forms == [
+        {
+            "grant_type": ["password"],
+            "client_id": ["webapp"],
+            "username": ["user"],
+            "password": ["pass"],
+            "client_secret": ["secret"],
+        }
+    ]
+    api_login.close()
+
+
+@pytest.mark.parametrize(
+    "endpoint", [StubTokenEndpoint(status_code=401, body={"error": "invalid_grant"}), StubTokenEndpoint(body={})]
+)
+def test_get_token_failure_raises(endpoint):
+    api_login = _api_login(endpoint)
+    with pytest.raises(AuthenticationError):
+        api_login.get_token(username="user", password="wrong")
+    api_login.close()
+
+
+def test_storage_state_is_cached_until_it_expires():
+    endpoint = StubTokenEndpoint()
+    api_login = _api_login(endpoint)
+
+    first_state = api_login.get_storage_state(username="user", password="pass", origin=ORIGIN)
+    assert api_login.get_storage_state(username="user", password="pass", origin=ORIGIN) is first_state
+    assert len(endpoint.forms) == 1
+
+    first_state.expires_at = 0
+    api_login.get_storage_state(username="user", password="pass", origin=ORIGIN)
+    assert len(endpoint.forms) == 2
+    api_login.close()
+
+
+def test_log_in_sets_the_token_cookie():
+    api_login = _api_login(StubTokenEndpoint())
+    driver = FakeDriver()
+
+    api_login.log_in(driver, username="user", password="pass", url=f"{ORIGIN}/dashboard")
+
+    assert driver.current_url == f"{ORIGIN}/dashboard"
+    assert json.loads(unquote(driver.get_cookie(AUTH_TOKEN_COOKIE)["value"]))["access_token"] == "access"
+    api_login.close()
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.data_seeding.seeder import DataSeeder
+from src.exceptions import AuthenticationError
+
+BASE_URL = "https://app.test/api/"
+
+
+class StubApi:
+    """In-process stub of the app API, counts the requests in flight."""
+
+    def __init__(self, fail_payloads: tuple[str, ...] = ()):
+        self.fail_payloads = fail_payloads
+        self.next_id = 1
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.deleted: list[str] = []
+        self.tokens: set[str] = set()
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.tokens.add(request.headers["Authorization"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if request.method == "DELETE":
+            self.deleted.append(request.url.path)
+            return httpx.Response(204)
+        payload = json.loads(request.content)
+        if payload["name"] in self.fail_payloads:
+            return httpx.Response(500)
+        resource_id, self.next_id = self.next_id, self.next_id + 1
+        return httpx.Response(201, json={"id": resource_id, **payload})
+
+
+@pytest.fixture
+def stub_api() -> StubApi:
+    return StubApi()
+
+
+def _seeder(stub_api: StubApi, token_provider=lambda: "token", max_concurrency: int = 3) -> DataSeeder:
+    return DataSeeder(
+        base_url=BASE_URL,
+        token_provider=token_provider,
+        max_concurrency=max_concurrency,
+        transport=httpx.MockTransport(stub_api.handle),
+    )
+
+
+def test_create_many_is_bounded_by_max_concurrency(stub_api):
+    seeder = _seeder(stub_api, max_concurrency=3)
+    resources = seeder.create_many("groups", lambda fake: {"name": fake.catch_phrase()}, count=12)
+    seeder.close()
+
+    assert len(resources) == 12
+    assert len({resource.id for resource in resources}) == 12
+    assert stub_api.max_in_flight == 3
+
+
+def test_token_is_read_once_per_batch(stub_api):
+    token_reads = []
+
+    def token_provider() -> str:
+        token_reads.append(1)
+        return "token"
+
+    seeder = _seeder(stub_api, token_provider=token_provider)
+    seeder.create_many("groups", lambda fake: {"name": fake.catch_phrase()}, count=6)
+    seeder.cleanup()
+    seeder.close()
+
+    assert len(token_reads) == 2
+    assert stub_api.tokens == {"Bearer token"}
+
+
+def test_no_token_raises(stub_api):
+    seeder = _seeder(stub_api, token_provider=lambda: "")
+    with pytest.raises(AuthenticationError):
+        seeder.create("groups", {"name": "group"})
+    seeder.close()
+
+
+def test_cleanup_deletes_all_tracked_resources(stub_api):
+    seeder = _seeder(stub_api)
+    seeder.create("users", {"name": "user"})
+    seeder.create_many("groups/", lambda fake: {"name": fake.catch_phrase()}, count=4)
+    seeder.cleanup()
+    seeder.close()
+
+    assert sorted(stub_api.deleted) == [
+        "/api/groups/2", "/api/groups/3", "/api/groups/4", "/api/groups/5", "/api/users/1"
+    ]
+    assert seeder.resources == []
+
+
+def test_resources_are_tracked_per_seeder(stub_api):
+    first_test_seeder = _seeder(stub_api)
+    second_test_seeder = _seeder(stub_api)
+    first_test_seeder.create("groups", {"name": "first"})
+    second_test_seeder.create("groups", {"name": "second"})
+    first_test_seeder.cleanup()
+
+    assert stub_api.deleted == ["/api/groups/1"]
+    assert [resource.data["name"] for resource in second_test_seeder.resources] == ["second"]
+    first_test_seeder.close()
+    second_test_seeder.close()
+
+
+def test_failed_create_many_tracks_the_created_resources():
+    stub_api = StubApi(fail_payloads=("broken",))
+    seeder = _seeder(stub_api)
+    names = iter(["ok", "broken", "ok", "ok"])
+    with pytest.raises(httpx.HTTPStatusError):
+        seeder.create_many("groups", lambda fake: {"name": next(names)}, count=4)
+    seeder.cleanup()
+    seeder.close()
+
+    assert len(stub_api.deleted) == 3
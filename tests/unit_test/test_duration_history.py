@@ -0,0 +1,99 @@
+import pytest
+
+from src.pytest_plugins.duration_history import DurationHistory, plan_shards
+
+
+def _shard_totals(estimates: list[float], shards: list[int], shard_count: int) -> list[float]:
+    totals = [0.0] * shard_count
+    for estimate, shard in zip(estimates, shards):
+        totals[shard] += estimate
+    return totals
+
+
+@pytest.mark.parametrize("shard_count", [1, 2, 3, 7])
+def test_every_test_is_in_exactly_one_shard(shard_count):
+    estimates = [3.0, 12.5, 0.4, 7.0, 7.0, 1.2, 30.0, 0.0, 5.5, 2.0]
+    shards = plan_shards(estimates, shard_count)
+
+    # One shard index per test, so the shards are disjoint and cover all the tests
+    assert len(shards) == len(estimates)
+    assert all(0 <= shard < shard_count for shard in shards)
+
+
+def test_single_shard_takes_every_test():
+    assert plan_shards([4.0, 1.0, 9.0], 1) == [0, 0, 0]
+
+
+def test_shards_are_balanced():
+    estimates = [8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0]
+    shards = plan_shards(estimates, 2)
+
+    assert _shard_totals(estimates, shards, 2) == [18.0, 18.0]
+
+
+def test_slowest_test_is_not_grouped_with_the_others():
+    estimates = [1.0, 1.0, 10.0, 1.0, 1.0]
+    shards = plan_shards(estimates, 2)
+
+    assert [shard for index, shard in enumerate(shards) if index != 2] == [1, 1, 1, 1]
+    assert shards[2] == 0
+
+
+def test_tests_without_history_are_spread_by_count():
+    shards = plan_shards([0.0] * 7, 3)
+
+    assert sorted(shards.count(shard) for shard in range(3)) == [2, 2, 3]
+
+
+def test_plan_is_deterministic():
+    estimates = [2.0, 2.0, 2.0, 5.0, 0.0, 0.0, 3.0, 3.0]
+
+    assert plan_shards(estimates, 3) == plan_shards(list(estimates), 3) == [1, 2, 0, 0, 1, 2, 1, 2]
+
+
+def test_more_shards_than_tests_leaves_shards_empty():
+    assert plan_shards([1.0, 2.0], 4) == [1, 0]
+
+
+def test_no_tests():
+    assert plan_shards([], 3) == []
+
+
+def _history(tmp_path, durations: dict[str, float]) -> DurationHistory:
+    history = DurationHistory(tmp_path / "durations.json")
+    history.record(durations)
+    return history
+
+
+def test_estimate_uses_the_recorded_duration(tmp_path):
+    history = _history(tmp_path, {"test_a.py::test_a[chrome]": 4.0, "test_b.py::test_b[chrome]": 9.0})
+
+    assert history.estimate(["test_b.py::test_b[chrome]", "test_a.py::test_a[chrome]"]) == [9.0, 4.0]
+
+
+def test_unknown_parametrization_gets_the_mean_of_the_other_ones(tmp_path):
+    history = _history(
+        tmp_path,
+        {"test_a.py::test_a[chrome]": 4.0, "test_a.py::test_a[firefox]": 8.0, "test_b.py::test_b[chrome]": 100.0},
+    )
+
+    assert history.estimate(["test_a.py::test_a[edge]"]) == [6.0]
+
+
+def test_unknown_test_gets_the_median_of_the_known_ones(tmp_path):
+    history = _history(tmp_path, {"test_a.py::test_a": 1.0, "test_b.py::test_b": 3.0, "test_c.py::test_c": 50.0})
+
+    assert history.estimate(["test_new.py::test_new[chrome]"]) == [3.0]
+
+
+def test_without_history_every_estimate_is_zero(tmp_path):
+    history = DurationHistory(tmp_path / "missing.json")
+
+    assert history.estimate(["test_a.py::test_a", "test_b.py::test_b"]) == [0.0, 0.0]
+
+
+def test_recorded_durations_are_smoothed(tmp_path):
+    history = _history(tmp_path, {"test_a.py::test_a": 10.0})
+    history.record({"test_a.py::test_a": 20.0})
+
+    assert DurationHistory(history.path).durations == {"test_a.py::test_a": 15.0}
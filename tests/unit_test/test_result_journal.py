@@ -0,0 +1,75 @@
+from pathlib import Path
+
+from src.report import models
+from src.report.journal import ResultJournal, merge_journals, read_journal
+from src.report.models import CaseModel
+
+
+def _case(
+    case_id: int, parameter_title: str = "chrome", status: models.TestRailStatus = models.TestRailStatus.passed
+) -> CaseModel:
+    return CaseModel(
+        case_id=case_id,
+        title=f"test_case_{case_id}",
+        parameter_title=parameter_title,
+        test_result=models.TestRailTestResultModel(
+            status_id=status, test_id=None, elapsed="3s", comment="", custom_step_results=[]
+        ),
+    )
+
+
+def _write_journal(path: Path, cases: list[CaseModel]) -> Path:
+    journal = ResultJournal(path, fsync_every=2)
+    for case in cases:
+        journal.append(case)
+    journal.close()
+    return path
+
+
+def test_appended_results_are_read_back(tmp_path):
+    cases = [_case(1), _case(2, status=models.TestRailStatus.failed), _case(3, parameter_title="firefox")]
+    path = _write_journal(tmp_path / "journal" / "gw0.jsonl", cases)
+
+    assert list(read_journal(path)) == cases
+
+
+def test_reopened_journal_appends(tmp_path):
+    path = _write_journal(tmp_path / "gw0.jsonl", [_case(1)])
+    _write_journal(path, [_case(2)])
+
+    assert [case.case_id for case in read_journal(path)] == [1, 2]
+
+
+def test_cut_and_corrupted_lines_are_skipped(tmp_path):
+    path = _write_journal(tmp_path / "gw0.jsonl", [_case(1), _case(2)])
+    # A worker killed in the middle of a write leaves a cut last line
+    with open(path, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"not": "a case"}\n')
+        journal_file.write(_case(3).json()[:25])
+
+    assert [case.case_id for case in read_journal(path)] == [1, 2]
+
+
+def test_blank_lines_are_ignored(tmp_path):
+    path = tmp_path / "gw0.jsonl"
+    path.write_text(f"\n{_case(1).json()}\n  \n{_case(2).json()}\n\n", encoding="utf-8")
+
+    assert [case.case_id for case in read_journal(path)] == [1, 2]
+
+
+def test_merge_groups_the_results_by_case(tmp_path):
+    first = _write_journal(tmp_path / "gw0.jsonl", [_case(1, "chrome"), _case(2, "chrome")])
+    second = _write_journal(tmp_path / "gw1.jsonl", [_case(1, "firefox"), _case(3, "firefox")])
+    crashed = tmp_path / "gw2.jsonl"
+    crashed.write_text(f"{_case(2, 'firefox').json()}\n{_case(4).json()[:10]}", encoding="utf-8")
+
+    report = merge_journals([first, second, crashed])
+
+    assert sorted(report) == [1, 2, 3]
+    assert [case.parameter_title for case in report[1]] == ["chrome", "firefox"]
+    assert [case.parameter_title for case in report[2]] == ["chrome", "firefox"]
+    assert [case.parameter_title for case in report[3]] == ["firefox"]
+
+
+def test_merge_of_no_journals_is_empty():
+    assert merge_journals([]) == {}
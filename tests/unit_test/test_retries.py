@@ -0,0 +1,106 @@
+import tempfile
+
+import pytest
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchElementException,
+    SessionNotCreatedException,
+    TimeoutException,
+    WebDriverException,
+)
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+from src.pytest_plugins.retries import RetryBudget, classify_failure
+
+# Raises from a frame looking like ``WebDriver.get`` of Selenium
+NAVIGATION_SOURCE = "def get(url):\n    raise TimeoutException('timeout: Timed out receiving message from renderer')\n"
+
+
+def _navigation_timeout() -> TimeoutException:
+    namespace = {"TimeoutException": TimeoutException}
+    exec(compile(NAVIGATION_SOURCE, "/site-packages/selenium/webdriver/remote/webdriver.py", "exec"), namespace)
+    try:
+        namespace["get"]("https://app.test")
+    except TimeoutException as e:
+        return e
+    raise AssertionError("The navigation did not raise")
+
+
+def _chained(cause: BaseException, error: BaseException) -> BaseException:
+    try:
+        try:
+            raise cause
+        except BaseException:
+            raise error
+    except BaseException as e:
+        return e
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        InvalidSessionIdException("invalid session id"),
+        SessionNotCreatedException("could not start a new session"),
+        ProtocolError("Connection aborted."),
+        MaxRetryError(None, "/session/1/url"),
+        WebDriverException("unknown error: session deleted because of page crash"),
+        WebDriverException("chrome not reachable"),
+        WebDriverException("Browsing context has been discarded"),
+        _chained(InvalidSessionIdException("invalid session id"), AssertionError("the element is not visible")),
+    ],
+)
+def test_infrastructure_failures(exception):
+    assert classify_failure(exception) == "infrastructure"
+
+
+def test_navigation_timeout_is_infrastructure():
+    assert classify_failure(_navigation_timeout()) == "infrastructure"
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        AssertionError("wrong title"),
+        NoSuchElementException("no such element"),
+        TimeoutException("element //button is not present"),
+        # Wait timeouts mentioning infrastructure words are still product failures
+        TimeoutException("toast `session deleted` is still present"),
+        WebDriverException("element click intercepted"),
+        _chained(ValueError("bad value"), AssertionError("wrong title")),
+    ],
+)
+def test_product_failures(exception):
+    assert classify_failure(exception) == "product"
+
+
+@pytest.fixture
+def isolated_tempdir(monkeypatch, tmp_path):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+
+def test_budget_in_memory_without_xdist(monkeypatch, isolated_tempdir):
+    monkeypatch.delenv("PYTEST_XDIST_TESTRUNUID", raising=False)
+    budget = RetryBudget(budget_s=10)
+
+    assert budget.try_spend(6)
+    assert not budget.try_spend(5)
+    assert budget.try_spend(4)
+    assert not budget.try_spend(0.1)
+
+
+def test_budget_is_shared_by_the_workers_of_a_run(monkeypatch, isolated_tempdir):
+    monkeypatch.setenv("PYTEST_XDIST_TESTRUNUID", "run-1")
+    first_worker, second_worker = RetryBudget(budget_s=10), RetryBudget(budget_s=10)
+
+    assert first_worker.try_spend(6)
+    assert not second_worker.try_spend(5)
+    assert second_worker.try_spend(4)
+    assert not first_worker.try_spend(1)
+
+
+def test_budget_is_reset_for_a_new_run(monkeypatch, isolated_tempdir):
+    monkeypatch.setenv("PYTEST_XDIST_TESTRUNUID", "run-1")
+    assert RetryBudget(budget_s=10).try_spend(10)
+
+    monkeypatch.setenv("PYTEST_XDIST_TESTRUNUID", "run-2")
+    assert RetryBudget(budget_s=10).try_spend(10)
@@ -0,0 +1,101 @@
+from src.pytest_plugins.duration_history import DurationHistory
+from src.pytest_plugins.schedulers import LongestFirstScheduling
+
+TESTS = ["test_a.py::test_a", "test_b.py::test_b", "test_c.py::test_c", "test_d.py::test_d", "test_e.py::test_e"]
+DURATIONS = {
+    "test_a.py::test_a": 1.0,
+    "test_b.py::test_b": 5.0,
+    "test_c.py::test_c": 2.0,
+    "test_d.py::test_d": 4.0,
+    "test_e.py::test_e": 3.0,
+}
+
+
+class _Config:
+    def __init__(self, worker_count: int):
+        self.worker_count = worker_count
+
+    def getvalue(self, name: str):
+        assert name == "tx"
+        return [f"{self.worker_count}*popen"]
+
+    def getoption(self, name: str):
+        assert name == "maxschedchunk"
+        return None
+
+
+class _Node:
+    """Worker of the controller, records the tests sent to it."""
+
+    def __init__(self, gateway_id: str):
+        self.gateway = type("Gateway", (), {"id": gateway_id})()
+        self.shutting_down = False
+        self.sent: list[str] = []
+
+    def send_runtest_some(self, indices: list[int]):
+        self.sent.extend(TESTS[index] for index in indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def _scheduler(tmp_path, durations: dict[str, float], worker_count: int = 2):
+    history = DurationHistory(tmp_path / "durations.json")
+    history.durations = durations
+    scheduler = LongestFirstScheduling(_Config(worker_count), None, history=history)
+    nodes = [_Node(f"gw{index}") for index in range(worker_count)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, TESTS)
+    scheduler.schedule()
+    return scheduler, nodes
+
+
+def _finish(scheduler: LongestFirstScheduling, node: _Node, nodeid: str):
+    scheduler.mark_test_complete(node, TESTS.index(nodeid))
+
+
+def test_slowest_tests_start_first_on_different_workers(tmp_path):
+    scheduler, (gw0, gw1) = _scheduler(tmp_path, DURATIONS)
+
+    # Two tests queued per worker, round-robin in the longest first order
+    assert gw0.sent == ["test_b.py::test_b", "test_e.py::test_e"]
+    assert gw1.sent == ["test_d.py::test_d", "test_c.py::test_c"]
+    assert [TESTS[index] for index in scheduler.pending] == ["test_a.py::test_a"]
+
+
+def test_first_free_worker_takes_the_next_slowest_test(tmp_path):
+    scheduler, (gw0, gw1) = _scheduler(tmp_path, DURATIONS)
+
+    _finish(scheduler, gw1, "test_d.py::test_d")
+
+    assert gw1.sent[-1] == "test_a.py::test_a"
+    assert not scheduler.pending
+
+
+def test_workers_shut_down_once_nothing_is_pending(tmp_path):
+    scheduler, (gw0, gw1) = _scheduler(tmp_path, {})
+
+    _finish(scheduler, gw0, gw0.sent[0])
+    assert not gw0.shutting_down
+    _finish(scheduler, gw0, gw0.sent[1])
+    _finish(scheduler, gw0, gw0.sent[2])
+    assert gw0.shutting_down
+    assert not gw1.shutting_down
+
+
+def test_test_without_history_is_scheduled_by_the_median_duration(tmp_path):
+    durations = {"test_a.py::test_a": 1.0, "test_b.py::test_b": 5.0, "test_c.py::test_c": 3.0, "test_d.py::test_d": 6.0}
+    scheduler, (gw0,) = _scheduler(tmp_path, durations, worker_count=1)
+
+    # ``test_e`` is expected to take the median, 4 s
+    assert gw0.sent == ["test_d.py::test_d", "test_b.py::test_b"]
+    pending = [TESTS[index] for index in scheduler.pending]
+    assert pending == ["test_e.py::test_e", "test_c.py::test_c", "test_a.py::test_a"]
+
+
+def test_less_tests_than_queued_shuts_every_worker_down(tmp_path):
+    scheduler, nodes = _scheduler(tmp_path, {}, worker_count=3)
+
+    assert all(node.shutting_down for node in nodes)
+    assert sorted(nodeid for node in nodes for nodeid in node.sent) == TESTS